@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: app/api/grpc/protos/user.proto
+# Protobuf Python Version: 4.25.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1e\x61pp/api/grpc/protos/user.proto\x12\x04user\"F\n\x11\x43reateUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"1\n\x10ListUsersRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06offset\x18\x02 \x01(\x05\":\n\x12StreamUsersRequest\x12\x10\n\x08\x61\x66ter_id\x18\x01 \x01(\x05\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\"(\n\x14\x42\x61tchGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\x05\"b\n\x0cUserResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x10\n\x08username\x18\x03 \x01(\t\x12\x11\n\tis_active\x18\x04 \x01(\x08\x12\x12\n\ncreated_at\x18\x05 \x01(\t\"D\n\x10UserListResponse\x12!\n\x05users\x18\x01 \x03(\x0b\x32\x12.user.UserResponse\x12\r\n\x05total\x18\x02 \x01(\x05\"O\n\x15\x42\x61tchGetUsersResponse\x12!\n\x05users\x18\x01 \x03(\x0b\x32\x12.user.UserResponse\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\x05\x32\xc3\x02\n\x0bUserService\x12\x39\n\nCreateUser\x12\x17.user.CreateUserRequest\x1a\x12.user.UserResponse\x12\x33\n\x07GetUser\x12\x14.user.GetUserRequest\x1a\x12.user.UserResponse\x12;\n\tListUsers\x12\x16.user.ListUsersRequest\x1a\x16.user.UserListResponse\x12=\n\x0bStreamUsers\x12\x18.user.StreamUsersRequest\x1a\x12.user.UserResponse0\x01\x12H\n\rBatchGetUsers\x12\x1a.user.BatchGetUsersRequest\x1a\x1b.user.BatchGetUsersResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'app.api.grpc.protos.user_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_CREATEUSERREQUEST']._serialized_start=40
+  _globals['_CREATEUSERREQUEST']._serialized_end=110
+  _globals['_GETUSERREQUEST']._serialized_start=112
+  _globals['_GETUSERREQUEST']._serialized_end=145
+  _globals['_LISTUSERSREQUEST']._serialized_start=147
+  _globals['_LISTUSERSREQUEST']._serialized_end=196
+  _globals['_STREAMUSERSREQUEST']._serialized_start=198
+  _globals['_STREAMUSERSREQUEST']._serialized_end=256
+  _globals['_BATCHGETUSERSREQUEST']._serialized_start=258
+  _globals['_BATCHGETUSERSREQUEST']._serialized_end=298
+  _globals['_USERRESPONSE']._serialized_start=300
+  _globals['_USERRESPONSE']._serialized_end=398
+  _globals['_USERLISTRESPONSE']._serialized_start=400
+  _globals['_USERLISTRESPONSE']._serialized_end=468
+  _globals['_BATCHGETUSERSRESPONSE']._serialized_start=470
+  _globals['_BATCHGETUSERSRESPONSE']._serialized_end=549
+  _globals['_USERSERVICE']._serialized_start=552
+  _globals['_USERSERVICE']._serialized_end=875
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,198 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from app.api.grpc.protos import user_pb2 as app_dot_api_dot_grpc_dot_protos_dot_user__pb2
+
+
+class UserServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateUser = channel.unary_unary(
+                '/user.UserService/CreateUser',
+                request_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.CreateUserRequest.SerializeToString,
+                response_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.FromString,
+                )
+        self.GetUser = channel.unary_unary(
+                '/user.UserService/GetUser',
+                request_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.GetUserRequest.SerializeToString,
+                response_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.FromString,
+                )
+        self.ListUsers = channel.unary_unary(
+                '/user.UserService/ListUsers',
+                request_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.ListUsersRequest.SerializeToString,
+                response_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserListResponse.FromString,
+                )
+        self.StreamUsers = channel.unary_stream(
+                '/user.UserService/StreamUsers',
+                request_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.StreamUsersRequest.SerializeToString,
+                response_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.FromString,
+                )
+        self.BatchGetUsers = channel.unary_unary(
+                '/user.UserService/BatchGetUsers',
+                request_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.BatchGetUsersRequest.SerializeToString,
+                response_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.BatchGetUsersResponse.FromString,
+                )
+
+
+class UserServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def CreateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_UserServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateUser,
+                    request_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.CreateUserRequest.FromString,
+                    response_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.SerializeToString,
+            ),
+            'GetUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUser,
+                    request_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.GetUserRequest.FromString,
+                    response_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.SerializeToString,
+            ),
+            'ListUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListUsers,
+                    request_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.ListUsersRequest.FromString,
+                    response_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserListResponse.SerializeToString,
+            ),
+            'StreamUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamUsers,
+                    request_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.StreamUsersRequest.FromString,
+                    response_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.SerializeToString,
+            ),
+            'BatchGetUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetUsers,
+                    request_deserializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.BatchGetUsersRequest.FromString,
+                    response_serializer=app_dot_api_dot_grpc_dot_protos_dot_user__pb2.BatchGetUsersResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'user.UserService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class UserService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def CreateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/user.UserService/CreateUser',
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.CreateUserRequest.SerializeToString,
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/user.UserService/GetUser',
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.GetUserRequest.SerializeToString,
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ListUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/user.UserService/ListUsers',
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.ListUsersRequest.SerializeToString,
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserListResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/user.UserService/StreamUsers',
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.StreamUsersRequest.SerializeToString,
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.UserResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchGetUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/user.UserService/BatchGetUsers',
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.BatchGetUsersRequest.SerializeToString,
+            app_dot_api_dot_grpc_dot_protos_dot_user__pb2.BatchGetUsersResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
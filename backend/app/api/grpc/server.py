@@ -0,0 +1,52 @@
+"""grpc.aio server for the user service.
+
+Started by the FastAPI lifespan when GRPC_ENABLED is set, or on its own:
+
+    python -m app.api.grpc.server
+"""
+import asyncio
+import logging
+
+import grpc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.grpc.protos import user_pb2_grpc
+from app.api.grpc.services.user_service import UserServicer
+from app.cache import Cache, get_cache
+from app.config import get_settings
+from app.database import AsyncSessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+
+def create_server(
+    address: str,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    cache: Cache | None = None,
+) -> tuple[grpc.aio.Server, int]:
+    """Build a server listening on address; returns it with the bound port"""
+    server = grpc.aio.server()
+    user_pb2_grpc.add_UserServiceServicer_to_server(UserServicer(session_factory, cache), server)
+    port = server.add_insecure_port(address)
+    return server, port
+
+
+async def serve() -> None:
+    settings = get_settings()
+    server, port = create_server(f"[::]:{settings.GRPC_PORT}")
+    await server.start()
+    logger.info("gRPC server listening on port %d", port)
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(settings.GRPC_SHUTDOWN_GRACE_SECONDS)
+        await engine.dispose()
+        await get_cache().backend.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
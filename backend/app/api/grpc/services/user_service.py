@@ -1,79 +1,100 @@
 import grpc
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.api.grpc.protos import user_pb2, user_pb2_grpc
+from app.cache import Cache, get_cache
+from app.database import AsyncSessionLocal
+from app.schemas import UserCreate
 from app.services.user_service import UserService
-from app.database import get_db
-import hashlib
 
-class UserServicer:
-    """gRPC User Service implementation"""
-    
-    def __init__(self):
-        self.user_service = UserService()
-    
+# Upper bounds on what one call may ask for
+MAX_BATCH_GET = 1000
+MAX_STREAM_BATCH = 10000
+DEFAULT_STREAM_BATCH = 1000
+
+def user_response(user) -> user_pb2.UserResponse:
+    return user_pb2.UserResponse(
+        id=user.id,
+        email=user.email or "",
+        username=user.username or "",
+        is_active=bool(user.is_active),
+        created_at=user.created_at.isoformat() if user.created_at else "",
+    )
+
+class UserServicer(user_pb2_grpc.UserServiceServicer):
+    """gRPC User Service implementation; each call runs in its own session"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        cache: Cache | None = None,
+    ):
+        self.session_factory = session_factory
+        # Shared with the REST API, so a user created here evicts its cached 404
+        self.cache = cache if cache is not None else get_cache()
+
     async def CreateUser(self, request, context):
         """Create new user via gRPC"""
         try:
-            async for session in get_db():
-                hashed_password = hashlib.sha256(request.password.encode()).hexdigest()
-                user = await self.user_service.create_user(
-                    session=session,
-                    email=request.email,
-                    username=request.username,
-                    hashed_password=hashed_password
+            user_data = UserCreate(
+                email=request.email, username=request.username, password=request.password
+            )
+        except ValidationError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        async with self.session_factory() as session:
+            service = UserService(session, self.cache)
+            try:
+                user = await service.create_user(user_data)
+            except IntegrityError:
+                await context.abort(
+                    grpc.StatusCode.ALREADY_EXISTS, await service.duplicate_user_message(user_data)
                 )
-                
-                return {
-                    "id": user.id,
-                    "email": user.email,
-                    "username": user.username,
-                    "is_active": user.is_active,
-                    "created_at": user.created_at.isoformat()
-                }
-        except Exception as e:
-            context.abort(grpc.StatusCode.INTERNAL, str(e))
-    
+            return user_response(user)
+
     async def GetUser(self, request, context):
         """Get user by ID via gRPC"""
-        try:
-            async for session in get_db():
-                user = await self.user_service.get_user(session, request.user_id)
-                
-                if not user:
-                    context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
-                
-                return {
-                    "id": user.id,
-                    "email": user.email,
-                    "username": user.username,
-                    "is_active": user.is_active,
-                    "created_at": user.created_at.isoformat()
-                }
-        except Exception as e:
-            context.abort(grpc.StatusCode.INTERNAL, str(e))
-    
+        async with self.session_factory() as session:
+            user = await UserService(session).get_user(request.user_id)
+        if not user:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+        return user_response(user)
+
     async def ListUsers(self, request, context):
         """List users with pagination via gRPC"""
-        try:
-            async for session in get_db():
-                users = await self.user_service.list_users(
-                    session,
-                    limit=request.limit or 10,
-                    offset=request.offset or 0
-                )
-                
-                user_responses = [
-                    {
-                        "id": user.id,
-                        "email": user.email,
-                        "username": user.username,
-                        "is_active": user.is_active,
-                        "created_at": user.created_at.isoformat()
-                    }
-                    for user in users
-                ]
-                
-                return {
-                    "users": user_responses,
-                    "total": len(user_responses)
-                }
-        except Exception as e:
-            context.abort(grpc.StatusCode.INTERNAL, str(e))
\ No newline at end of file
+        async with self.session_factory() as session:
+            users = await UserService(session).list_users(
+                skip=request.offset, limit=request.limit or 10
+            )
+        return user_pb2.UserListResponse(
+            users=[user_response(user) for user in users], total=len(users)
+        )
+
+    async def StreamUsers(self, request, context):
+        """Stream every user in id order, read from a server-side cursor in batches"""
+        batch_size = request.batch_size or DEFAULT_STREAM_BATCH
+        if not 0 < batch_size <= MAX_STREAM_BATCH:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"batch_size must be between 1 and {MAX_STREAM_BATCH}",
+            )
+        async with self.session_factory() as session:
+            service = UserService(session)
+            async for rows in service.stream_users(request.after_id or None, batch_size):
+                for row in rows:
+                    yield user_response(row)
+
+    async def BatchGetUsers(self, request, context):
+        """Get many users by ID in one query"""
+        user_ids = list(dict.fromkeys(request.user_ids))
+        if len(user_ids) > MAX_BATCH_GET:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {MAX_BATCH_GET} user ids per call",
+            )
+        async with self.session_factory() as session:
+            users = {user.id: user for user in await UserService(session).get_users(user_ids)}
+        return user_pb2.BatchGetUsersResponse(
+            users=[user_response(users[user_id]) for user_id in user_ids if user_id in users],
+            missing_ids=[user_id for user_id in user_ids if user_id not in users],
+        )
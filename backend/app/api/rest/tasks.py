@@ -1,33 +1,170 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.websocket.tasks import get_task_events
+from app.cache import Cache, get_cache
+from app.config import get_settings
 from app.database import get_db
-from app.schemas import TaskCreate, TaskRead
-from app.services.task_service import TaskService
+from app.events import TaskEvents
+from app.schemas import TaskCreate, TaskFilters, TaskRead, TaskUpdate, TaskImportReport
+from app.services.task_service import TASK_SORTS, TaskService
+from app.services.export import ENCODERS, MEDIA_TYPES
+from app.services.task_import import RECORD_PARSERS, import_tasks, iter_lines
+from app.services.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    decode_keyset_cursor,
+    decode_rank_cursor,
+    next_cursor,
+    next_keyset_cursor,
+    next_rank_cursor,
+)
+from app.services.serialization import ListEncoder
 
 router = APIRouter()
 
+task_list_encoder = ListEncoder(TaskRead)
+
 @router.post("/", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
-async def create_task(task_data: TaskCreate, owner_id: int, db: AsyncSession = Depends(get_db)):
-    service = TaskService(db)
+async def create_task(
+    task_data: TaskCreate,
+    owner_id: int,
+    db: AsyncSession = Depends(get_db),
+    cache: Cache = Depends(get_cache),
+    events: TaskEvents = Depends(get_task_events),
+):
+    service = TaskService(db, cache, events)
     return await service.create_task(task_data, owner_id)
 
-@router.get("/{task_id}", response_model=TaskRead)
-async def get_task(task_id: int, db: AsyncSession = Depends(get_db)):
+@router.post("/bulk", response_model=list[TaskRead], status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    tasks_data: list[TaskCreate],
+    owner_id: int,
+    db: AsyncSession = Depends(get_db),
+    cache: Cache = Depends(get_cache),
+    events: TaskEvents = Depends(get_task_events),
+):
+    service = TaskService(db, cache, events)
+    return await service.create_tasks(
+        tasks_data, owner_id, chunk_size=get_settings().BULK_INSERT_CHUNK_SIZE
+    )
+
+@router.post("/import", response_model=TaskImportReport)
+async def import_tasks_upload(
+    owner_id: int,
+    request: Request,
+    import_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    cache: Cache = Depends(get_cache),
+    events: TaskEvents = Depends(get_task_events),
+):
+    settings = get_settings()
+    records = RECORD_PARSERS[import_format](iter_lines(request.stream()))
+    return await import_tasks(
+        TaskService(db, cache, events),
+        owner_id,
+        records,
+        batch_size=settings.IMPORT_BATCH_SIZE,
+        max_reported_rejections=settings.IMPORT_MAX_REPORTED_REJECTIONS,
+    )
+
+@router.get("/export")
+async def export_tasks(
+    owner_id: int,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    db: AsyncSession = Depends(get_db),
+):
+    service = TaskService(db)
+    return StreamingResponse(
+        ENCODERS[export_format](service.stream_tasks(owner_id)),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks-{owner_id}.{export_format}"'
+        },
+    )
+
+@router.get("/search", response_model=list[TaskRead])
+async def search_tasks(
+    owner_id: int,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        after = decode_rank_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     service = TaskService(db)
+    rows = await service.search_tasks(owner_id, q, limit, after=after)
+    cursor = next_rank_cursor(rows, limit)
+    return task_list_encoder.response(rows, {NEXT_CURSOR_HEADER: cursor} if cursor else None)
+
+@router.get("/{task_id}", response_model=TaskRead)
+async def get_task(
+    task_id: int, db: AsyncSession = Depends(get_db), cache: Cache = Depends(get_cache)
+):
+    service = TaskService(db, cache)
     task = await service.get_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 @router.get("/", response_model=list[TaskRead])
-async def list_tasks(owner_id: int, skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
+async def list_tasks(
+    owner_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    filters: TaskFilters = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    sort_column = TASK_SORTS[filters.sort][0].key
+    after_id = after_value = None
+    try:
+        if cursor and sort_column == "id":
+            after_id = decode_cursor(cursor, filters.sort)
+        elif cursor:
+            value, after_id = decode_keyset_cursor(cursor, filters.sort)
+            after_value = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     service = TaskService(db)
-    return await service.list_tasks(owner_id, skip, limit)
+    rows = await service.list_task_rows(
+        owner_id, skip, limit, after_id=after_id, filters=filters, after_value=after_value
+    )
+    if sort_column == "id":
+        cursor = next_cursor(rows, limit, filters.sort)
+    else:
+        cursor = next_keyset_cursor(rows, limit, filters.sort, sort_column)
+    return task_list_encoder.response(rows, {NEXT_CURSOR_HEADER: cursor} if cursor else None)
 
 @router.put("/{task_id}", response_model=TaskRead)
-async def update_task(task_id: int, task_data: TaskCreate, db: AsyncSession = Depends(get_db)):
-    service = TaskService(db)
+async def update_task(
+    task_id: int,
+    task_data: TaskCreate,
+    db: AsyncSession = Depends(get_db),
+    cache: Cache = Depends(get_cache),
+    events: TaskEvents = Depends(get_task_events),
+):
+    service = TaskService(db, cache, events)
     task = await service.update_task(task_id, task_data)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+@router.patch("/{task_id}", response_model=TaskRead)
+async def patch_task(
+    task_id: int,
+    changes: TaskUpdate,
+    db: AsyncSession = Depends(get_db),
+    cache: Cache = Depends(get_cache),
+    events: TaskEvents = Depends(get_task_events),
+):
+    service = TaskService(db, cache, events)
+    task = await service.patch_task(task_id, changes)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
\ No newline at end of file
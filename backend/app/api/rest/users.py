@@ -1,28 +1,72 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.cache import Cache, get_cache
 from app.database import get_db
-from app.schemas import UserCreate, UserRead
+from app.schemas import UserCreate, UserLogin, UserRead, UserTaskStats
+from app.services.task_stats import TaskStatsService
 from app.services.user_service import UserService
+from app.services.pagination import NEXT_CURSOR_HEADER, decode_cursor, next_cursor
+from app.services.serialization import ListEncoder
 
 router = APIRouter()
 
+user_list_encoder = ListEncoder(UserRead)
+
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
+async def create_user(
+    user_data: UserCreate,
+    db: AsyncSession = Depends(get_db),
+    cache: Cache = Depends(get_cache),
+):
+    service = UserService(db, cache)
+    try:
+        return await service.create_user(user_data)
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail=await service.duplicate_user_message(user_data))
+
+@router.post("/login", response_model=UserRead)
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     service = UserService(db)
-    existing_user = await service.get_user_by_email(user_data.email)
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    return await service.create_user(user_data)
+    user = await service.authenticate(credentials.email, credentials.password)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    return user
 
 @router.get("/{user_id}", response_model=UserRead)
-async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
-    service = UserService(db)
+async def get_user(
+    user_id: int, db: AsyncSession = Depends(get_db), cache: Cache = Depends(get_cache)
+):
+    service = UserService(db, cache)
     user = await service.get_user(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
+@router.get("/{user_id}/stats", response_model=UserTaskStats)
+async def get_user_task_stats(user_id: int, db: AsyncSession = Depends(get_db)):
+    stats = await TaskStatsService(db).get_stats(user_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="User not found")
+    return UserTaskStats(
+        user_id=stats.user_id,
+        open=stats.open,
+        completed=stats.completed,
+        total=stats.open + stats.completed,
+    )
+
 @router.get("/", response_model=list[UserRead])
-async def list_users(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
+async def list_users(
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        after_id = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     service = UserService(db)
-    return await service.list_users(skip, limit)
\ No newline at end of file
+    rows = await service.list_user_rows(skip, limit, after_id=after_id)
+    cursor = next_cursor(rows, limit)
+    return user_list_encoder.response(rows, {NEXT_CURSOR_HEADER: cursor} if cursor else None)
\ No newline at end of file
@@ -0,0 +1,49 @@
+import json
+import struct
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+# Subprotocol for msgpack frames, each an array of one or more events
+MSGPACK_SUBPROTOCOL = "tasks.msgpack"
+
+# Upper bound on events packed into one binary frame
+MAX_FRAME_EVENTS = 256
+
+
+def available_subprotocols() -> list[str]:
+    return [MSGPACK_SUBPROTOCOL] if msgpack is not None else []
+
+
+def select_subprotocol(offered: list[str]) -> str | None:
+    """Pick the binary subprotocol if the client offers it and msgpack is installed"""
+    for subprotocol in offered:
+        if subprotocol in available_subprotocols():
+            return subprotocol
+    return None
+
+
+def pack(message: str) -> bytes:
+    """Re-encode one JSON event as a msgpack object; other text goes as a msgpack str"""
+    try:
+        return msgpack.packb(json.loads(message))
+    except ValueError:
+        return msgpack.packb(message)
+
+
+def pack_frame(events: list[bytes]) -> bytes:
+    """Join packed events into one msgpack array without re-encoding them"""
+    count = len(events)
+    if count < 16:
+        header = bytes((0x90 | count,))
+    elif count < 2**16:
+        header = b"\xdc" + struct.pack(">H", count)
+    else:
+        header = b"\xdd" + struct.pack(">I", count)
+    return header + b"".join(events)
+
+
+def unpack(data: bytes):
+    return msgpack.unpackb(data)
@@ -0,0 +1,47 @@
+import math
+from typing import Protocol
+
+
+class Scheduled(Protocol):
+    slot: int | None
+
+
+class TimerWheel:
+    """Hashed timing wheel for many timers driven by one periodic task.
+
+    Scheduling and cancelling are O(1); each advance() pops the slot for the
+    current tick. Items remember their slot in a `slot` attribute so the wheel
+    keeps no index of its own. Delays are rounded up to whole ticks and capped at
+    max_delay.
+    """
+
+    def __init__(self, tick: float, max_delay: float):
+        if tick <= 0 or max_delay < tick:
+            raise ValueError("tick must be positive and no larger than max_delay")
+        self.tick = tick
+        self.slots: list[set[Scheduled]] = [
+            set() for _ in range(math.ceil(max_delay / tick) + 1)
+        ]
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        return sum(len(slot) for slot in self.slots)
+
+    def schedule(self, item: Scheduled, delay: float) -> None:
+        self.cancel(item)
+        ticks = min(max(1, math.ceil(delay / self.tick)), len(self.slots) - 1)
+        item.slot = (self.cursor + ticks) % len(self.slots)
+        self.slots[item.slot].add(item)
+
+    def cancel(self, item: Scheduled) -> None:
+        if item.slot is not None:
+            self.slots[item.slot].discard(item)
+            item.slot = None
+
+    def advance(self) -> set[Scheduled]:
+        self.cursor = (self.cursor + 1) % len(self.slots)
+        due = self.slots[self.cursor]
+        self.slots[self.cursor] = set()
+        for item in due:
+            item.slot = None
+        return due
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from typing import Callable, Protocol
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str, str], None]
+
+BROADCAST_CHANNEL = "ws:broadcast"
+
+
+def user_channel(user_id: int) -> str:
+    return f"ws:user:{user_id}"
+
+
+class PubSub(Protocol):
+    """Backplane carrying WebSocket messages between workers"""
+
+    handler: Handler | None
+
+    async def publish(self, channel: str, message: str) -> int:
+        ...
+
+    async def subscribe(self, channel: str) -> None:
+        ...
+
+    async def unsubscribe(self, channel: str) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class InMemoryBroker:
+    """Routes messages between InMemoryPubSub instances in one process"""
+
+    def __init__(self):
+        self.subscribers: dict[str, set["InMemoryPubSub"]] = {}
+
+    def publish(self, channel: str, message: str) -> int:
+        receivers = list(self.subscribers.get(channel, ()))
+        for pubsub in receivers:
+            if pubsub.handler is not None:
+                pubsub.handler(channel, message)
+        return len(receivers)
+
+
+class InMemoryPubSub:
+    """Single-process backplane; instances sharing a broker act like separate workers"""
+
+    def __init__(self, broker: InMemoryBroker | None = None):
+        self.broker = broker or InMemoryBroker()
+        self.handler: Handler | None = None
+        self.channels: set[str] = set()
+
+    async def publish(self, channel: str, message: str) -> int:
+        return self.broker.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> None:
+        self.channels.add(channel)
+        self.broker.subscribers.setdefault(channel, set()).add(self)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self.channels.discard(channel)
+        subscribers = self.broker.subscribers.get(channel)
+        if subscribers is not None:
+            subscribers.discard(self)
+            if not subscribers:
+                del self.broker.subscribers[channel]
+
+    async def close(self) -> None:
+        for channel in list(self.channels):
+            await self.unsubscribe(channel)
+
+
+class RedisPubSub:
+    """Backplane over Redis pub/sub, shared by every worker and node"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url, decode_responses=True)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._listener: asyncio.Task | None = None
+        self.handler: Handler | None = None
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self._client.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> None:
+        await self._pubsub.subscribe(channel)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def unsubscribe(self, channel: str) -> None:
+        await self._pubsub.unsubscribe(channel)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Redis pub/sub receive failed", exc_info=True)
+                await asyncio.sleep(1.0)
+                continue
+            if message is None or self.handler is None:
+                continue
+            try:
+                self.handler(message["channel"], message["data"])
+            except Exception:
+                logger.warning("Redis pub/sub handler failed", exc_info=True)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+        await self._pubsub.aclose()
+        await self._client.aclose()
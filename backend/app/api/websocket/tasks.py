@@ -1,50 +1,404 @@
-from fastapi import WebSocket, WebSocketDisconnect
-from typing import List, Dict
-import json
+from fastapi import WebSocket, WebSocketDisconnect, status
+from typing import Dict, Set
 import asyncio
+import json
+import logging
+import time
+
+from app.api.websocket.codec import (
+    MAX_FRAME_EVENTS,
+    MSGPACK_SUBPROTOCOL,
+    pack,
+    pack_frame,
+    select_subprotocol,
+    unpack,
+)
+from app.api.websocket.heartbeat import TimerWheel
+from app.api.websocket.pubsub import (
+    BROADCAST_CHANNEL,
+    InMemoryPubSub,
+    PubSub,
+    RedisPubSub,
+    user_channel,
+)
+from app.config import get_settings
+from app.events import TaskEvents
+
+logger = logging.getLogger(__name__)
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+SLOW_CONSUMER_POLICIES = (DROP_NEWEST, DROP_OLDEST, DISCONNECT)
+
+PING = json.dumps({"event": "ping"})
+
+class Outbound:
+    """A JSON message and its binary encoding, packed at most once per fan-out"""
+
+    __slots__ = ("text", "_packed")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._packed: bytes | None = None
+
+    @property
+    def packed(self) -> bytes:
+        if self._packed is None:
+            self._packed = pack(self.text)
+        return self._packed
+
+class Connection:
+    """One WebSocket with its own bounded outbound queue and writer task"""
+
+    __slots__ = (
+        "websocket", "user_id", "queue", "writer", "dropped", "last_seen", "slot", "binary"
+    )
+
+    def __init__(
+        self, websocket: WebSocket, user_id: int, max_queue: int, binary: bool = False
+    ):
+        self.websocket = websocket
+        self.user_id = user_id
+        # Text frames for JSON clients, packed events for the msgpack subprotocol
+        self.binary = binary
+        self.queue: asyncio.Queue[str | bytes] = asyncio.Queue(max_queue)
+        self.writer: asyncio.Task | None = None
+        self.dropped = 0
+        # Monotonic time of the last frame received from the client
+        self.last_seen = time.monotonic()
+        # Heartbeat timer wheel slot, managed by TimerWheel
+        self.slot: int | None = None
+
+    def touch(self):
+        self.last_seen = time.monotonic()
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[int, List[WebSocket]] = {}
-    
-    async def connect(self, websocket: WebSocket, user_id: int):
-        await websocket.accept()
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
-    
+    """Fans messages out to WebSockets without awaiting any client.
+
+    Sends only enqueue onto each connection's bounded queue; a per-connection
+    writer task drains it. When a queue is full the slow consumer policy decides
+    whether the new message is dropped, the oldest queued one is dropped, or the
+    connection is closed.
+
+    With a pub/sub backplane, sends are published instead and every worker
+    delivers them to its own connections. A worker subscribes to a user's channel
+    only while that user has a connection on it.
+
+    One heartbeat task drives a timer wheel for all connections: every
+    heartbeat_interval a connection is sent a ping, and one that has sent nothing,
+    pongs included, for idle_timeout is closed. Users are limited to
+    max_connections_per_user sockets; further handshakes are rejected.
+
+    Clients that negotiate the msgpack subprotocol get binary frames, each an
+    array of every event queued for them at the time, up to MAX_FRAME_EVENTS.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 100,
+        slow_consumer_policy: str = DISCONNECT,
+        pubsub: PubSub | None = None,
+        heartbeat_interval: float = 30.0,
+        idle_timeout: float = 75.0,
+        max_connections_per_user: int | None = None,
+        heartbeat_tick: float = 1.0,
+    ):
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {slow_consumer_policy}")
+        self.max_queue = max_queue
+        self.slow_consumer_policy = slow_consumer_policy
+        self.active_connections: Dict[int, Set[Connection]] = {}
+        self._by_socket: Dict[int, Connection] = {}
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.max_connections_per_user = max_connections_per_user
+        self.wheel = TimerWheel(min(heartbeat_tick, heartbeat_interval), heartbeat_interval)
+        self._heartbeat: asyncio.Task | None = None
+        self.dropped_messages = 0
+        self.slow_disconnects = 0
+        self.idle_evictions = 0
+        self.rejected_connections = 0
+        self._pending: set[asyncio.Task] = set()
+        self.pubsub = pubsub
+        self._broadcast_subscribed = False
+        # Users whose channel this worker is subscribed to
+        self._user_channels: set[int] = set()
+        if pubsub is not None:
+            pubsub.handler = self._on_message
+
+    async def connect(
+        self, websocket: WebSocket, user_id: int, subprotocol: str | None = None
+    ) -> Connection | None:
+        if self._at_limit(user_id):
+            return await self._reject(websocket)
+        await websocket.accept(subprotocol=subprotocol)
+        # Concurrent handshakes for this user may have registered during the accept
+        if self._at_limit(user_id):
+            return await self._reject(websocket)
+        connection = Connection(
+            websocket, user_id, self.max_queue, binary=subprotocol == MSGPACK_SUBPROTOCOL
+        )
+        writer = self._write_frames if connection.binary else self._write
+        connection.writer = asyncio.create_task(writer(connection))
+        self.active_connections.setdefault(user_id, set()).add(connection)
+        self._by_socket[id(websocket)] = connection
+        self.wheel.schedule(connection, self.heartbeat_interval)
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._run_heartbeat())
+        if self.pubsub is not None:
+            try:
+                await self._subscribe(user_id)
+            except Exception:
+                # Undo the registration so the next handshake subscribes again
+                self._remove(connection)
+                await self._close(websocket, status.WS_1011_INTERNAL_ERROR)
+                raise
+        return connection
+
+    async def _subscribe(self, user_id: int):
+        # Marked only once subscribed, so a failed attempt is retried by the next connect
+        if not self._broadcast_subscribed:
+            await self.pubsub.subscribe(BROADCAST_CHANNEL)
+            self._broadcast_subscribed = True
+        if user_id not in self._user_channels:
+            await self.pubsub.subscribe(user_channel(user_id))
+            self._user_channels.add(user_id)
+
+    def _at_limit(self, user_id: int) -> bool:
+        connections = self.active_connections.get(user_id)
+        limit = self.max_connections_per_user
+        return limit is not None and connections is not None and len(connections) >= limit
+
+    async def _reject(self, websocket: WebSocket) -> None:
+        self.rejected_connections += 1
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return None
+
     def disconnect(self, websocket: WebSocket, user_id: int):
+        connection = self._by_socket.get(id(websocket))
+        if connection is not None and connection.user_id == user_id:
+            self._remove(connection)
+
+    def connection_count(self) -> int:
+        return len(self._by_socket)
+
+    async def send_personal_message(self, message: str, user_id: int) -> int:
+        # Returns the connections enqueued onto, or the workers reached when published
+        if self.pubsub is not None:
+            return await self.pubsub.publish(user_channel(user_id), message)
+        return self._deliver(user_id, message)
+
+    async def broadcast(self, message: str) -> int:
+        if self.pubsub is not None:
+            return await self.pubsub.publish(BROADCAST_CHANNEL, message)
+        return self._deliver_all(message)
+
+    async def send_event(self, event: dict, user_id: int) -> int:
+        return await self.send_personal_message(json.dumps(event), user_id)
+
+    async def broadcast_event(self, event: dict) -> int:
+        return await self.broadcast(json.dumps(event))
+
+    async def close(self):
+        writers = [
+            connection.writer
+            for connection in self._by_socket.values()
+            if connection.writer is not None
+        ]
+        if self._heartbeat is not None:
+            writers.append(self._heartbeat)
+            self._heartbeat = None
+        self.active_connections.clear()
+        self._by_socket.clear()
+        for writer in writers:
+            writer.cancel()
+        await asyncio.gather(*writers, *self._pending, return_exceptions=True)
+        if self.pubsub is not None:
+            await self.pubsub.close()
+            self._broadcast_subscribed = False
+            self._user_channels.clear()
+
+    def _on_message(self, channel: str, message: str):
+        if channel == BROADCAST_CHANNEL:
+            self._deliver_all(message)
+        else:
+            self._deliver(int(channel.rsplit(":", 1)[1]), message)
+
+    def _deliver(self, user_id: int, message: str) -> int:
+        outbound = Outbound(message)
+        delivered = 0
+        for connection in list(self.active_connections.get(user_id, ())):
+            delivered += self._enqueue(
+                connection, outbound.packed if connection.binary else outbound.text
+            )
+        return delivered
+
+    def _deliver_all(self, message: str) -> int:
+        outbound = Outbound(message)
+        delivered = 0
+        for connections in list(self.active_connections.values()):
+            for connection in list(connections):
+                delivered += self._enqueue(
+                    connection, outbound.packed if connection.binary else outbound.text
+                )
+        return delivered
+
+    def _enqueue(self, connection: Connection, message: str | bytes) -> bool:
+        try:
+            connection.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            pass
+        self.dropped_messages += 1
+        connection.dropped += 1
+        if self.slow_consumer_policy == DROP_OLDEST:
+            connection.queue.get_nowait()
+            connection.queue.put_nowait(message)
+            return True
+        if self.slow_consumer_policy == DISCONNECT:
+            self.slow_disconnects += 1
+            self._remove(connection)
+            self._spawn(self._close(connection.websocket))
+        return False
+
+    async def _run_heartbeat(self):
+        while True:
+            await asyncio.sleep(self.wheel.tick)
+            self.beat(time.monotonic())
+
+    def beat(self, now: float):
+        ping = Outbound(PING)
+        for connection in self.wheel.advance():
+            if now - connection.last_seen >= self.idle_timeout:
+                self.idle_evictions += 1
+                self._remove(connection)
+                self._spawn(self._close(connection.websocket, status.WS_1001_GOING_AWAY))
+                continue
+            self._enqueue(connection, ping.packed if connection.binary else ping.text)
+            if self._by_socket.get(id(connection.websocket)) is connection:
+                self.wheel.schedule(connection, self.heartbeat_interval)
+
+    async def _write(self, connection: Connection):
+        websocket = connection.websocket
+        queue = connection.queue
+        try:
+            while True:
+                message = await queue.get()
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("WebSocket send failed for user %s", connection.user_id, exc_info=True)
+            self._remove(connection)
+
+    async def _write_frames(self, connection: Connection):
+        websocket = connection.websocket
+        queue = connection.queue
+        try:
+            while True:
+                events = [await queue.get()]
+                while not queue.empty() and len(events) < MAX_FRAME_EVENTS:
+                    events.append(queue.get_nowait())
+                await websocket.send_bytes(pack_frame(events))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("WebSocket send failed for user %s", connection.user_id, exc_info=True)
+            self._remove(connection)
+
+    def _remove(self, connection: Connection):
+        user_id = connection.user_id
+        self.wheel.cancel(connection)
+        if self._by_socket.get(id(connection.websocket)) is connection:
+            del self._by_socket[id(connection.websocket)]
+        connections = self.active_connections.get(user_id)
+        if connections and connection in connections:
+            connections.discard(connection)
+            if not connections:
+                del self.active_connections[user_id]
+                if self.pubsub is not None:
+                    self._spawn(self._unsubscribe(user_id))
+        if connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _unsubscribe(self, user_id: int):
+        # The user may have reconnected to this worker before this ran
         if user_id in self.active_connections:
-            self.active_connections[user_id].remove(websocket)
-    
-    async def send_personal_message(self, message: str, user_id: int):
-        if user_id in self.active_connections:
-            for connection in self.active_connections[user_id]:
-                await connection.send_text(message)
-    
-    async def broadcast(self, message: str):
-        for connections in self.active_connections.values():
-            for connection in connections:
-                await connection.send_text(message)
+            return
+        self._user_channels.discard(user_id)
+        try:
+            await self.pubsub.unsubscribe(user_channel(user_id))
+        except Exception:
+            logger.warning("Unsubscribing user %s failed", user_id, exc_info=True)
 
-manager = ConnectionManager()
+    async def _close(self, websocket: WebSocket, code: int = status.WS_1013_TRY_AGAIN_LATER):
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            logger.debug("Closing WebSocket failed", exc_info=True)
+
+settings = get_settings()
+
+if settings.WS_PUBSUB_BACKEND == "redis":
+    pubsub: PubSub = RedisPubSub(settings.REDIS_URL)
+else:
+    pubsub = InMemoryPubSub()
+
+manager = ConnectionManager(
+    max_queue=settings.WS_SEND_QUEUE_SIZE,
+    slow_consumer_policy=settings.WS_SLOW_CONSUMER_POLICY,
+    pubsub=pubsub,
+    heartbeat_interval=settings.WS_HEARTBEAT_INTERVAL_SECONDS,
+    idle_timeout=settings.WS_IDLE_TIMEOUT_SECONDS,
+    max_connections_per_user=settings.WS_MAX_CONNECTIONS_PER_USER,
+)
+
+task_events = TaskEvents(manager.send_event, window=settings.WS_EVENT_COALESCE_MS / 1000)
+
+def get_task_events() -> TaskEvents:
+    return task_events
 
 async def websocket_endpoint(websocket: WebSocket, user_id: int):
-    await manager.connect(websocket, user_id)
+    subprotocol = select_subprotocol(websocket.scope.get("subprotocols", []))
     try:
+        connection = await manager.connect(websocket, user_id, subprotocol)
+        if connection is None:
+            return
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
-            
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            # Binary frames on the msgpack subprotocol, text frames otherwise
+            data = frame.get("bytes") if connection.binary else frame.get("text")
+            if data is None:
+                await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+                break
+            try:
+                message = unpack(data) if connection.binary else json.loads(data)
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                await websocket.close(code=status.WS_1007_INVALID_FRAME_PAYLOAD_DATA)
+                break
+            connection.touch()
+
             if message.get("type") == "task_created":
-                await manager.send_personal_message(
-                    json.dumps({"event": "task_created", "task": message.get("task")}),
+                await manager.send_event(
+                    {"event": "task_created", "task": message.get("task")},
                     user_id
                 )
             elif message.get("type") == "task_updated":
-                await manager.send_personal_message(
-                    json.dumps({"event": "task_updated", "task": message.get("task")}),
+                await manager.send_event(
+                    {"event": "task_updated", "task": message.get("task")},
                     user_id
                 )
     except WebSocketDisconnect:
-        manager.disconnect(websocket, user_id)
\ No newline at end of file
+        pass
+    finally:
+        manager.disconnect(websocket, user_id)
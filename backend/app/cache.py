@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Awaitable, Callable, Protocol, TypeVar
+
+from pydantic import BaseModel
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Stored for ids that do not exist, so repeated 404 lookups are cached as well
+MISSING = "null"
+
+# Handed to waiting callers when the loading call is cancelled, so one of them loads instead
+_RETRY = object()
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> str | None:
+        ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        ...
+
+    async def delete(self, *keys: str) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process backend for tests and single-worker local runs"""
+
+    def __init__(self):
+        self._data: dict[str, tuple[float, str]] = {}
+
+    async def get(self, key: str) -> str | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def close(self) -> None:
+        self._data.clear()
+
+
+class RedisCacheBackend:
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> str | None:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*keys)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class Cache:
+    """Read-through cache of pydantic schemas with single-flight loading.
+
+    Concurrent misses for the same key share one loader call, so an expired hot
+    key costs one database query per worker instead of one per request. Backend
+    failures are logged and treated as misses; the cache never fails a request.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = 60, negative_ttl: int = 5):
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._invalidations = 0
+
+    async def get_or_load(
+        self,
+        key: str,
+        schema: type[SchemaT],
+        loader: Callable[[], Awaitable[object | None]],
+    ) -> SchemaT | None:
+        try:
+            cached = await self.backend.get(key)
+        except Exception:
+            self.errors += 1
+            logger.warning("Cache get failed for %s", key, exc_info=True)
+            cached = None
+        if cached is not None:
+            self.hits += 1
+            return None if cached == MISSING else schema.model_validate_json(cached)
+
+        self.misses += 1
+        while (inflight := self._inflight.get(key)) is not None:
+            value = await asyncio.shield(inflight)
+            if value is not _RETRY:
+                return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._invalidations
+        try:
+            loaded = await loader()
+            value = None if loaded is None else schema.model_validate(loaded)
+            # Skip the write if the key was invalidated while loading, so a
+            # read that raced a commit cannot repopulate the cache with stale data
+            if generation == self._invalidations:
+                await self._store(key, value)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        except BaseException:
+            # Cancellation belongs to this caller only; waiters retry the load
+            future.set_result(_RETRY)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._inflight[key]
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        self._invalidations += 1
+        try:
+            await self.backend.delete(*keys)
+        except Exception:
+            self.errors += 1
+            logger.warning("Cache invalidation failed for %s", keys, exc_info=True)
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+    async def _store(self, key: str, value: BaseModel | None) -> None:
+        try:
+            if value is None:
+                await self.backend.set(key, MISSING, self.negative_ttl)
+            else:
+                await self.backend.set(key, value.model_dump_json(), self.ttl)
+        except Exception:
+            self.errors += 1
+            logger.warning("Cache set failed for %s", key, exc_info=True)
+
+
+def user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def task_key(task_id: int) -> str:
+    return f"task:{task_id}"
+
+
+@lru_cache()
+def get_cache() -> Cache:
+    settings = get_settings()
+    if settings.CACHE_BACKEND == "redis":
+        backend: CacheBackend = RedisCacheBackend(settings.REDIS_URL)
+    else:
+        backend = MemoryCacheBackend()
+    return Cache(
+        backend,
+        ttl=settings.CACHE_TTL_SECONDS,
+        negative_ttl=settings.CACHE_NEGATIVE_TTL_SECONDS,
+    )
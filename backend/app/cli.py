@@ -0,0 +1,136 @@
+"""Command line entry points.
+
+Import tasks from a file:
+
+    python -m app.cli import-tasks --owner-id 1 --format csv tasks.csv
+
+Load a synthetic dataset into empty tables:
+
+    python -m app.cli seed --users 10000 --tasks 1000000 --seed 42
+
+Recompute the per-owner task counters, for example from a nightly cron job:
+
+    python -m app.cli reconcile-stats --batch-size 1000
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.cache import get_cache
+from app.config import get_settings
+from app.database import AsyncSessionLocal, Base, engine
+from app.schemas import TaskImportReport
+from app.seeding import SeedReport, SeedSpec, seed_database
+from app.services.task_import import RECORD_PARSERS, import_tasks, iter_lines
+from app.services.task_stats import ReconcileReport, reconcile_task_stats
+from app.services.task_service import TaskService
+
+READ_SIZE = 64 * 1024
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as source:
+        while chunk := source.read(READ_SIZE):
+            yield chunk
+
+
+def print_progress(report: TaskImportReport) -> None:
+    print(
+        f"batch {report.batches}: {report.imported} imported, {report.rejected} rejected",
+        file=sys.stderr,
+    )
+
+
+async def run_import(args: argparse.Namespace) -> TaskImportReport:
+    settings = get_settings()
+    records = RECORD_PARSERS[args.format](iter_lines(read_chunks(args.path)))
+    try:
+        async with AsyncSessionLocal() as session:
+            return await import_tasks(
+                # The API's cache, so ids cached as missing there are evicted
+                TaskService(session, get_cache()),
+                args.owner_id,
+                records,
+                batch_size=args.batch_size or settings.IMPORT_BATCH_SIZE,
+                max_reported_rejections=settings.IMPORT_MAX_REPORTED_REJECTIONS,
+                on_progress=print_progress,
+            )
+    finally:
+        await get_cache().backend.close()
+        await engine.dispose()
+
+
+async def run_seed(args: argparse.Namespace) -> SeedReport:
+    spec = SeedSpec(
+        users=args.users,
+        tasks=args.tasks,
+        seed=args.seed,
+        skew=args.skew,
+        completed_share=args.completed_share,
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        return await seed_database(engine, spec)
+    finally:
+        await engine.dispose()
+
+
+async def run_reconcile(args: argparse.Namespace) -> ReconcileReport:
+    def progress(report: ReconcileReport) -> None:
+        print(
+            f"batch {report.batches}: {report.owners} owners, {report.repaired} repaired",
+            file=sys.stderr,
+        )
+
+    try:
+        return await reconcile_task_stats(AsyncSessionLocal, args.batch_size, progress)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import-tasks", help="Import tasks from NDJSON or CSV")
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--owner-id", type=int, required=True)
+    import_parser.add_argument("--format", choices=sorted(RECORD_PARSERS), default="ndjson")
+    import_parser.add_argument("--batch-size", type=int)
+
+    seed_parser = commands.add_parser("seed", help="Load a synthetic dataset into empty tables")
+    seed_parser.add_argument("--users", type=int, required=True)
+    seed_parser.add_argument("--tasks", type=int, required=True)
+    seed_parser.add_argument("--seed", type=int, default=0)
+    seed_parser.add_argument(
+        "--skew", type=float, default=1.1, help="Zipf exponent of tasks per owner"
+    )
+    seed_parser.add_argument("--completed-share", type=float, default=0.4)
+
+    reconcile_parser = commands.add_parser(
+        "reconcile-stats", help="Recompute per-owner task counters from the tasks table"
+    )
+    reconcile_parser.add_argument("--batch-size", type=int, default=1000)
+
+    args = parser.parse_args(argv)
+    if args.command == "seed":
+        seeded = asyncio.run(run_seed(args))
+        print(f"{seeded.users} users, {seeded.tasks} tasks in {seeded.seconds:.1f} s")
+        return 0
+    if args.command == "reconcile-stats":
+        reconciled = asyncio.run(run_reconcile(args))
+        print(
+            f"{reconciled.owners} owners checked, {reconciled.repaired} repaired "
+            f"in {reconciled.seconds:.1f} s"
+        )
+        return 0
+    report = asyncio.run(run_import(args))
+    print(report.model_dump_json(indent=2))
+    return 1 if report.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -7,6 +8,32 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key"
     DEBUG: bool = False
     ENVIRONMENT: str = "development"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    SQL_REPEAT_THRESHOLD: int = 3
+    PASSWORD_HASH_ALGORITHM: str = "scrypt"
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 4
+    PASSWORD_SCRYPT_N: int = 16384
+    PASSWORD_PBKDF2_ITERATIONS: int = 600000
+    BULK_INSERT_CHUNK_SIZE: int = Field(500, ge=1)
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_REPORTED_REJECTIONS: int = 1000
+    WS_SEND_QUEUE_SIZE: int = 100
+    WS_SLOW_CONSUMER_POLICY: str = "disconnect"
+    WS_PUBSUB_BACKEND: str = "memory"
+    WS_EVENT_COALESCE_MS: int = 50
+    WS_HEARTBEAT_INTERVAL_SECONDS: float = 30.0
+    WS_IDLE_TIMEOUT_SECONDS: float = 75.0
+    WS_MAX_CONNECTIONS_PER_USER: int = 10
+    GRPC_ENABLED: bool = False
+    GRPC_PORT: int = 50051
+    GRPC_SHUTDOWN_GRACE_SECONDS: float = 5.0
+    CACHE_BACKEND: str = "redis"
+    CACHE_TTL_SECONDS: int = 60
+    CACHE_NEGATIVE_TTL_SECONDS: int = 5
     
     class Config:
         env_file = ".env"
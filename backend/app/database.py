@@ -1,15 +1,34 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.pool import InstrumentedPool, instrument_engine
+from app.query_stats import instrument_queries
 
 settings = get_settings()
 
+def pool_options(settings: Settings) -> dict:
+    # SQLite uses single-connection pools that take no sizing arguments
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    **pool_options(settings)
 )
 
+pool_metrics = instrument_engine(engine)
+instrument_queries(engine)
+
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -18,4 +37,4 @@ Base = declarative_base()
 
 async def get_db():
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
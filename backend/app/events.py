@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from typing import Awaitable, Callable
+
+from app.metrics import DEFAULT_BUCKETS, HistogramSeries, render_histogram, render_samples
+from app.schemas import TaskRead
+
+logger = logging.getLogger(__name__)
+
+TASK_CREATED = "task_created"
+TASK_UPDATED = "task_updated"
+TASK_BATCH = "task_batch"
+
+Send = Callable[[dict, int], Awaitable[object]]
+
+
+class TaskEvents:
+    """Coalesces task events per user and sends them once per tick.
+
+    The first event after a flush starts a window of `window` seconds; every event
+    recorded until it ends goes out in the same flush. Repeated events for one task
+    collapse into the latest state, and a task created in the window stays a
+    task_created event. A user with a single event gets that event as its own frame,
+    otherwise a task_batch frame carries up to max_batch events.
+    """
+
+    def __init__(self, send: Send, window: float = 0.05, max_batch: int = 500):
+        self.send = send
+        self.window = window
+        self.max_batch = max_batch
+        # owner_id -> task_id -> (event name, payload, recorded at)
+        self._pending: dict[int, dict[int, tuple[str, dict, float]]] = {}
+        self._flusher: asyncio.Task | None = None
+        self.events = 0
+        self.coalesced = 0
+        self.frames = 0
+        self.errors = 0
+        self.latency = HistogramSeries(len(DEFAULT_BUCKETS))
+
+    def task_created(self, task: TaskRead) -> None:
+        self._record(TASK_CREATED, task)
+
+    def task_updated(self, task: TaskRead) -> None:
+        self._record(TASK_UPDATED, task)
+
+    def _record(self, event: str, task: TaskRead) -> None:
+        self.events += 1
+        tasks = self._pending.setdefault(task.owner_id, {})
+        previous = tasks.get(task.id)
+        recorded = time.perf_counter()
+        if previous is not None:
+            self.coalesced += 1
+            if previous[0] == TASK_CREATED:
+                event = TASK_CREATED
+            # Latency counts from the oldest change the frame carries
+            recorded = previous[2]
+        tasks[task.id] = (event, task.model_dump(mode="json"), recorded)
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        self._flusher = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        for owner_id, tasks in pending.items():
+            events = list(tasks.values())
+            for start in range(0, len(events), self.max_batch):
+                await self._send(owner_id, events[start:start + self.max_batch])
+
+    async def _send(self, owner_id: int, events: list[tuple[str, dict, float]]) -> None:
+        if len(events) == 1:
+            frame = {"event": events[0][0], "task": events[0][1]}
+        else:
+            frame = {
+                "event": TASK_BATCH,
+                "events": [{"event": event, "task": task} for event, task, _ in events],
+            }
+        try:
+            await self.send(frame, owner_id)
+        except Exception:
+            self.errors += 1
+            logger.warning("Sending task events to user %s failed", owner_id, exc_info=True)
+            return
+        self.frames += 1
+        sent = time.perf_counter()
+        for _, _, recorded in events:
+            seconds = sent - recorded
+            self.latency.counts[bisect_left(DEFAULT_BUCKETS, seconds)] += 1
+            self.latency.count += 1
+            self.latency.total += seconds
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "window_seconds": self.window,
+            "events": self.events,
+            "coalesced": self.coalesced,
+            "frames": self.frames,
+            "errors": self.errors,
+            "delivery_seconds_avg": (
+                round(self.latency.total / self.latency.count, 6) if self.latency.count else 0.0
+            ),
+        }
+
+    def render(self) -> str:
+        return "".join([
+            render_samples("ws_task_events_total", "counter", "Task events recorded.", self.events),
+            render_samples(
+                "ws_task_events_coalesced_total", "counter",
+                "Task events merged into a pending event for the same task.", self.coalesced
+            ),
+            render_samples(
+                "ws_task_event_frames_total", "counter", "Task event frames sent.", self.frames
+            ),
+            render_histogram(
+                "ws_task_event_delivery_seconds",
+                "Time from commit until a task event is handed to the WebSocket layer.",
+                DEFAULT_BUCKETS,
+                self.latency,
+            ),
+        ])
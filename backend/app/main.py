@@ -1,11 +1,18 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 
+from app.cache import Cache, get_cache
 from app.config import get_settings
-from app.database import engine, Base
+from app.database import engine, Base, pool_metrics
+from app.passwords import get_password_hasher
 from app.api.rest import router as rest_router
+from app.api.websocket.tasks import manager, task_events, websocket_endpoint
+from app.query_stats import SERVER_TIMING_HEADER, QueryStatsMiddleware
+from app.metrics import CONTENT_TYPE, MetricsMiddleware, render_samples, request_metrics
+from app.services.pagination import NEXT_CURSOR_HEADER
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -14,7 +21,20 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    grpc_server = None
+    if settings.GRPC_ENABLED:
+        from app.api.grpc.server import create_server
+
+        grpc_server, port = create_server(f"[::]:{settings.GRPC_PORT}")
+        await grpc_server.start()
+        logger.info("gRPC server listening on port %d", port)
     yield
+    if grpc_server is not None:
+        await grpc_server.stop(settings.GRPC_SHUTDOWN_GRACE_SECONDS)
+    await task_events.close()
+    await manager.close()
+    await get_cache().backend.close()
+    get_password_hasher().shutdown()
     await engine.dispose()
 
 app = FastAPI(
@@ -30,14 +50,78 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, SERVER_TIMING_HEADER],
+)
+app.add_middleware(
+    QueryStatsMiddleware,
+    debug=settings.DEBUG,
+    repeat_threshold=settings.SQL_REPEAT_THRESHOLD,
 )
+app.add_middleware(MetricsMiddleware, metrics=request_metrics)
 
 app.include_router(rest_router, prefix="/api/v1", tags=["API v1"])
+app.add_api_websocket_route("/ws/tasks/{user_id}", websocket_endpoint)
 
 @app.get("/health")
 async def health_check():
+    if pool_metrics.snapshot(engine.sync_engine.pool)["exhausted"]:
+        return {"status": "degraded", "reason": "database connection pool exhausted"}
     return {"status": "ok"}
 
+@app.get("/db/pool")
+async def db_pool_stats():
+    return pool_metrics.snapshot(engine.sync_engine.pool)
+
+@app.get("/cache/stats")
+async def cache_stats(cache: Cache = Depends(get_cache)):
+    return cache.stats()
+
+@app.get("/security/password-hashing")
+async def password_hashing_stats():
+    return get_password_hasher().stats()
+
+@app.get("/ws/events/stats")
+async def task_event_stats():
+    return task_events.stats()
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(cache: Cache = Depends(get_cache)):
+    pool = pool_metrics.snapshot(engine.sync_engine.pool)
+    cache_stats = cache.stats()
+    hashing = get_password_hasher().stats()
+    body = "".join([
+        request_metrics.render(),
+        render_samples(
+            "db_pool_connections_in_use", "gauge", "Checked out connections.", pool["in_use"]
+        ),
+        render_samples(
+            "db_pool_waiting", "gauge", "Requests waiting for a connection.", pool["waiting"]
+        ),
+        render_samples(
+            "db_pool_timeouts_total", "counter", "Connection checkout timeouts.", pool["timeouts"]
+        ),
+        render_samples("cache_hits_total", "counter", "Cache hits.", cache_stats["hits"]),
+        render_samples("cache_misses_total", "counter", "Cache misses.", cache_stats["misses"]),
+        render_samples(
+            "password_hash_operations_total", "counter", "Password hash and verify calls.",
+            hashing["operations"]
+        ),
+        render_samples(
+            "password_hash_seconds_total", "counter", "Time spent hashing passwords.",
+            hashing["hash_seconds_total"]
+        ),
+        render_samples(
+            "password_hash_wait_seconds_total", "counter",
+            "Time spent waiting for a hashing slot.", hashing["wait_seconds_total"]
+        ),
+        render_samples(
+            "password_hash_in_progress", "gauge", "Password hashes running now.",
+            hashing["in_progress"]
+        ),
+        task_events.render(),
+    ])
+    return PlainTextResponse(body, media_type=CONTENT_TYPE)
+
 @app.get("/")
 async def root():
     return {"message": "Advanced Test Project API", "version": "1.0.0"}
\ No newline at end of file
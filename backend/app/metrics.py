@@ -0,0 +1,138 @@
+import time
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Label used for requests that matched no route, so unknown paths cannot
+# create an unbounded number of series
+UNMATCHED_ROUTE = "<unmatched>"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class HistogramSeries:
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self, buckets: int):
+        # One slot per bucket plus +Inf; counts are per bucket, made cumulative on render
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.total = 0.0
+
+
+class RequestMetrics:
+    """Request counts and latency histograms keyed by (route, method, status)"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.series: dict[tuple[str, str, int], HistogramSeries] = {}
+        self.in_progress = 0
+
+    def observe(self, route: str, method: str, status: int, seconds: float) -> None:
+        key = (route, method, status)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = HistogramSeries(len(self.buckets))
+        series.counts[bisect_left(self.buckets, seconds)] += 1
+        series.count += 1
+        series.total += seconds
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_requests_in_progress Requests currently being served.",
+            "# TYPE http_requests_in_progress gauge",
+            f"http_requests_in_progress {self.in_progress}",
+            "# HELP http_requests_total Total HTTP requests.",
+            "# TYPE http_requests_total counter",
+        ]
+        items = sorted(self.series.items())
+        for (route, method, status), series in items:
+            labels = _labels(route, method, status)
+            lines.append(f"http_requests_total{{{labels}}} {series.count}")
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        bounds = [_format_float(bound) for bound in self.buckets] + ["+Inf"]
+        for (route, method, status), series in items:
+            labels = _labels(route, method, status)
+            cumulative = 0
+            for bound, count in zip(bounds, series.counts):
+                cumulative += count
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {series.total}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {series.count}")
+        return "\n".join(lines) + "\n"
+
+
+def render_samples(name: str, metric_type: str, help_text: str, value: float) -> str:
+    return f"# HELP {name} {help_text}\n# TYPE {name} {metric_type}\n{name} {value}\n"
+
+
+def render_histogram(
+    name: str, help_text: str, buckets: tuple[float, ...], series: HistogramSeries
+) -> str:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    bounds = [_format_float(bound) for bound in buckets] + ["+Inf"]
+    cumulative = 0
+    for bound, count in zip(bounds, series.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+    lines.append(f"{name}_sum {series.total}")
+    lines.append(f"{name}_count {series.count}")
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(route: str, method: str, status: int) -> str:
+    return f'route="{_escape(route)}",method="{method}",status="{status}"'
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request metrics by route template"""
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.in_progress += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_progress -= 1
+            route = scope.get("route")
+            metrics.observe(
+                route.path if route is not None else UNMATCHED_ROUTE,
+                scope["method"],
+                status,
+                time.perf_counter() - started,
+            )
+
+
+request_metrics = RequestMetrics()
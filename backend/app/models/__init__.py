@@ -1,4 +1,5 @@
 from app.models.user import User
 from app.models.task import Task
+from app.models.task_stats import TaskStats
 
-__all__ = ["User", "Task"]
\ No newline at end of file
+__all__ = ["User", "Task", "TaskStats"]
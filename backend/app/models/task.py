@@ -1,14 +1,96 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import DDL, Column, Index, Integer, String, DateTime, Boolean, ForeignKey, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from app.database import Base
 
+class utcnow(FunctionElement):
+    """The current UTC time, stored on SQLite in the format DateTime binds use.
+    
+    SQLite's CURRENT_TIMESTAMP drops the fraction ('2024-01-01 10:00:00') while
+    bound datetimes keep six digits; both are compared as text, so mixing them
+    breaks range filters and keyset pages on these columns.
+    """
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
 class Task(Base):
     __tablename__ = "tasks"
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     description = Column(String(1000))
-    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
+    owner_id = Column(Integer, ForeignKey("users.id"))
     completed = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
+    updated_at = Column(DateTime(timezone=True), server_default=utcnow(), onupdate=utcnow())
+    
+    # One index per filter and sort TaskService.list_query supports: owner first,
+    # then the equality filter, then the sort column, with id breaking ties.
+    # owner_id leads every one of them, so it needs no index of its own.
+    __table_args__ = (
+        Index("ix_tasks_owner_id_id", "owner_id", "id"),
+        Index("ix_tasks_owner_completed_id", "owner_id", "completed", "id"),
+        Index("ix_tasks_owner_created_at", "owner_id", "created_at", "id"),
+        Index("ix_tasks_owner_completed_created_at", "owner_id", "completed", "created_at", "id"),
+        Index("ix_tasks_owner_updated_at", "owner_id", "updated_at", "id"),
+        Index("ix_tasks_owner_completed_updated_at", "owner_id", "completed", "updated_at", "id"),
+    )
+
+# Full-text search lives outside the mapped columns. Postgres keeps a generated,
+# GIN-indexed tsvector in step with title and description. SQLite mirrors tasks
+# into a contentless FTS5 table through triggers; each row also carries an
+# owner token, so a search for one owner only walks that owner's postings.
+POSTGRES_SEARCH_DDL = (
+    """
+    ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+)
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, owner, content='', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner)
+        VALUES (new.id, new.title, new.description, 'o' || new.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner)
+        VALUES ('delete', old.id, old.title, old.description, 'o' || old.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description, owner_id ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner)
+        VALUES ('delete', old.id, old.title, old.description, 'o' || old.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner)
+        VALUES (new.id, new.title, new.description, 'o' || new.owner_id);
+    END
+    """,
+)
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Task.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"),
+)
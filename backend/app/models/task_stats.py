@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.database import Base
+
+class TaskStats(Base):
+    """Per-owner task counters, written in the same transaction as the tasks"""
+    __tablename__ = "task_stats"
+    
+    owner_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    open_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_tasks = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,209 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Protocol
+
+from app.config import get_settings
+
+LEGACY_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class PasswordAlgorithm(Protocol):
+    name: str
+
+    def hash(self, password: str) -> str:
+        ...
+
+    def verify(self, password: str, encoded: str) -> bool:
+        ...
+
+    def needs_rehash(self, encoded: str) -> bool:
+        ...
+
+
+class ScryptAlgorithm:
+    """scrypt from the standard library, encoded as scrypt$n$r$p$salt$hash"""
+
+    name = "scrypt"
+
+    def __init__(self, n: int = 2**14, r: int = 8, p: int = 1):
+        self.n = n
+        self.r = r
+        self.p = p
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024
+        )
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(16)
+        digest = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.name}${self.n}${self.r}${self.p}${_b64encode(salt)}${_b64encode(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        _, n, r, p, salt, digest = encoded.split("$")
+        derived = self._derive(password, _b64decode(salt), int(n), int(r), int(p))
+        return hmac.compare_digest(derived, _b64decode(digest))
+
+    def needs_rehash(self, encoded: str) -> bool:
+        _, n, r, p, _, _ = encoded.split("$")
+        return (int(n), int(r), int(p)) != (self.n, self.r, self.p)
+
+
+class Pbkdf2Algorithm:
+    """PBKDF2-HMAC-SHA256, encoded as pbkdf2_sha256$iterations$salt$hash"""
+
+    name = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(16)
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, self.iterations)
+        return f"{self.name}${self.iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        _, iterations, salt, digest = encoded.split("$")
+        derived = hashlib.pbkdf2_hmac(
+            "sha256", password.encode(), _b64decode(salt), int(iterations)
+        )
+        return hmac.compare_digest(derived, _b64decode(digest))
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return int(encoded.split("$")[1]) != self.iterations
+
+
+class LegacySha256Algorithm:
+    """Unsalted hex sha256 written by earlier versions; verify only, always rehashed"""
+
+    name = "sha256"
+
+    def hash(self, password: str) -> str:
+        raise ValueError("Legacy sha256 hashes must not be created")
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), encoded)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return True
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords in a bounded thread pool, off the event loop.
+
+    At most max_concurrency hashes run at once; further calls wait on a semaphore
+    instead of queueing unbounded work. The stdlib KDFs release the GIL, so hashing
+    does not slow down request handling on the loop thread.
+    """
+
+    def __init__(
+        self,
+        algorithms: list[PasswordAlgorithm],
+        default: str,
+        max_concurrency: int = 4,
+    ):
+        self.algorithms = {algorithm.name: algorithm for algorithm in algorithms}
+        self.default = self.algorithms[default]
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="password-hash"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.operations = 0
+        self.in_progress = 0
+        self.hash_seconds_total = 0.0
+        self.hash_seconds_max = 0.0
+        self.wait_seconds_total = 0.0
+        self._dummy_hash: str | None = None
+
+    def identify(self, encoded: str) -> PasswordAlgorithm:
+        if LEGACY_SHA256.match(encoded):
+            return self.algorithms[LegacySha256Algorithm.name]
+        name = encoded.split("$", 1)[0]
+        if name not in self.algorithms:
+            raise ValueError(f"Unknown password hash algorithm: {name}")
+        return self.algorithms[name]
+
+    def needs_rehash(self, encoded: str) -> bool:
+        algorithm = self.identify(encoded)
+        return algorithm is not self.default or algorithm.needs_rehash(encoded)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.default.hash, password)
+
+    async def verify(self, password: str, encoded: str) -> bool:
+        try:
+            return await self._run(self.identify(encoded).verify, password, encoded)
+        except ValueError:
+            return False
+
+    async def verify_dummy(self, password: str) -> None:
+        """Check password against a throwaway hash and discard the result.
+
+        For logins with no stored hash, so they take as long as a wrong password
+        and response times do not reveal which emails are registered.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(_b64encode(os.urandom(16)))
+        await self.verify(password, self._dummy_hash)
+
+    async def _run(self, func, *args):
+        queued = time.perf_counter()
+        async with self._semaphore:
+            started = time.perf_counter()
+            self.wait_seconds_total += started - queued
+            self.in_progress += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, func, *args
+                )
+            finally:
+                elapsed = time.perf_counter() - started
+                self.in_progress -= 1
+                self.operations += 1
+                self.hash_seconds_total += elapsed
+                self.hash_seconds_max = max(self.hash_seconds_max, elapsed)
+
+    def stats(self) -> dict:
+        return {
+            "algorithm": self.default.name,
+            "max_concurrency": self.max_concurrency,
+            "operations": self.operations,
+            "in_progress": self.in_progress,
+            "hash_seconds_total": round(self.hash_seconds_total, 6),
+            "hash_seconds_max": round(self.hash_seconds_max, 6),
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        [
+            ScryptAlgorithm(n=settings.PASSWORD_SCRYPT_N),
+            Pbkdf2Algorithm(iterations=settings.PASSWORD_PBKDF2_ITERATIONS),
+            LegacySha256Algorithm(),
+        ],
+        default=settings.PASSWORD_HASH_ALGORITHM,
+        max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    )
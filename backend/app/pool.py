@@ -0,0 +1,103 @@
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """Counters for connection pool activity, fed by pool events and InstrumentedPool"""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_count += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self, pool: Pool) -> dict:
+        data = {
+            "pool": type(pool).__name__,
+            "in_use": self.checkouts - self.checkins,
+            "waiting": self.waiting,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_ms_avg": round(
+                self.wait_seconds_total / self.wait_count * 1000, 3
+            ) if self.wait_count else 0.0,
+            "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+            "exhausted": False,
+        }
+        if isinstance(pool, QueuePool):
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            data.update(
+                size=pool.size(),
+                max_overflow=pool._max_overflow,
+                overflow=max(pool.overflow(), 0),
+                idle=pool.checkedin(),
+                in_use=pool.checkedout(),
+            )
+            data["exhausted"] = self.waiting > 0 or (
+                pool._max_overflow >= 0 and pool.checkedout() >= capacity
+            )
+        return data
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that measures how long checkouts wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedPool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        self.metrics.waiting += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.waiting -= 1
+            self.metrics.record_wait(time.perf_counter() - started)
+
+
+def instrument_engine(engine: AsyncEngine) -> PoolMetrics:
+    """Attach pool event listeners to engine and return the metrics they feed"""
+    sync_engine = engine.sync_engine
+    metrics = getattr(sync_engine.pool, "metrics", None) or PoolMetrics()
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    return metrics
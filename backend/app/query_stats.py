@@ -0,0 +1,129 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class QueryStats:
+    """SQL statements executed while handling one request"""
+
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self, track_statements: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        # Only filled in debug mode, where repeated statements are reported
+        self.statements: Counter[str] | None = Counter() if track_statements else None
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        if self.statements is None:
+            return {}
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """Count statements and their time into the QueryStats of the current request"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if current_query_stats.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = current_query_stats.get()
+        started = conn.info.get("query_started")
+        if stats is None or not started:
+            return
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started.pop()
+        if stats.statements is not None:
+            stats.statements[statement] += 1
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+@contextmanager
+def track_queries(track_statements: bool = False) -> Iterator[QueryStats]:
+    stats = QueryStats(track_statements)
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+class QueryStatsMiddleware:
+    """Pure ASGI middleware adding per-request SQL counts to Server-Timing and logs.
+
+    With debug enabled, statements executed repeat_threshold or more times in one
+    request are logged as likely N+1 queries.
+    """
+
+    def __init__(self, app, debug: bool = False, repeat_threshold: int = 3):
+        self.app = app
+        self.debug = debug
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        with track_queries(self.debug) as stats:
+
+            async def send_with_timing(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    timing = f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"'
+                    headers = list(message.get("headers", []))
+                    headers.append((SERVER_TIMING_HEADER.lower().encode(), timing.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        route = scope.get("route")
+        path = route.path if route is not None else scope["path"]
+        logger.info(
+            "%s %s %d: %d queries in %.2f ms",
+            scope["method"], path, status, stats.count, stats.seconds * 1000,
+            extra={
+                "method": scope["method"],
+                "route": path,
+                "status": status,
+                "db_queries": stats.count,
+                "db_ms": round(stats.seconds * 1000, 3),
+            },
+        )
+        for statement, count in stats.repeated(self.repeat_threshold).items():
+            logger.warning(
+                "Possible N+1: statement executed %d times in %s %s: %s",
+                count, scope["method"], path, statement,
+                extra={"route": path, "repeat_count": count, "statement": statement},
+            )
@@ -1,4 +1,24 @@
-from app.schemas.user import UserCreate, UserRead
-from app.schemas.task import TaskCreate, TaskRead
+from app.schemas.user import UserCreate, UserLogin, UserRead, UserTaskStats
+from app.schemas.task import (
+    TaskCreate,
+    TaskFilters,
+    TaskRead,
+    TaskSort,
+    TaskUpdate,
+    TaskImportRejection,
+    TaskImportReport,
+)
 
-__all__ = ["UserCreate", "UserRead", "TaskCreate", "TaskRead"]
\ No newline at end of file
+__all__ = [
+    "UserCreate",
+    "UserLogin",
+    "UserRead",
+    "UserTaskStats",
+    "TaskCreate",
+    "TaskRead",
+    "TaskFilters",
+    "TaskSort",
+    "TaskUpdate",
+    "TaskImportRejection",
+    "TaskImportReport",
+]
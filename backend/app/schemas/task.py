@@ -1,6 +1,6 @@
 from pydantic import BaseModel, field_validator
-from typing import Optional
-from datetime import datetime
+from typing import Literal, Optional
+from datetime import datetime, timezone
 
 class TaskCreate(BaseModel):  
     title: str
@@ -14,6 +14,26 @@ class TaskCreate(BaseModel):
             raise ValueError('Title cannot be empty')
         return v
 
+class TaskUpdate(BaseModel):
+    """Partial update: only the fields present in the request change"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    completed: Optional[bool] = None
+    
+    @field_validator('title')
+    @classmethod
+    def title_must_not_be_empty(cls, v: Optional[str]) -> str:
+        if v is None or not v.strip():
+            raise ValueError('Title cannot be empty')
+        return v
+    
+    @field_validator('completed')
+    @classmethod
+    def completed_must_not_be_null(cls, v: Optional[bool]) -> bool:
+        if v is None:
+            raise ValueError('Completed cannot be null')
+        return v
+
 class TaskRead(BaseModel):
     id: int
     title: str
@@ -24,4 +44,33 @@ class TaskRead(BaseModel):
     updated_at: Optional[datetime] = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+TaskSort = Literal["id", "-id", "created_at", "-created_at", "updated_at", "-updated_at"]
+
+class TaskFilters(BaseModel):
+    """Filters and sort order of a task listing; a leading "-" sorts descending"""
+    completed: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+    sort: TaskSort = "id"
+    
+    @field_validator('created_after', 'created_before', 'updated_after', 'updated_before')
+    @classmethod
+    def to_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        # SQLite compares timestamps as text, so every bound must be in UTC
+        if v is not None and v.tzinfo is not None:
+            return v.astimezone(timezone.utc)
+        return v
+
+class TaskImportRejection(BaseModel):
+    line: int
+    error: str
+
+class TaskImportReport(BaseModel):
+    imported: int = 0
+    rejected: int = 0
+    batches: int = 0
+    rejections: list[TaskImportRejection] = []
@@ -7,6 +7,10 @@ class UserCreate(BaseModel):
     username: str
     password: str
 
+class UserLogin(BaseModel):
+    email: EmailStr
+    password: str
+
 class UserRead(BaseModel):
     id: int
     email: str
@@ -15,4 +19,10 @@ class UserRead(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class UserTaskStats(BaseModel):
+    user_id: int
+    open: int
+    completed: int
+    total: int
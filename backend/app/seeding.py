@@ -0,0 +1,192 @@
+"""Deterministic synthetic users and tasks at production scale.
+
+Rows are generated in batches from one seeded random.Random, so the same
+SeedSpec always yields the same dataset. Tasks per owner follow a Zipf-like
+distribution, a share of tasks is completed and timestamps spread over a time
+span, increasing with the row id. Loading uses COPY on Postgres and multi-row
+INSERT ... VALUES on SQLite, and expects empty tables; the per-owner task
+counters are computed from the loaded rows.
+"""
+import random
+import time
+from bisect import bisect
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Iterator
+
+from sqlalchemy import Table, case, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.models import Task, TaskStats, User
+from app.passwords import get_password_hasher
+
+TITLE_VERBS = ("Review", "Update", "Fix", "Draft", "Plan", "Call", "Ship", "Test", "Clean up")
+TITLE_NOUNS = (
+    "quarterly report", "release notes", "login page", "budget", "onboarding docs",
+    "database backup", "client meeting", "sprint board", "invoice", "roadmap",
+)
+USER_COLUMNS = ("id", "email", "username", "hashed_password", "is_active", "created_at")
+TASK_COLUMNS = (
+    "id", "title", "description", "owner_id", "completed", "created_at", "updated_at"
+)
+# SQLite allows 32766 bound parameters per statement
+MAX_INSERT_PARAMETERS = 32_000
+
+
+@dataclass(frozen=True)
+class SeedSpec:
+    users: int
+    tasks: int
+    seed: int = 0
+    # Zipf exponent of tasks per owner; 0 spreads them evenly
+    skew: float = 1.1
+    completed_share: float = 0.4
+    inactive_share: float = 0.05
+    description_share: float = 0.7
+    start: datetime = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    span: timedelta = timedelta(days=730)
+    batch_size: int = 10_000
+    password: str = "password123"
+
+
+@dataclass
+class SeedReport:
+    users: int
+    tasks: int
+    seconds: float
+
+
+class DatasetGenerator:
+    """Rows of one SeedSpec, as column tuples in USER_COLUMNS and TASK_COLUMNS order"""
+
+    def __init__(self, spec: SeedSpec, hashed_password: str):
+        self.spec = spec
+        self.hashed_password = hashed_password
+
+    def user_batches(self) -> Iterator[list[tuple]]:
+        spec = self.spec
+        rng = random.Random(f"{spec.seed}:users")
+        for first in range(1, spec.users + 1, spec.batch_size):
+            yield [
+                (
+                    user_id,
+                    f"user{user_id}@example.com",
+                    f"user{user_id}",
+                    self.hashed_password,
+                    rng.random() >= spec.inactive_share,
+                    self._timestamp(user_id, spec.users, rng),
+                )
+                for user_id in range(first, min(first + spec.batch_size, spec.users + 1))
+            ]
+
+    def task_batches(self) -> Iterator[list[tuple]]:
+        spec = self.spec
+        rng = random.Random(f"{spec.seed}:tasks")
+        owners = list(range(1, spec.users + 1))
+        # Which users are the busy ones is random, but fixed by the seed
+        rng.shuffle(owners)
+        cum_weights = list(accumulate(1 / rank ** spec.skew for rank in range(1, spec.users + 1)))
+        total = cum_weights[-1]
+        end = spec.start + spec.span
+        for first in range(1, spec.tasks + 1, spec.batch_size):
+            batch = []
+            for task_id in range(first, min(first + spec.batch_size, spec.tasks + 1)):
+                owner_id = owners[bisect(cum_weights, rng.random() * total)]
+                created_at = self._timestamp(task_id, spec.tasks, rng)
+                completed = rng.random() < spec.completed_share
+                # Completed tasks were touched again later; most others never were
+                if completed or rng.random() < 0.2:
+                    updated_at = min(created_at + timedelta(hours=rng.expovariate(1 / 72)), end)
+                else:
+                    updated_at = created_at
+                batch.append(
+                    (
+                        task_id,
+                        f"{rng.choice(TITLE_VERBS)} {rng.choice(TITLE_NOUNS)}",
+                        f"Synthetic task {task_id}"
+                        if rng.random() < spec.description_share else None,
+                        owner_id,
+                        completed,
+                        created_at,
+                        updated_at,
+                    )
+                )
+            yield batch
+
+    def _timestamp(self, row_id: int, rows: int, rng: random.Random) -> datetime:
+        # Rows spread evenly over the span, jittered within their own slot
+        return self.spec.start + self.spec.span * ((row_id - 1 + rng.random()) / rows)
+
+
+async def seed_database(engine: AsyncEngine, spec: SeedSpec) -> SeedReport:
+    """Bulk-load the dataset of spec into the (empty) users and tasks tables"""
+    started = time.perf_counter()
+    generator = DatasetGenerator(spec, await get_password_hasher().hash(spec.password))
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Also opens the transaction the COPYs then run in
+            await _advance_sequences(conn, spec)
+            await _copy(conn, User.__table__, USER_COLUMNS, generator.user_batches())
+            await _copy(conn, Task.__table__, TASK_COLUMNS, generator.task_batches())
+        else:
+            await _insert(conn, User.__table__, USER_COLUMNS, generator.user_batches())
+            await _insert(conn, Task.__table__, TASK_COLUMNS, generator.task_batches())
+        await _count_tasks(conn)
+    return SeedReport(spec.users, spec.tasks, time.perf_counter() - started)
+
+
+async def _insert(
+    conn: AsyncConnection, table: Table, columns: tuple[str, ...], batches: Iterator[list[tuple]]
+) -> None:
+    # Built by hand: compiling insert().values() with thousands of rows costs
+    # more than executing it, so only the column types' bind processors are reused
+    processors = [
+        table.c[column].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+        for column in columns
+    ]
+    rows_per_statement = MAX_INSERT_PARAMETERS // len(columns)
+    placeholders = f"({', '.join('?' * len(columns))})"
+    prefix = f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES "
+    for batch in batches:
+        for start in range(0, len(batch), rows_per_statement):
+            rows = batch[start:start + rows_per_statement]
+            parameters = tuple(
+                process(value) if process else value
+                for row in rows
+                for process, value in zip(processors, row)
+            )
+            await conn.exec_driver_sql(prefix + ", ".join([placeholders] * len(rows)), parameters)
+
+
+async def _copy(
+    conn: AsyncConnection, table: Table, columns: tuple[str, ...], batches: Iterator[list[tuple]]
+) -> None:
+    raw = await conn.get_raw_connection()
+    for batch in batches:
+        await raw.driver_connection.copy_records_to_table(
+            table.name, records=batch, columns=list(columns)
+        )
+
+
+async def _count_tasks(conn: AsyncConnection) -> None:
+    # The rows bypass TaskService, so its per-owner counters are filled in one pass
+    await conn.execute(
+        insert(TaskStats).from_select(
+            ["owner_id", "open_tasks", "completed_tasks"],
+            select(
+                Task.owner_id,
+                func.count(case((Task.completed.is_not(True), 1))),
+                func.count(case((Task.completed.is_(True), 1))),
+            ).group_by(Task.owner_id),
+        )
+    )
+
+
+async def _advance_sequences(conn: AsyncConnection, spec: SeedSpec) -> None:
+    # Rows carry explicit ids, so later inserts must start after them
+    for table, rows in ((User.__table__, spec.users), (Task.__table__, spec.tasks)):
+        await conn.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), :next, false)"),
+            {"next": rows + 1},
+        )
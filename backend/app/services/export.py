@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row
+
+EXPORT_COLUMNS = ("id", "title", "description", "owner_id", "completed", "created_at", "updated_at")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+async def ndjson_chunks(partitions: AsyncIterator[Sequence[Row]]) -> AsyncIterator[str]:
+    """Encode each partition of task rows as one chunk of newline-delimited JSON"""
+    async for rows in partitions:
+        yield "".join(
+            json.dumps({
+                "id": row.id,
+                "title": row.title,
+                "description": row.description,
+                "owner_id": row.owner_id,
+                "completed": row.completed,
+                "created_at": _isoformat(row.created_at),
+                "updated_at": _isoformat(row.updated_at),
+            }) + "\n"
+            for row in rows
+        )
+
+
+async def csv_chunks(partitions: AsyncIterator[Sequence[Row]]) -> AsyncIterator[str]:
+    """Encode task rows as CSV, starting with a header line"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+    async for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            (
+                row.id,
+                row.title,
+                row.description,
+                row.owner_id,
+                row.completed,
+                _isoformat(row.created_at),
+                _isoformat(row.updated_at),
+            )
+            for row in rows
+        )
+        yield buffer.getvalue()
+
+
+ENCODERS = {
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+}
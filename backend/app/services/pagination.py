@@ -0,0 +1,84 @@
+import base64
+import binascii
+from typing import Sequence
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int, key: str = "id") -> str:
+    """Encode the id of the last row on a page ordered by key ("id" or "-id")"""
+    return base64.urlsafe_b64encode(f"{key}:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key: str = "id") -> int:
+    """Decode a cursor produced by encode_cursor for the same key.
+
+    Raises ValueError if the cursor is malformed or belongs to another ordering.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    prefix, _, value = raw.partition(":")
+    if prefix != key or not value.isdigit():
+        raise ValueError("Invalid cursor")
+    return int(value)
+
+
+def next_cursor(items: Sequence, limit: int, key: str = "id") -> str | None:
+    """Return the cursor for the page after items, or None on the last page"""
+    if limit <= 0 or len(items) < limit:
+        return None
+    return encode_cursor(items[-1].id, key)
+
+
+def encode_keyset_cursor(key: str, value: str, last_id: int) -> str:
+    """Encode the sort value and id of the last row on a page ordered by key"""
+    raw = f"{key}:{value}:{last_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str, key: str) -> tuple[str, int]:
+    """Decode a cursor produced by encode_keyset_cursor for the same key.
+
+    Raises ValueError if the cursor is malformed or belongs to another ordering.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    prefix, _, rest = raw.partition(":")
+    value, _, last_id = rest.rpartition(":")
+    if prefix != key or not last_id.isdigit():
+        raise ValueError("Invalid cursor")
+    return value, int(last_id)
+
+
+def encode_rank_cursor(score: float, last_id: int) -> str:
+    """Encode the rank and id of the last row on a ranked page as an opaque cursor"""
+    return encode_keyset_cursor("rank", repr(score), last_id)
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """Decode a cursor produced by encode_rank_cursor, raising ValueError if malformed"""
+    score, last_id = decode_keyset_cursor(cursor, "rank")
+    try:
+        return float(score), last_id
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def next_rank_cursor(rows: Sequence, limit: int) -> str | None:
+    """Like next_cursor, for rows that carry a score column"""
+    if limit <= 0 or len(rows) < limit:
+        return None
+    return encode_rank_cursor(rows[-1].score, rows[-1].id)
+
+
+def next_keyset_cursor(rows: Sequence, limit: int, key: str, column: str) -> str | None:
+    """Like next_cursor, for rows ordered by column and then id"""
+    if limit <= 0 or len(rows) < limit:
+        return None
+    return encode_keyset_cursor(key, str(getattr(rows[-1], column)), rows[-1].id)
@@ -0,0 +1,150 @@
+import codecs
+import csv
+import json
+import logging
+from typing import AsyncIterator, Callable
+
+from pydantic import ValidationError
+
+from app.schemas import TaskCreate, TaskImportRejection, TaskImportReport
+from app.services.task_service import TaskService
+
+logger = logging.getLogger(__name__)
+
+CSV_COLUMNS = {"title", "description", "completed"}
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """Split a byte stream into numbered text lines without buffering the whole body"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    line_number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield line_number + 1, pending.rstrip("\r")
+
+
+async def ndjson_records(
+    lines: AsyncIterator[tuple[int, str]]
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """Yield (line, record) pairs, or (line, error message) for unparseable lines"""
+    async for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Expected a JSON object"
+            continue
+        yield line_number, record
+
+
+async def csv_records(
+    lines: AsyncIterator[tuple[int, str]]
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """Yield (line, record) pairs from CSV with a header row.
+
+    A quoted field may span several lines; the record is numbered by its first line.
+    """
+    header: list[str] | None = None
+    buffered = ""
+    first_line = 0
+    async for line_number, line in lines:
+        if not buffered:
+            first_line = line_number
+            if not line.strip():
+                continue
+        buffered = f"{buffered}\n{line}" if buffered else line
+        if buffered.count('"') % 2:
+            continue
+        row = next(csv.reader([buffered]))
+        buffered = ""
+        if header is None:
+            header = [column.strip() for column in row]
+            if "title" not in header:
+                yield first_line, "Header must include a title column"
+                return
+            continue
+        if len(row) != len(header):
+            yield first_line, f"Expected {len(header)} columns, got {len(row)}"
+            continue
+        yield first_line, {
+            column: value
+            for column, value in zip(header, row)
+            if column in CSV_COLUMNS and value != ""
+        }
+    if buffered:
+        yield first_line, "Unterminated quoted field"
+
+
+RECORD_PARSERS = {
+    "ndjson": ndjson_records,
+    "csv": csv_records,
+}
+
+
+def _format_errors(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+async def import_tasks(
+    service: TaskService,
+    owner_id: int,
+    records: AsyncIterator[tuple[int, dict | str]],
+    batch_size: int = 1000,
+    max_reported_rejections: int = 1000,
+    on_progress: Callable[[TaskImportReport], None] | None = None,
+) -> TaskImportReport:
+    """Validate records with TaskCreate and write them through TaskService in batches.
+
+    Each batch is committed in its own transaction, so memory stays bounded by the
+    batch size and a failure loses at most the batch in flight. Rejected rows are
+    counted; the first max_reported_rejections are listed with their line numbers.
+    """
+    report = TaskImportReport()
+    batch: list[TaskCreate] = []
+
+    def reject(line_number: int, message: str) -> None:
+        report.rejected += 1
+        if len(report.rejections) < max_reported_rejections:
+            report.rejections.append(TaskImportRejection(line=line_number, error=message))
+
+    async def flush(rows: list[TaskCreate]) -> None:
+        await service.create_tasks(rows, owner_id, chunk_size=batch_size)
+        report.imported += len(rows)
+        report.batches += 1
+        if on_progress is not None:
+            on_progress(report)
+
+    async for line_number, record in records:
+        if isinstance(record, str):
+            reject(line_number, record)
+            continue
+        try:
+            batch.append(TaskCreate.model_validate(record))
+        except ValidationError as e:
+            reject(line_number, _format_errors(e))
+            continue
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+
+    logger.info(
+        "Imported %d tasks for owner %d in %d batches, rejected %d rows",
+        report.imported, owner_id, report.batches, report.rejected,
+    )
+    return report
@@ -1,43 +1,276 @@
+import re
+from datetime import datetime
+from typing import AsyncIterator, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement, Row, Select, and_, column, func, insert, literal_column, or_, select, table,
+    tuple_, update
+)
+from app.cache import Cache, task_key
+from app.events import TaskEvents
 from app.models import Task
-from app.schemas import TaskCreate
+from app.schemas import TaskCreate, TaskFilters, TaskRead, TaskUpdate
+from app.services.task_stats import TaskStatsService
+
+# Columns of TaskRead, for reads that skip building ORM objects
+TASK_READ_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.owner_id,
+    Task.completed,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# Sort option of TaskFilters -> (column, descending); id breaks ties
+TASK_SORTS = {
+    sort: (column, descending)
+    for name, column in (
+        ("id", Task.id), ("created_at", Task.created_at), ("updated_at", Task.updated_at)
+    )
+    for sort, descending in ((name, False), (f"-{name}", True))
+}
+
+# Relative weight of title and description matches in SQLite's bm25 ranking;
+# the owner column only filters
+FTS_WEIGHTS = (10.0, 5.0, 0.0)
 
 class TaskService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self, db: AsyncSession, cache: Cache | None = None, events: TaskEvents | None = None
+    ):
         self.db = db
+        self.cache = cache
+        self.events = events
+        self.stats = TaskStatsService(db)
     
     async def create_task(self, task_data: TaskCreate, owner_id: int) -> Task:
-        db_task = Task(
-            title=task_data.title,
-            description=task_data.description,
-            owner_id=owner_id,
-            completed=task_data.completed
+        # RETURNING brings back the generated columns, so there is no refresh
+        db_task = await self.db.scalar(
+            insert(Task)
+            .values(
+                title=task_data.title,
+                description=task_data.description,
+                owner_id=owner_id,
+                completed=task_data.completed,
+            )
+            .returning(Task)
         )
-        self.db.add(db_task)
+        await self._count(owner_id, [task_data.completed])
         await self.db.commit()
-        await self.db.refresh(db_task)
+        await self._invalidate(db_task.id)
+        if self.events is not None:
+            self.events.task_created(TaskRead.model_validate(db_task))
         return db_task
     
-    async def get_task(self, task_id: int) -> Task | None:
-        result = await self.db.execute(
-            select(Task).where(Task.id == task_id)
+    async def create_tasks(
+        self, tasks_data: list[TaskCreate], owner_id: int, chunk_size: int = 500
+    ) -> list[Task]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        rows = [
+            {
+                "title": task_data.title,
+                "description": task_data.description,
+                "owner_id": owner_id,
+                "completed": task_data.completed,
+            }
+            for task_data in tasks_data
+        ]
+        tasks: list[Task] = []
+        for start in range(0, len(rows), chunk_size):
+            result = await self.db.scalars(
+                insert(Task).returning(Task, sort_by_parameter_order=True),
+                rows[start:start + chunk_size],
+            )
+            tasks.extend(result.all())
+        await self._count(owner_id, [task_data.completed for task_data in tasks_data])
+        await self.db.commit()
+        await self._invalidate(*(task.id for task in tasks))
+        if self.events is not None:
+            for task in tasks:
+                self.events.task_created(TaskRead.model_validate(task))
+        return tasks
+    
+    async def get_task(self, task_id: int) -> Task | TaskRead | None:
+        if self.cache is None:
+            return await self._load_task(task_id)
+        return await self.cache.get_or_load(
+            task_key(task_id), TaskRead, lambda: self._load_task(task_id)
         )
-        return result.scalars().first()
     
-    async def list_tasks(self, owner_id: int, skip: int = 0, limit: int = 10):
-        result = await self.db.execute(
-            select(Task).where(Task.owner_id == owner_id).offset(skip).limit(limit)
+    async def list_tasks(
+        self,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
+        filters: TaskFilters | None = None,
+        after_value: datetime | None = None,
+    ):
+        query = self.list_query(
+            select(Task), owner_id, skip, limit, after_id, filters, after_value
         )
+        result = await self.db.execute(query)
         return result.scalars().all()
     
+    async def list_task_rows(
+        self,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
+        filters: TaskFilters | None = None,
+        after_value: datetime | None = None,
+    ) -> Sequence[Row]:
+        query = self.list_query(
+            select(*TASK_READ_COLUMNS), owner_id, skip, limit, after_id, filters, after_value
+        )
+        result = await self.db.execute(query)
+        return result.all()
+    
+    async def stream_tasks(
+        self, owner_id: int, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        result = await self.db.stream(
+            select(*TASK_READ_COLUMNS)
+            .where(Task.owner_id == owner_id)
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+    
+    async def search_tasks(
+        self, owner_id: int, q: str, limit: int = 10, after: tuple[float, int] | None = None
+    ) -> Sequence[Row]:
+        """Tasks of owner_id matching q, best first; rows carry their score.
+
+        after is the (score, id) of the last row of the previous page.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            score, query = self._postgres_search(q)
+        else:
+            terms = re.findall(r"\w+", q)
+            if not terms:
+                return []
+            score, query = self._sqlite_search(owner_id, terms)
+        query = query.where(Task.owner_id == owner_id)
+        if after is not None:
+            after_score, after_id = after
+            query = query.where(
+                or_(score < after_score, and_(score == after_score, Task.id > after_id))
+            )
+        result = await self.db.execute(query.order_by(score.desc(), Task.id).limit(limit))
+        return result.all()
+    
     async def update_task(self, task_id: int, task_data: TaskCreate) -> Task | None:
-        db_task = await self.get_task(task_id)
-        if not db_task:
+        return await self._update(task_id, task_data.model_dump())
+    
+    async def patch_task(self, task_id: int, changes: TaskUpdate) -> Task | None:
+        values = changes.model_dump(exclude_unset=True)
+        if not values:
+            return await self._load_task(task_id)
+        return await self._update(task_id, values)
+    
+    def list_query(
+        self,
+        query: Select,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
+        filters: TaskFilters | None = None,
+        after_value: datetime | None = None,
+    ) -> Select:
+        """One page of owner_id's tasks matching filters, in their sort order.
+        
+        Every combination is served by one of the composite indexes on Task.
+        after_id (and after_value, the last row's sort column for timestamp
+        sorts) continues after the previous page; otherwise skip is an offset.
+        """
+        filters = filters or TaskFilters()
+        sort_column, descending = TASK_SORTS[filters.sort]
+        query = query.where(Task.owner_id == owner_id)
+        if filters.completed is not None:
+            query = query.where(Task.completed == filters.completed)
+        for ts_column, lower, upper in (
+            (Task.created_at, filters.created_after, filters.created_before),
+            (Task.updated_at, filters.updated_after, filters.updated_before),
+        ):
+            if lower is not None:
+                query = query.where(ts_column >= lower)
+            if upper is not None:
+                query = query.where(ts_column < upper)
+        if after_id is not None:
+            if sort_column is Task.id:
+                key, after = Task.id, after_id
+            else:
+                key, after = tuple_(sort_column, Task.id), (after_value, after_id)
+            query = query.where(key < after if descending else key > after)
+        else:
+            query = query.offset(skip)
+        if sort_column is Task.id:
+            order = (Task.id.desc(),) if descending else (Task.id,)
+        else:
+            order = (sort_column.desc(), Task.id.desc()) if descending else (sort_column, Task.id)
+        return query.order_by(*order).limit(limit)
+    
+    def _postgres_search(self, q: str) -> tuple[ColumnElement, Select]:
+        tsquery = func.websearch_to_tsquery("english", q)
+        vector = literal_column("tasks.search_vector")
+        score = func.ts_rank_cd(vector, tsquery)
+        query = select(*TASK_READ_COLUMNS, score.label("score")).where(vector.op("@@")(tsquery))
+        return score, query
+    
+    def _sqlite_search(self, owner_id: int, terms: list[str]) -> tuple[ColumnElement, Select]:
+        fts = table("tasks_fts", column("rowid"))
+        # Quoted terms are plain strings to FTS5, whatever the user typed
+        phrase = " ".join(f'"{term}"' for term in terms)
+        match = f'owner : "o{owner_id}" AND ({phrase})'
+        score = -func.bm25(literal_column("tasks_fts"), *FTS_WEIGHTS)
+        query = (
+            select(*TASK_READ_COLUMNS, score.label("score"))
+            .join_from(Task, fts, fts.c.rowid == Task.id)
+            .where(literal_column("tasks_fts").match(match))
+        )
+        return score, query
+    
+    async def _load_task(self, task_id: int) -> Task | None:
+        result = await self.db.execute(
+            select(Task).where(Task.id == task_id)
+        )
+        return result.scalars().first()
+    
+    async def _update(self, task_id: int, values: dict) -> Task | None:
+        # UPDATE ... RETURNING instead of load, flush and refresh. When completed
+        # is set, the first attempt only matches a task it flips; the row lock
+        # makes that the one writer that moves the owner's counters.
+        query = update(Task).where(Task.id == task_id).values(**values).returning(Task)
+        db_task = None
+        if "completed" in values:
+            db_task = await self.db.scalar(
+                query.where(Task.completed.is_not(values["completed"]))
+            )
+            if db_task is not None:
+                flip = 1 if db_task.completed else -1
+                await self.stats.adjust(db_task.owner_id, -flip, flip)
+        if db_task is None:
+            db_task = await self.db.scalar(query)
+        if db_task is None:
             return None
-        db_task.title = task_data.title
-        db_task.description = task_data.description
-        db_task.completed = task_data.completed
         await self.db.commit()
-        await self.db.refresh(db_task)
-        return db_task
\ No newline at end of file
+        await self._invalidate(task_id)
+        if self.events is not None:
+            self.events.task_updated(TaskRead.model_validate(db_task))
+        return db_task
+    
+    async def _count(self, owner_id: int, completed: list[bool]) -> None:
+        # New tasks, counted in the transaction that inserts them
+        done = sum(completed)
+        await self.stats.adjust(owner_id, len(completed) - done, done)
+    
+    async def _invalidate(self, *task_ids: int) -> None:
+        if self.cache is not None and task_ids:
+            await self.cache.invalidate(*(task_key(task_id) for task_id in task_ids))
\ No newline at end of file
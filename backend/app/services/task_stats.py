@@ -0,0 +1,141 @@
+"""Per-owner task counters.
+
+TaskService adjusts an owner's row of task_stats in the transaction that writes
+the tasks, so reading "N open / M done" is one primary-key lookup however many
+tasks there are. Writes that bypass TaskService (SQL consoles, restores) let the
+counters drift; reconcile_task_stats recomputes them from the tasks table.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import Row, case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Task, TaskStats, User
+
+
+@dataclass
+class ReconcileReport:
+    owners: int = 0
+    repaired: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+class TaskStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_stats(self, user_id: int) -> Row | None:
+        """The user's counters (zero without a task_stats row), or None for no such user"""
+        result = await self.db.execute(
+            select(
+                User.id.label("user_id"),
+                func.coalesce(TaskStats.open_tasks, 0).label("open"),
+                func.coalesce(TaskStats.completed_tasks, 0).label("completed"),
+            )
+            .outerjoin(TaskStats, TaskStats.owner_id == User.id)
+            .where(User.id == user_id)
+        )
+        return result.first()
+
+    async def adjust(self, owner_id: int, open_tasks: int = 0, completed_tasks: int = 0) -> None:
+        """Add to owner_id's counters in the current transaction, without committing"""
+        if not open_tasks and not completed_tasks:
+            return
+        stmt = self._insert().values(
+            owner_id=owner_id, open_tasks=open_tasks, completed_tasks=completed_tasks
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TaskStats.owner_id],
+                set_={
+                    "open_tasks": TaskStats.open_tasks + stmt.excluded.open_tasks,
+                    "completed_tasks": TaskStats.completed_tasks + stmt.excluded.completed_tasks,
+                },
+            )
+        )
+
+    async def reconcile(self, first_id: int, last_id: int) -> int:
+        """Recompute the counters of users first_id..last_id; returns how many were wrong.
+
+        Locks the batch's counter rows before counting, so a concurrent write
+        either committed before the count or applies its increment after this
+        transaction, on top of the corrected value.
+        """
+        in_batch = TaskStats.owner_id.between(first_id, last_id)
+        # Every user gets a row first, so there is a row to lock
+        await self.db.execute(
+            self._insert()
+            .from_select(["owner_id"], select(User.id).where(User.id.between(first_id, last_id)))
+            .on_conflict_do_nothing(index_elements=[TaskStats.owner_id])
+        )
+        stored = {
+            row.owner_id: (row.open_tasks, row.completed_tasks)
+            for row in await self.db.execute(
+                select(TaskStats.owner_id, TaskStats.open_tasks, TaskStats.completed_tasks)
+                .where(in_batch)
+                .with_for_update()
+            )
+        }
+        counted = {
+            row.owner_id: (row.open_tasks, row.completed_tasks)
+            for row in await self.db.execute(
+                select(
+                    Task.owner_id,
+                    func.count(case((Task.completed.is_not(True), 1))).label("open_tasks"),
+                    func.count(case((Task.completed.is_(True), 1))).label("completed_tasks"),
+                )
+                .where(Task.owner_id.between(first_id, last_id))
+                .group_by(Task.owner_id)
+            )
+        }
+        repaired = 0
+        for owner_id, current in stored.items():
+            expected = counted.get(owner_id, (0, 0))
+            if current != expected:
+                await self.adjust(
+                    owner_id, expected[0] - current[0], expected[1] - current[1]
+                )
+                repaired += 1
+        return repaired
+
+    def _insert(self):
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        return dialect.insert(TaskStats)
+
+
+async def reconcile_task_stats(
+    session_factory: sessionmaker,
+    batch_size: int = 1000,
+    on_progress: Callable[[ReconcileReport], None] | None = None,
+) -> ReconcileReport:
+    """Recompute every user's counters from the tasks table, batch_size users at a time.
+
+    Each batch commits on its own, so row locks are held briefly and an
+    interrupted run keeps the batches it finished.
+    """
+    started = time.perf_counter()
+    report = ReconcileReport()
+    after_id = 0
+    while True:
+        async with session_factory() as session:
+            user_ids = (
+                await session.scalars(
+                    select(User.id).where(User.id > after_id).order_by(User.id).limit(batch_size)
+                )
+            ).all()
+            if not user_ids:
+                break
+            report.repaired += await TaskStatsService(session).reconcile(user_ids[0], user_ids[-1])
+            await session.commit()
+        after_id = user_ids[-1]
+        report.owners += len(user_ids)
+        report.batches += 1
+        if on_progress is not None:
+            on_progress(report)
+    report.seconds = time.perf_counter() - started
+    return report
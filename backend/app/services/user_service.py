@@ -1,30 +1,67 @@
+from typing import AsyncIterator, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, Select, insert, select
+from sqlalchemy.exc import IntegrityError
+from app.cache import Cache, user_key
 from app.models import User
-from app.schemas import UserCreate
-import hashlib
+from app.passwords import PasswordHasher, get_password_hasher
+from app.schemas import UserCreate, UserRead
+
+# Columns of UserRead, for reads that skip building ORM objects
+USER_READ_COLUMNS = (User.id, User.email, User.username, User.is_active, User.created_at)
 
 class UserService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: Cache | None = None,
+        hasher: PasswordHasher | None = None,
+    ):
         self.db = db
+        self.cache = cache
+        self.hasher = hasher or get_password_hasher()
     
     async def create_user(self, user_data: UserCreate) -> User:
-        hashed_password = hashlib.sha256(user_data.password.encode()).hexdigest()
-        db_user = User(
-            email=user_data.email,
-            username=user_data.username,
-            hashed_password=hashed_password
-        )
-        self.db.add(db_user)
-        await self.db.commit()
-        await self.db.refresh(db_user)
+        """Insert the user in one round trip; raises IntegrityError for a taken email.
+        
+        The unique indexes decide, so two concurrent sign-ups cannot both pass a
+        check, and the session is rolled back before the error propagates.
+        """
+        hashed_password = await self.hasher.hash(user_data.password)
+        try:
+            db_user = await self.db.scalar(
+                insert(User)
+                .values(
+                    email=user_data.email,
+                    username=user_data.username,
+                    hashed_password=hashed_password,
+                )
+                .returning(User)
+            )
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        if self.cache is not None:
+            await self.cache.invalidate(user_key(db_user.id))
         return db_user
     
-    async def get_user(self, user_id: int) -> User | None:
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
+    async def duplicate_user_message(self, user_data: UserCreate) -> str:
+        """Client-facing reason create_user raised IntegrityError for user_data.
+        
+        Asks the database rather than parsing the error, whose wording names
+        whichever unique index the driver reports first; email wins ties.
+        """
+        if await self.get_user_by_email(user_data.email):
+            return "Email already registered"
+        return "Username already taken"
+    
+    async def get_user(self, user_id: int) -> User | UserRead | None:
+        if self.cache is None:
+            return await self._load_user(user_id)
+        return await self.cache.get_or_load(
+            user_key(user_id), UserRead, lambda: self._load_user(user_id)
         )
-        return result.scalars().first()
     
     async def get_user_by_email(self, email: str) -> User | None:
         result = await self.db.execute(
@@ -32,8 +69,61 @@ class UserService:
         )
         return result.scalars().first()
     
-    async def list_users(self, skip: int = 0, limit: int = 10):
+    async def authenticate(self, email: str, password: str) -> User | None:
+        user = await self.get_user_by_email(email)
+        if not user or not user.hashed_password:
+            await self.hasher.verify_dummy(password)
+            return None
+        if not await self.hasher.verify(password, user.hashed_password):
+            return None
+        if self.hasher.needs_rehash(user.hashed_password):
+            user.hashed_password = await self.hasher.hash(password)
+            await self.db.commit()
+        return user
+    
+    async def list_users(self, skip: int = 0, limit: int = 10, after_id: int | None = None):
+        result = await self.db.execute(self._list_query(select(User), skip, limit, after_id))
+        return result.scalars().all()
+    
+    async def list_user_rows(
+        self, skip: int = 0, limit: int = 10, after_id: int | None = None
+    ) -> Sequence[Row]:
+        query = self._list_query(select(*USER_READ_COLUMNS), skip, limit, after_id)
+        result = await self.db.execute(query)
+        return result.all()
+    
+    async def get_users(self, user_ids: list[int]) -> Sequence[User]:
+        if not user_ids:
+            return []
+        result = await self.db.execute(select(User).where(User.id.in_(user_ids)))
+        return result.scalars().all()
+    
+    async def stream_users(
+        self, after_id: int | None = None, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        query = (
+            select(*USER_READ_COLUMNS)
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if after_id is not None:
+            query = query.where(User.id > after_id)
+        result = await self.db.stream(query)
+        async for rows in result.partitions():
+            yield rows
+    
+    def _list_query(
+        self, query: Select, skip: int, limit: int, after_id: int | None
+    ) -> Select:
+        query = query.order_by(User.id)
+        if after_id is not None:
+            query = query.where(User.id > after_id)
+        else:
+            query = query.offset(skip)
+        return query.limit(limit)
+    
+    async def _load_user(self, user_id: int) -> User | None:
         result = await self.db.execute(
-            select(User).offset(skip).limit(limit)
+            select(User).where(User.id == user_id)
         )
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().first()
\ No newline at end of file
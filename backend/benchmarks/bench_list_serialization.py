@@ -0,0 +1,82 @@
+"""Cost of serving one list page: ORM objects through response_model versus the fast path.
+
+"before" loads ORM objects and serializes them the way FastAPI does for
+response_model=list[TaskRead]. "after" loads Core rows and uses ListEncoder,
+which is what GET /api/v1/tasks/ does now. Run from the backend directory:
+
+    python -m benchmarks.bench_list_serialization --page-size 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.schemas import TaskRead
+from app.seeding import SeedSpec, seed_database
+from app.services.serialization import ListEncoder
+from app.services.task_service import TaskService
+
+
+async def seed(engine, rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # A single owner, so every task is on its pages
+    await seed_database(engine, SeedSpec(users=1, tasks=rows))
+
+
+async def before(service: TaskService, field, page_size: int) -> tuple[float, float]:
+    started = time.perf_counter()
+    tasks = await service.list_tasks(1, limit=page_size)
+    fetched = time.perf_counter()
+    content = await serialize_response(field=field, response_content=tasks)
+    JSONResponse(content).body
+    return fetched - started, time.perf_counter() - fetched
+
+
+async def after(service: TaskService, encoder: ListEncoder, page_size: int) -> tuple[float, float]:
+    started = time.perf_counter()
+    rows = await service.list_task_rows(1, limit=page_size)
+    fetched = time.perf_counter()
+    encoder.encode(rows)
+    return fetched - started, time.perf_counter() - fetched
+
+
+async def main(page_size: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    await seed(engine, page_size)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    field = create_response_field(name="Response_list_tasks", type_=list[TaskRead])
+    encoder = ListEncoder(TaskRead)
+
+    results = {"before": [], "after": []}
+    for _ in range(repeat):
+        # A fresh session per page, as each request gets one
+        async with Session() as session:
+            results["before"].append(await before(TaskService(session), field, page_size))
+        async with Session() as session:
+            results["after"].append(await after(TaskService(session), encoder, page_size))
+
+    print(f"{page_size}-row page, median of {repeat}")
+    print(f"{'':<8} {'fetch ms':>9} {'serialize ms':>13} {'total ms':>9}")
+    for name, samples in results.items():
+        fetch = statistics.median(sample[0] for sample in samples) * 1000
+        serialize = statistics.median(sample[1] for sample in samples) * 1000
+        total = statistics.median(sum(sample) for sample in samples) * 1000
+        print(f"{name:<8} {fetch:9.2f} {serialize:13.2f} {total:9.2f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.page_size, args.repeat))
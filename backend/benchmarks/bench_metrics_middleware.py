@@ -0,0 +1,58 @@
+"""Per-request overhead of MetricsMiddleware, measured with direct ASGI calls.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_metrics_middleware --requests 200000
+"""
+import argparse
+import asyncio
+import time
+
+from app.metrics import MetricsMiddleware, RequestMetrics
+
+
+class Route:
+    path = "/api/v1/tasks/{task_id}"
+
+
+ROUTE = Route()
+START = {"type": "http.response.start", "status": 200, "headers": []}
+BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = ROUTE
+    await send(START)
+    await send(BODY)
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+async def run(app, requests: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await app({"type": "http", "method": "GET", "path": "/api/v1/tasks/1"}, receive, send)
+        best = min(best, time.perf_counter() - started)
+    return best / requests * 1_000_000
+
+
+async def main(requests: int) -> None:
+    bare = await run(endpoint, requests)
+    wrapped = await run(MetricsMiddleware(endpoint, RequestMetrics()), requests)
+    print(f"bare endpoint          : {bare:.2f} us/request")
+    print(f"with MetricsMiddleware : {wrapped:.2f} us/request")
+    print(f"overhead               : {wrapped - bare:.2f} us/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    asyncio.run(main(parser.parse_args().requests))
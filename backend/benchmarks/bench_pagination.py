@@ -0,0 +1,59 @@
+"""Page-N latency of offset vs cursor pagination for TaskService.list_tasks.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_pagination --rows 100000
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.seeding import SeedSpec, seed_database
+from app.services.task_service import TaskService
+
+PAGE_SIZE = 50
+
+
+async def seed(engine, rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # A single owner, so every task is on its pages
+    await seed_database(engine, SeedSpec(users=1, tasks=rows))
+
+
+async def time_page(service: TaskService, **kwargs) -> float:
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        await service.list_tasks(1, limit=PAGE_SIZE, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def main(rows: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    await seed(engine, rows)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print(f"{'page':>8} {'offset ms':>10} {'cursor ms':>10}")
+    async with Session() as session:
+        service = TaskService(session)
+        page = 1
+        while page * PAGE_SIZE < rows:
+            skip = (page - 1) * PAGE_SIZE
+            offset_ms = await time_page(service, skip=skip)
+            cursor_ms = await time_page(service, after_id=skip)
+            print(f"{page:>8} {offset_ms:>10.3f} {cursor_ms:>10.3f}")
+            page *= 4
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    asyncio.run(main(parser.parse_args().rows))
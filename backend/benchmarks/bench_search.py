@@ -0,0 +1,112 @@
+"""Owner-scoped task search: the full-text index versus ILIKE scans.
+
+Seeds a skewed dataset with app.seeding, then times the first page of
+TaskService.search_tasks against the same owner's tasks filtered with ILIKE on
+title and description, for the busiest owner and a median one. Uses a temporary
+SQLite file (FTS5) unless --database-url points at a scratch Postgres database
+(tsvector + GIN), whose tables are dropped afterwards. Run from the backend
+directory:
+
+    python -m benchmarks.bench_search --tasks 1000000
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Task
+from app.seeding import SeedSpec, seed_database
+from app.services.task_service import TASK_READ_COLUMNS, TaskService
+
+PAGE_SIZE = 20
+
+
+async def ilike(session: AsyncSession, owner_id: int, q: str):
+    pattern = f"%{q}%"
+    result = await session.execute(
+        select(*TASK_READ_COLUMNS)
+        .where(Task.owner_id == owner_id)
+        .where(or_(Task.title.ilike(pattern), Task.description.ilike(pattern)))
+        .order_by(Task.id)
+        .limit(PAGE_SIZE)
+    )
+    return result.all()
+
+
+async def timed(Session, repeat: int, search) -> tuple[float, int]:
+    samples = []
+    for _ in range(repeat):
+        async with Session() as session:
+            started = time.perf_counter()
+            rows = await search(session)
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000, len(rows)
+
+
+async def owners(engine) -> dict[str, int]:
+    async with engine.connect() as conn:
+        counts = (
+            await conn.execute(
+                select(Task.owner_id, func.count())
+                .group_by(Task.owner_id)
+                .order_by(func.count().desc())
+            )
+        ).all()
+    return {
+        f"busiest ({counts[0][1]} tasks)": counts[0][0],
+        f"median ({counts[len(counts) // 2][1]} tasks)": counts[len(counts) // 2][0],
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    workdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite+aiosqlite:///{Path(workdir.name) / 'search.db'}"
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    report = await seed_database(engine, SeedSpec(users=args.users, tasks=args.tasks))
+    print(f"seeded {report.tasks} tasks for {report.users} users in {report.seconds:.1f} s")
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print(f"{'owner':<24} {'query':<18} {'fts ms':>8} {'rows':>5} {'ilike ms':>9} {'rows':>5}")
+    try:
+        for label, owner_id in (await owners(engine)).items():
+            async with Session() as session:
+                # A term only one of this owner's tasks has
+                rare = await session.scalar(
+                    select(func.max(Task.id))
+                    .where(Task.owner_id == owner_id, Task.description.is_not(None))
+                )
+            for q in ("report", "database backup", str(rare)):
+                fts_ms, fts_rows = await timed(
+                    Session, args.repeat,
+                    lambda s: TaskService(s).search_tasks(owner_id, q, PAGE_SIZE),
+                )
+                ilike_ms, ilike_rows = await timed(
+                    Session, args.repeat, lambda s: ilike(s, owner_id, q)
+                )
+                print(
+                    f"{label:<24} {q:<18} {fts_ms:8.2f} {fts_rows:5d} "
+                    f"{ilike_ms:9.2f} {ilike_rows:5d}"
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+        workdir.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", help="scratch database; tables are dropped after")
+    asyncio.run(main(parser.parse_args()))
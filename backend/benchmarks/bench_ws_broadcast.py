@@ -0,0 +1,104 @@
+"""Broadcast latency across simulated WebSocket connections.
+
+Compares the old sequential send loop with ConnectionManager's queued fan-out.
+A share of clients are slow. Run from the backend directory:
+
+    python -m benchmarks.bench_ws_broadcast --connections 10000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from app.api.websocket.tasks import ConnectionManager
+
+
+class Countdown:
+    """Resolves once every fast client has received the broadcast"""
+
+    def __init__(self, count: int):
+        self.remaining = count
+        self.done = asyncio.Event()
+
+    def tick(self):
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.done.set()
+
+
+class SimulatedWebSocket:
+    def __init__(self, delay: float, countdown: Countdown):
+        self.delay = delay
+        self.countdown = countdown
+
+    async def accept(self, subprotocol: str | None = None):
+        pass
+
+    async def send_text(self, message: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        else:
+            self.countdown.tick()
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+def make_sockets(count: int, slow_every: int, slow_delay: float) -> list[SimulatedWebSocket]:
+    slow = {i for i in range(count) if slow_every and i % slow_every == 0}
+    countdown = Countdown(count - len(slow))
+    return [
+        SimulatedWebSocket(slow_delay if i in slow else 0.0, countdown)
+        for i in range(count)
+    ]
+
+
+async def sequential(sockets: list[SimulatedWebSocket], message: str) -> tuple[float, float]:
+    started = time.perf_counter()
+    for websocket in sockets:
+        await websocket.send_text(message)
+    elapsed = time.perf_counter() - started
+    return elapsed, elapsed
+
+
+async def queued(sockets: list[SimulatedWebSocket], event: dict) -> tuple[float, float]:
+    manager = ConnectionManager(max_queue=16)
+    for user_id, websocket in enumerate(sockets):
+        await manager.connect(websocket, user_id)
+    started = time.perf_counter()
+    await manager.broadcast_event(event)
+    returned = time.perf_counter() - started
+    await sockets[0].countdown.done.wait()
+    delivered = time.perf_counter() - started
+    await manager.close()
+    return returned, delivered
+
+
+async def main(connections: int, slow_every: int, slow_delay: float, rounds: int) -> None:
+    event = {"event": "task_updated", "task": {"id": 1, "title": "Benchmark", "completed": True}}
+    results = {"sequential": [], "queued": []}
+    for _ in range(rounds):
+        sockets = make_sockets(connections, slow_every, slow_delay)
+        results["sequential"].append(await sequential(sockets, json.dumps(event)))
+        sockets = make_sockets(connections, slow_every, slow_delay)
+        results["queued"].append(await queued(sockets, event))
+
+    print(f"{connections} connections, every {slow_every}th slow by {slow_delay * 1000:.0f} ms")
+    for name, samples in results.items():
+        returned = statistics.median(sample[0] for sample in samples) * 1000
+        delivered = statistics.median(sample[1] for sample in samples) * 1000
+        print(
+            f"{name:<10} broadcast returns {returned:9.2f} ms, "
+            f"all fast clients served {delivered:9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--slow-every", type=int, default=100)
+    parser.add_argument("--slow-delay", type=float, default=0.005)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.connections, args.slow_every, args.slow_delay, args.rounds))
@@ -0,0 +1,129 @@
+"""WebSocket fan-out throughput for JSON text frames versus msgpack batch frames.
+
+Serves websocket_endpoint with uvicorn on localhost and connects clients from a
+separate process, so the server's CPU time covers the real per-frame path:
+ASGI send, websockets framing and the socket write. Each user gets bursts of
+task events, as when a bulk edit commits. Reports messages delivered per server
+CPU second, frames and bytes per message. Run from the backend directory:
+
+    python -m benchmarks.bench_ws_encoding --users 100 --burst 200
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+import msgpack
+import uvicorn
+from fastapi import FastAPI
+
+from app.api.websocket.codec import MSGPACK_SUBPROTOCOL
+from app.api.websocket.tasks import manager, websocket_endpoint
+
+
+def task_event(task_id: int, owner_id: int) -> dict:
+    return {
+        "event": "task_updated",
+        "task": {
+            "id": task_id,
+            "title": f"Task {task_id} for the dashboard",
+            "description": "Follow-up on the quarterly report and update the tracker",
+            "owner_id": owner_id,
+            "completed": task_id % 2 == 0,
+            "created_at": "2024-01-01T12:00:00",
+            "updated_at": "2024-01-02T08:30:00",
+        },
+    }
+
+
+async def client(url: str, users: int, per_user: int, expected: int, subprotocol: str) -> None:
+    from websockets.asyncio.client import connect
+
+    subprotocols = [subprotocol] if subprotocol != "json" else None
+    stats = {"frames": 0, "bytes": 0}
+
+    async def follow(user_id: int):
+        async with connect(f"{url}/{user_id}", subprotocols=subprotocols, max_size=None) as ws:
+            received = 0
+            while received < expected:
+                frame = await ws.recv()
+                stats["frames"] += 1
+                stats["bytes"] += len(frame)
+                received += len(msgpack.unpackb(frame)) if isinstance(frame, bytes) else 1
+
+    await asyncio.gather(*(follow(user_id) for user_id in range(users) for _ in range(per_user)))
+    print(json.dumps(stats))
+
+
+async def run(port: int, subprotocol: str, users: int, per_user: int, burst: int, rounds: int):
+    expected = burst * rounds
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "benchmarks.bench_ws_encoding", "--client",
+        "--url", f"ws://127.0.0.1:{port}/ws", "--users", str(users),
+        "--per-user", str(per_user), "--expected", str(expected),
+        "--subprotocol", subprotocol,
+        stdout=subprocess.PIPE,
+    )
+    while manager.connection_count() < users * per_user:
+        if process.returncode is not None:
+            raise RuntimeError("benchmark client exited before connecting")
+        await asyncio.sleep(0.05)
+
+    events = [[task_event(user * burst + i, user) for i in range(burst)] for user in range(users)]
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    for _ in range(rounds):
+        for user_id in range(users):
+            for event in events[user_id]:
+                await manager.send_event(event, user_id)
+        await asyncio.sleep(0)
+    output, _ = await process.communicate()
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    while manager.connection_count():
+        await asyncio.sleep(0.01)
+    return users * per_user * expected, cpu, wall, json.loads(output)
+
+
+async def main(users: int, per_user: int, burst: int, rounds: int) -> None:
+    # Queues must hold a whole run, since delivery is not throttled here
+    manager.max_queue = burst * rounds
+    app = FastAPI()
+    app.add_api_websocket_route("/ws/{user_id}", websocket_endpoint)
+    server = uvicorn.Server(uvicorn.Config(app, port=0, log_level="warning", lifespan="off"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    print(f"{users} users x {per_user} connections, bursts of {burst} events, {rounds} rounds")
+    for name in ("json", MSGPACK_SUBPROTOCOL):
+        delivered, cpu, wall, stats = await run(port, name, users, per_user, burst, rounds)
+        print(
+            f"{name:<14} {delivered / cpu:10,.0f} msg/s per server core  "
+            f"{stats['frames']:8,d} frames  {stats['bytes'] / delivered:6.1f} B/msg  "
+            f"wall {wall:.2f} s"
+        )
+
+    server.should_exit = True
+    await serving
+    await manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--per-user", type=int, default=2)
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--client", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--expected", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--subprotocol", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.client:
+        asyncio.run(client(args.url, args.users, args.per_user, args.expected, args.subprotocol))
+    else:
+        asyncio.run(main(args.users, args.per_user, args.burst, args.rounds))
@@ -0,0 +1,70 @@
+"""Memory and bookkeeping cost of ConnectionManager's registry per connection.
+
+Connects simulated WebSockets, reports traced memory per connection and the
+time for a heartbeat tick and for disconnecting everyone. Run from the backend
+directory:
+
+    python -m benchmarks.bench_ws_registry --connections 100000
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from app.api.websocket.tasks import ConnectionManager
+
+
+class IdleWebSocket:
+    __slots__ = ()
+
+    async def accept(self, subprotocol: str | None = None):
+        pass
+
+    async def send_text(self, message: str):
+        pass
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def main(connections: int, per_user: int) -> None:
+    manager = ConnectionManager(heartbeat_interval=30.0, heartbeat_tick=1.0)
+    sockets = [IdleWebSocket() for _ in range(connections)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index, websocket in enumerate(sockets):
+        await manager.connect(websocket, index // per_user)
+    # Let every writer task start and park on its empty queue
+    await asyncio.sleep(0)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(len(manager.wheel.slots)):
+        manager.beat(time.monotonic())
+    sweep = time.perf_counter() - started
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    for index, websocket in enumerate(sockets):
+        manager.disconnect(websocket, index // per_user)
+    disconnect = time.perf_counter() - started
+
+    print(f"{connections} connections, {per_user} per user")
+    print(f"memory per connection  {(after - before) / connections:10.0f} bytes "
+          "(registry entry, queue and writer task)")
+    print(f"heartbeat, full wheel  {sweep * 1000:10.2f} ms for one ping to every connection")
+    print(f"disconnect             {disconnect / connections * 1e6:10.2f} us per connection")
+    print(f"users left in registry {len(manager.active_connections):10d}")
+    await manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=100_000)
+    parser.add_argument("--per-user", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.connections, args.per_user))
@@ -0,0 +1,302 @@
+"""HTTP load suite with stored baselines.
+
+Drives the API with a closed-loop async load generator: `--concurrency` workers
+each send one request at a time for `--duration` seconds per scenario, repeated
+`--repeat` times. Reports the median throughput and p50/p95/p99 latency across
+the repeats, which keeps one noisy run from failing the comparison. By default
+the app runs in-process behind httpx's ASGI transport; `--uvicorn` serves it on
+a local port instead, so HTTP parsing and sockets are included. The database is
+a temporary SQLite file unless `--database-url` points at a scratch database
+(for example local Postgres); its tables are created, seeded by app.seeding and
+dropped. SQLite gets one pooled connection that requests queue for: it runs one
+writer at a time, and its busy timeout lets waiting writers starve, which made
+write latencies too erratic to compare.
+
+Run from the backend directory:
+
+    python -m benchmarks.load --baseline benchmarks/baselines/load-sqlite.json
+    python -m benchmarks.load --update-baseline benchmarks/baselines/load-sqlite.json
+
+With --baseline, exits with status 1 when a scenario's p50 or p95 latency rises
+or its throughput drops by more than --threshold percent. Baselines are only
+comparable on the machine and database they were recorded on.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+import uvicorn
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from app.cache import Cache, MemoryCacheBackend, get_cache
+from app.database import Base, get_db
+from app.main import app
+from app.models import Task
+from app.seeding import SeedSpec, seed_database
+
+SEED_USERS = 1_000
+SEED_TASKS = 10_000
+
+
+@dataclass
+class Context:
+    owner_id: int
+    task_ids: list[int]
+    counter: itertools.count
+
+
+Scenario = Callable[[httpx.AsyncClient, Context], Awaitable[httpx.Response]]
+
+
+async def create_task(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.post(
+        f"/api/v1/tasks/?owner_id={ctx.owner_id}",
+        json={"title": f"Load task {next(ctx.counter)}", "description": "Generated"},
+    )
+
+
+async def get_task(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    task_id = ctx.task_ids[next(ctx.counter) % len(ctx.task_ids)]
+    return await client.get(f"/api/v1/tasks/{task_id}")
+
+
+async def list_tasks(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(f"/api/v1/tasks/?owner_id={ctx.owner_id}&limit=50")
+
+
+async def list_users(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get("/api/v1/users/?limit=50")
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "POST /tasks/": create_task,
+    "GET /tasks/{task_id}": get_task,
+    "GET /tasks/": list_tasks,
+    "GET /users/": list_users,
+}
+
+
+@dataclass
+class Result:
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    concurrency: int,
+    duration: float,
+) -> Result:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await scenario(client, ctx)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return Result(
+        requests=len(latencies),
+        errors=errors,
+        throughput=round(len(latencies) / elapsed, 1),
+        p50_ms=round(quantiles[49] * 1000, 3),
+        p95_ms=round(quantiles[94] * 1000, 3),
+        p99_ms=round(quantiles[98] * 1000, 3),
+    )
+
+
+def median_result(runs: list[Result]) -> Result:
+    return Result(
+        **{
+            field: round(statistics.median(getattr(run, field) for run in runs), 3)
+            for field in ("throughput", "p50_ms", "p95_ms", "p99_ms")
+        },
+        requests=sum(run.requests for run in runs),
+        errors=sum(run.errors for run in runs),
+    )
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regressions of more than threshold percent against the baseline scenarios"""
+    failures = []
+    limit = threshold / 100
+    for name, result in results["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        for latency in ("p50_ms", "p95_ms"):
+            if result[latency] > base[latency] * (1 + limit):
+                failures.append(
+                    f"{name}: {latency[:3]} {result[latency]:.2f} ms vs {base[latency]:.2f} ms"
+                )
+        if result["throughput"] < base["throughput"] * (1 - limit):
+            failures.append(
+                f"{name}: throughput {result['throughput']:.1f}/s vs {base['throughput']:.1f}/s"
+            )
+        if result["errors"] > base["errors"]:
+            failures.append(f"{name}: {result['errors']} errors vs {base['errors']}")
+    return failures
+
+
+async def seed(engine: AsyncEngine) -> Context:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed_database(engine, SeedSpec(users=SEED_USERS, tasks=SEED_TASKS))
+    async with engine.connect() as conn:
+        # The busiest owner, so list pages are full
+        owner_id = await conn.scalar(
+            select(Task.owner_id).group_by(Task.owner_id).order_by(func.count().desc()).limit(1)
+        )
+    return Context(
+        owner_id=owner_id, task_ids=list(range(1, SEED_TASKS + 1)), counter=itertools.count()
+    )
+
+
+async def client_for(use_uvicorn: bool):
+    if not use_uvicorn:
+        return httpx.AsyncClient(app=app, base_url="http://load"), None
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits)
+
+    async def stop():
+        server.should_exit = True
+        await serving
+
+    return client, stop
+
+
+async def main(args: argparse.Namespace) -> int:
+    workdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite+aiosqlite:///{Path(workdir.name) / 'load.db'}"
+    if database_url.startswith("sqlite"):
+        options = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_timeout": 60,
+            "connect_args": {"timeout": 30},
+        }
+    else:
+        options = {"poolclass": NullPool}
+    engine = create_async_engine(database_url, **options)
+    ctx = await seed(engine)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with Session() as session:
+            yield session
+
+    cache = Cache(MemoryCacheBackend())
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_cache] = lambda: cache
+
+    selected = args.scenario or list(SCENARIOS)
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "database": engine.dialect.name,
+            "transport": "uvicorn" if args.uvicorn else "asgi",
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "repeat": args.repeat,
+        },
+        "scenarios": {},
+    }
+    client, stop = await client_for(args.uvicorn)
+    try:
+        async with client:
+            for name in selected:
+                await run_scenario(client, SCENARIOS[name], ctx, args.concurrency, args.warmup)
+                result = median_result(
+                    [
+                        await run_scenario(
+                            client, SCENARIOS[name], ctx, args.concurrency, args.duration
+                        )
+                        for _ in range(args.repeat)
+                    ]
+                )
+                results["scenarios"][name] = asdict(result)
+                print(
+                    f"{name:<22} {result.throughput:9.1f} req/s  p50 {result.p50_ms:8.2f} ms  "
+                    f"p95 {result.p95_ms:8.2f} ms  p99 {result.p99_ms:8.2f} ms  "
+                    f"errors {result.errors}"
+                )
+    finally:
+        if stop is not None:
+            await stop()
+        app.dependency_overrides.clear()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+        workdir.cleanup()
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.update_baseline:
+        args.update_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.update_baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline written to {args.update_baseline}")
+    if args.baseline:
+        failures = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            return 1
+        print(f"no regression beyond {args.threshold:.0f}% against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds per scenario")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--uvicorn", action="store_true", help="serve over a local socket")
+    parser.add_argument("--database-url", help="scratch database; tables are dropped after")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="fail on regression against this file")
+    parser.add_argument("--update-baseline", type=Path, help="store results as the baseline")
+    parser.add_argument("--threshold", type=float, default=25.0, help="allowed regression, %%")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,71 @@
+"""Fixtures for the `bench` suite, which runs apart from the correctness tests:
+
+    pytest tests/bench -m bench
+
+Service benchmarks run against SQLite files seeded once per session by
+app.seeding with each size in BENCH_DATASET_SIZES (default 1000,100000,1000000
+users and as many tasks, spread over owners with the default skew).
+"""
+import asyncio
+import os
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Task
+from app.seeding import SeedSpec, seed_database
+
+DATASET_SIZES = [
+    int(size) for size in os.environ.get("BENCH_DATASET_SIZES", "1000,100000,1000000").split(",")
+]
+
+
+@dataclass
+class Dataset:
+    rows: int
+    session_factory: sessionmaker
+    # The owner with the most tasks, which list and stream benchmarks read
+    owner_id: int
+    last_user_id: int
+
+
+async def seed(engine, rows: int) -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed_database(engine, SeedSpec(users=rows, tasks=rows))
+    async with engine.connect() as conn:
+        return await conn.scalar(
+            select(Task.owner_id).group_by(Task.owner_id).order_by(func.count().desc()).limit(1)
+        )
+
+
+@pytest.fixture(scope="session")
+def bench_loop():
+    """A loop of its own, so synchronous benchmarks can drive coroutines"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def run_async(bench_loop):
+    return bench_loop.run_until_complete
+
+
+@pytest.fixture(scope="session", params=DATASET_SIZES, ids=lambda rows: f"{rows}rows")
+def dataset(request, tmp_path_factory, bench_loop):
+    path = tmp_path_factory.mktemp("bench") / f"dataset-{request.param}.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=StaticPool)
+    owner_id = bench_loop.run_until_complete(seed(engine, request.param))
+    yield Dataset(
+        rows=request.param,
+        session_factory=sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        owner_id=owner_id,
+        last_user_id=request.param,
+    )
+    bench_loop.run_until_complete(engine.dispose())
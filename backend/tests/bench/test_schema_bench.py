@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime
+from pydantic import ValidationError
+from app.models import Task
+from app.schemas import TaskCreate, TaskRead, UserCreate
+from app.services.serialization import ListEncoder
+
+def task(i: int) -> Task:
+    return Task(
+        id=i,
+        title=f"Task {i}",
+        description="Follow-up on the quarterly report",
+        owner_id=1,
+        completed=i % 2 == 0,
+        created_at=datetime(2024, 1, 1, 12, 0),
+        updated_at=datetime(2024, 1, 2, 8, 30),
+    )
+
+@pytest.mark.bench
+class TestSchemaBench:
+    """Validation and conversion cost of the request and response schemas"""
+    
+    def test_task_create(self, benchmark):
+        """Benchmark TaskCreate validation, title_must_not_be_empty included"""
+        benchmark.group = "schemas"
+        payload = {"title": "Write report", "description": "Quarterly", "completed": False}
+        
+        result = benchmark(TaskCreate.model_validate, payload)
+        
+        assert result.title == "Write report"
+    
+    def test_task_create_rejects_blank_title(self, benchmark):
+        """Benchmark the title_must_not_be_empty rejection path"""
+        benchmark.group = "schemas"
+        
+        def validate():
+            try:
+                TaskCreate.model_validate({"title": "   "})
+            except ValidationError:
+                return True
+            return False
+        
+        assert benchmark(validate)
+    
+    def test_user_create(self, benchmark):
+        """Benchmark UserCreate validation, EmailStr included"""
+        benchmark.group = "schemas"
+        payload = {"email": "user@example.com", "username": "user", "password": "secret123"}
+        
+        result = benchmark(UserCreate.model_validate, payload)
+        
+        assert result.email == "user@example.com"
+    
+    def test_task_read_from_orm(self, benchmark):
+        """Benchmark TaskRead conversion of one ORM object"""
+        benchmark.group = "schemas"
+        
+        result = benchmark(TaskRead.model_validate, task(1))
+        
+        assert result.id == 1
+    
+    @pytest.mark.parametrize("page_size", [50, 500])
+    def test_task_read_page_from_orm(self, benchmark, page_size):
+        """Benchmark a page of TaskRead conversions and JSON encoding, as response_model does"""
+        benchmark.group = f"serialization-{page_size}"
+        tasks = [task(i) for i in range(page_size)]
+        
+        def serialize():
+            return [TaskRead.model_validate(t).model_dump_json() for t in tasks]
+        
+        assert len(benchmark(serialize)) == page_size
+    
+    @pytest.mark.parametrize("page_size", [50, 500])
+    def test_list_encoder_page(self, benchmark, page_size):
+        """Benchmark ListEncoder on the same page, as the list routes serve it"""
+        benchmark.group = f"serialization-{page_size}"
+        tasks = [task(i) for i in range(page_size)]
+        encoder = ListEncoder(TaskRead)
+        
+        assert benchmark(encoder.encode, tasks).startswith(b"[")
@@ -0,0 +1,106 @@
+import itertools
+import pytest
+from app.schemas import TaskCreate, UserCreate
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+
+users = itertools.count()
+
+@pytest.fixture
+def call(request, benchmark, dataset, run_async):
+    """Benchmark one service call per round, each in a fresh session as a request gets"""
+    def call(service_class, operation):
+        benchmark.group = f"{service_class.__name__}.{request.function.__name__[5:]}"
+        benchmark.extra_info["rows"] = dataset.rows
+        
+        async def once():
+            async with dataset.session_factory() as session:
+                result = operation(service_class(session))
+                if hasattr(result, "__aiter__"):
+                    return [batch async for batch in result]
+                return await result
+        
+        return benchmark(lambda: run_async(once()))
+    return call
+
+@pytest.mark.bench
+class TestTaskServiceBench:
+    """TaskService methods against seeded datasets"""
+    
+    def test_get_task(self, call, dataset):
+        """Benchmark get_task by primary key"""
+        assert call(TaskService, lambda s: s.get_task(dataset.rows // 2)) is not None
+    
+    def test_list_tasks(self, call, dataset):
+        """Benchmark list_tasks for the busiest owner"""
+        assert call(TaskService, lambda s: s.list_tasks(dataset.owner_id, limit=50))
+    
+    def test_list_task_rows(self, call, dataset):
+        """Benchmark list_task_rows for the busiest owner"""
+        assert call(TaskService, lambda s: s.list_task_rows(dataset.owner_id, limit=50))
+    
+    def test_stream_tasks(self, call, dataset):
+        """Benchmark stream_tasks over the busiest owner's tasks"""
+        assert call(TaskService, lambda s: s.stream_tasks(dataset.owner_id))
+    
+    def test_create_task(self, call, dataset):
+        """Benchmark create_task"""
+        data = TaskCreate(title="Benchmark task")
+        assert call(TaskService, lambda s: s.create_task(data, dataset.owner_id)).id
+    
+    def test_create_tasks(self, call, dataset):
+        """Benchmark create_tasks with a 100-task batch"""
+        data = [TaskCreate(title=f"Benchmark task {i}") for i in range(100)]
+        tasks = call(TaskService, lambda s: s.create_tasks(data, dataset.owner_id))
+        
+        assert len(tasks) == 100
+    
+    def test_update_task(self, call, dataset):
+        """Benchmark update_task"""
+        data = TaskCreate(title="Updated", completed=True)
+        assert call(TaskService, lambda s: s.update_task(1, data)).completed
+
+@pytest.mark.bench
+class TestUserServiceBench:
+    """UserService methods against seeded datasets"""
+    
+    def test_get_user(self, call, dataset):
+        """Benchmark get_user by primary key"""
+        assert call(UserService, lambda s: s.get_user(dataset.rows // 2)) is not None
+    
+    def test_get_user_by_email(self, call, dataset):
+        """Benchmark get_user_by_email through the unique email index"""
+        email = f"user{dataset.rows // 2}@example.com"
+        assert call(UserService, lambda s: s.get_user_by_email(email)) is not None
+    
+    def test_get_users(self, call, dataset):
+        """Benchmark get_users for 100 ids"""
+        ids = list(range(1, dataset.rows + 1, max(dataset.rows // 100, 1)))
+        assert len(call(UserService, lambda s: s.get_users(ids))) == len(ids)
+    
+    def test_list_users(self, call, dataset):
+        """Benchmark list_users keyset page in the middle of the table"""
+        middle = dataset.rows // 2
+        assert call(UserService, lambda s: s.list_users(limit=50, after_id=middle))
+    
+    def test_list_user_rows(self, call, dataset):
+        """Benchmark list_user_rows keyset page in the middle of the table"""
+        middle = dataset.rows // 2
+        assert call(UserService, lambda s: s.list_user_rows(limit=50, after_id=middle))
+    
+    def test_stream_users(self, call, dataset):
+        """Benchmark stream_users over the last 1000 users"""
+        after_id = dataset.last_user_id - 1000
+        assert call(UserService, lambda s: s.stream_users(after_id=after_id))
+    
+    def test_create_user(self, call, dataset):
+        """Benchmark create_user, password hashing included"""
+        def create(service):
+            n = next(users)
+            return service.create_user(
+                UserCreate(
+                    email=f"bench{n}@example.com", username=f"bench{n}", password="secret123"
+                )
+            )
+        
+        assert call(UserService, create).id
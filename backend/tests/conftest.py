@@ -1,12 +1,45 @@
 import pytest
 import asyncio
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import shutil
+import tempfile
+from pathlib import Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 import httpx
-from app.database import Base
 from app.main import app
 from app.database import get_db
+from app.cache import Cache, MemoryCacheBackend, get_cache
+from app.query_stats import instrument_queries
+from tests.fixtures.database import (
+    build_template,
+    drop_postgres_schema,
+    postgres_engine,
+    sqlite_engine,
+    uses_postgres,
+)
+
+pytest_plugins = ["tests.fixtures.data"]
+
+def pytest_configure(config):
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        config.db_template = workerinput["db_template"]
+    elif not uses_postgres():
+        # Built once by the controller; xdist workers copy it instead of creating the schema
+        config.db_template_dir = tempfile.mkdtemp(prefix="test-db-")
+        config.db_template = str(build_template(Path(config.db_template_dir) / "template.db"))
+
+def pytest_unconfigure(config):
+    if hasattr(config, "db_template_dir"):
+        shutil.rmtree(config.db_template_dir, ignore_errors=True)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["db_template"] = getattr(node.config, "db_template", None)
+
+@pytest.fixture(scope="session")
+def worker_id(request) -> str:
+    return getattr(request.config, "workerinput", {}).get("workerid", "main")
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -15,42 +48,63 @@ def event_loop():
     loop.close()
 
 @pytest.fixture(scope="session")
-async def test_db():
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    TestingSessionLocal = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async def override_get_db():
-        async with TestingSessionLocal() as session:
-            yield session
-    
-    app.dependency_overrides[get_db] = override_get_db
+async def test_db(request, worker_id, tmp_path_factory):
+    """This worker's own database, with the schema in place"""
+    if uses_postgres():
+        schema = f"test_{worker_id}"
+        engine = await postgres_engine(schema)
+    else:
+        path = tmp_path_factory.mktemp("db") / f"test-{worker_id}.db"
+        engine = sqlite_engine(Path(request.config.db_template), path)
+    instrument_queries(engine)
     
     yield engine
     
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+    if uses_postgres():
+        await drop_postgres_schema(engine, schema)
     await engine.dispose()
 
 @pytest.fixture
-async def test_client(test_db):
+async def test_session_factory(test_db):
+    """Sessions inside one outer transaction that is rolled back after the test.
+    
+    Each session commits to a SAVEPOINT, so the app and the test see each
+    other's writes while the test runs and nothing outlives it.
+    """
+    async with test_db.connect() as conn:
+        transaction = await conn.begin()
+        TestingSessionLocal = sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        
+        async def override_get_db():
+            async with TestingSessionLocal() as session:
+                yield session
+        
+        cache = Cache(MemoryCacheBackend())
+        
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_cache] = lambda: cache
+        
+        yield TestingSessionLocal
+        
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_cache, None)
+        await transaction.rollback()
+
+@pytest.fixture
+async def test_client(test_session_factory):
     async with httpx.AsyncClient(app=app, base_url="http://test") as client:
         yield client
 
 @pytest.fixture
-async def test_session(test_db):
-    TestingSessionLocal = sessionmaker(
-        test_db, class_=AsyncSession, expire_on_commit=False
-    )
-    async with TestingSessionLocal() as session:
-        yield session
\ No newline at end of file
+def test_cache(test_session_factory) -> Cache:
+    return app.dependency_overrides[get_cache]()
+
+@pytest.fixture
+async def test_session(test_session_factory):
+    async with test_session_factory() as session:
+        yield session
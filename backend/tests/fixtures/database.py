@@ -0,0 +1,58 @@
+"""Per-worker test databases.
+
+Without TEST_DATABASE_URL every pytest process (the only one, or each xdist
+worker) copies a SQLite file from a schema template the controller built once.
+With TEST_DATABASE_URL pointing at Postgres, each worker creates its own schema
+in that database and drops it at the end.
+"""
+import os
+import shutil
+from pathlib import Path
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from app.database import Base
+import app.models  # noqa: F401  registers the tables on Base.metadata
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+def uses_postgres() -> bool:
+    return TEST_DATABASE_URL.startswith("postgresql")
+
+def build_template(path: Path) -> Path:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return path
+
+def sqlite_engine(template: Path, path: Path) -> AsyncEngine:
+    shutil.copyfile(template, path)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    
+    # pysqlite opens transactions lazily and never emits SAVEPOINT-safe BEGINs;
+    # take over so nested sessions can release and roll back savepoints
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Every test rolls back, so durability buys nothing here
+        dbapi_connection.execute("PRAGMA synchronous = OFF")
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    return engine
+
+async def postgres_engine(schema: str) -> AsyncEngine:
+    engine = create_async_engine(
+        TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    async with engine.begin() as conn:
+        await conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
+        await conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+async def drop_postgres_schema(engine: AsyncEngine, schema: str) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
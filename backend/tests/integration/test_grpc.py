@@ -0,0 +1,135 @@
+import pytest
+import uuid
+from sqlalchemy import insert
+from app.cache import user_key
+from app.models import User
+
+grpc = pytest.importorskip("grpc")
+
+from app.api.grpc.protos import user_pb2, user_pb2_grpc  # noqa: E402
+from app.api.grpc.server import create_server  # noqa: E402
+
+@pytest.fixture
+async def grpc_stub(test_session_factory, test_cache):
+    server, port = create_server("127.0.0.1:0", test_session_factory, test_cache)
+    await server.start()
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        yield user_pb2_grpc.UserServiceStub(channel)
+    await server.stop(None)
+
+@pytest.fixture
+async def grpc_users(test_session):
+    prefix = uuid.uuid4().hex[:8]
+    result = await test_session.scalars(
+        insert(User).returning(User.id),
+        [
+            {
+                "email": f"grpc{prefix}{i}@example.com",
+                "username": f"grpc{prefix}{i}",
+                "hashed_password": "x",
+                "is_active": True,
+            }
+            for i in range(25)
+        ],
+    )
+    ids = result.all()
+    await test_session.commit()
+    return ids
+
+@pytest.mark.integration
+class TestUserGrpc:
+    """Integration tests for the gRPC user service"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_create_and_get_user(self, grpc_stub):
+        """Test a user created over gRPC can be read back"""
+        unique = uuid.uuid4().hex[:8]
+        created = await grpc_stub.CreateUser(user_pb2.CreateUserRequest(
+            email=f"grpc{unique}@example.com", username=f"grpc{unique}", password="secret"
+        ))
+        
+        fetched = await grpc_stub.GetUser(user_pb2.GetUserRequest(user_id=created.id))
+        
+        assert fetched.email == f"grpc{unique}@example.com"
+        assert fetched.is_active
+        assert fetched.created_at
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_create_user_invalidates_cache(self, grpc_stub, test_cache, monkeypatch):
+        """Test CreateUser evicts the new id from the cache shared with the REST API"""
+        deleted = []
+        delete = test_cache.backend.delete
+        
+        async def recording_delete(*keys):
+            deleted.extend(keys)
+            await delete(*keys)
+        
+        monkeypatch.setattr(test_cache.backend, "delete", recording_delete)
+        unique = uuid.uuid4().hex[:8]
+        created = await grpc_stub.CreateUser(user_pb2.CreateUserRequest(
+            email=f"grpc{unique}@example.com", username=f"grpc{unique}", password="secret"
+        ))
+        
+        assert deleted == [user_key(created.id)]
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_email_and_missing_user(self, grpc_stub, grpc_users):
+        """Test errors map to ALREADY_EXISTS and NOT_FOUND"""
+        existing = await grpc_stub.GetUser(user_pb2.GetUserRequest(user_id=grpc_users[0]))
+        
+        with pytest.raises(grpc.aio.AioRpcError) as duplicate:
+            await grpc_stub.CreateUser(user_pb2.CreateUserRequest(
+                email=existing.email, username=uuid.uuid4().hex, password="secret"
+            ))
+        with pytest.raises(grpc.aio.AioRpcError) as missing:
+            await grpc_stub.GetUser(user_pb2.GetUserRequest(user_id=987654))
+        
+        assert duplicate.value.code() == grpc.StatusCode.ALREADY_EXISTS
+        assert missing.value.code() == grpc.StatusCode.NOT_FOUND
+    
+    @pytest.mark.asyncio
+    async def test_stream_users_in_batches(self, grpc_stub, grpc_users):
+        """Test StreamUsers yields every user after the cursor in id order"""
+        after_id = grpc_users[4]
+        
+        streamed = [
+            user.id
+            async for user in grpc_stub.StreamUsers(
+                user_pb2.StreamUsersRequest(after_id=after_id, batch_size=7)
+            )
+        ]
+        
+        assert streamed == sorted(streamed)
+        assert set(grpc_users[5:]) <= set(streamed)
+        assert all(user_id > after_id for user_id in streamed)
+    
+    @pytest.mark.asyncio
+    async def test_stream_users_rejects_bad_batch_size(self, grpc_stub):
+        """Test an oversized batch_size is INVALID_ARGUMENT"""
+        with pytest.raises(grpc.aio.AioRpcError) as error:
+            async for _ in grpc_stub.StreamUsers(user_pb2.StreamUsersRequest(batch_size=10**6)):
+                pass
+        
+        assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    
+    @pytest.mark.asyncio
+    async def test_batch_get_users_keeps_order_and_reports_missing(self, grpc_stub, grpc_users):
+        """Test BatchGetUsers returns found users in request order plus missing ids"""
+        requested = [grpc_users[3], 987654, grpc_users[1], grpc_users[3]]
+        
+        response = await grpc_stub.BatchGetUsers(
+            user_pb2.BatchGetUsersRequest(user_ids=requested)
+        )
+        
+        assert [user.id for user in response.users] == [grpc_users[3], grpc_users[1]]
+        assert list(response.missing_ids) == [987654]
+    
+    @pytest.mark.asyncio
+    async def test_list_users(self, grpc_stub, grpc_users):
+        """Test ListUsers pages with limit and offset"""
+        response = await grpc_stub.ListUsers(user_pb2.ListUsersRequest(limit=5))
+        
+        assert len(response.users) == 5
+        assert response.total == 5
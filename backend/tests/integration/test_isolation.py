@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import func, select, text
+from app.models import Task, User
+
+@pytest.mark.integration
+@pytest.mark.regression
+class TestTestIsolation:
+    """Each test runs in a transaction that is rolled back afterwards"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("run", [1, 2])
+    async def test_fixtures_start_from_an_empty_database(self, run, test_session, sample_tasks):
+        """Test fixture rows with fixed emails never collide across tests"""
+        users = await test_session.scalar(select(func.count()).select_from(User))
+        tasks = await test_session.scalar(select(func.count()).select_from(Task))
+        
+        assert (users, tasks) == (1, 2)
+    
+    @pytest.mark.asyncio
+    async def test_app_and_test_sessions_share_the_transaction(
+        self, test_client, test_session, sample_user
+    ):
+        """Test rows committed by the app are visible to the test and vice versa"""
+        response = await test_client.get(f"/api/v1/users/{sample_user.id}")
+        assert response.status_code == 200
+        
+        response = await test_client.post(
+            f"/api/v1/tasks/?owner_id={sample_user.id}", json={"title": "From the app"}
+        )
+        
+        task = await test_session.get(Task, response.json()["id"])
+        assert task.title == "From the app"
+    
+    @pytest.mark.asyncio
+    async def test_failed_request_keeps_earlier_writes(self, test_client, test_session):
+        """Test a rolled-back request only discards its own savepoint"""
+        payload = {"email": "savepoint@example.com", "username": "savepoint", "password": "pw"}
+        assert (await test_client.post("/api/v1/users/", json=payload)).status_code == 201
+        
+        duplicate = await test_client.post("/api/v1/users/", json=payload)
+        
+        assert duplicate.status_code == 400
+        users = await test_session.scalar(select(func.count()).select_from(User))
+        assert users == 1
+    
+    @pytest.mark.asyncio
+    async def test_database_belongs_to_this_worker(self, test_session, worker_id):
+        """Test each xdist worker gets a database of its own"""
+        if test_session.bind.dialect.name == "postgresql":
+            schema = await test_session.scalar(text("SELECT current_schema()"))
+            assert schema == f"test_{worker_id}"
+        else:
+            assert test_session.bind.engine.url.database.endswith(f"test-{worker_id}.db")
@@ -1,6 +1,17 @@
 import pytest
+import csv
+import io
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.websocket.tasks import get_task_events
+from app.events import TaskEvents
+from app.main import app
 from app.models import User, Task
+from app.services.export import ndjson_chunks
+from app.services.task_service import TaskService
 import hashlib
 import uuid
 
@@ -72,6 +83,43 @@ class TestTaskEndpoints:
         assert data["title"] == "Updated Task"
         assert data["completed"] is True
     
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_patch_task_endpoint(self, test_client, user_fixture):
+        """Test PATCH changes only the fields sent and keeps stats in step"""
+        created = await test_client.post(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}",
+            json={"title": "Partial", "description": "Kept"},
+        )
+        url = f"/api/v1/tasks/{created.json()['id']}"
+        
+        completed = await test_client.patch(url, json={"completed": True})
+        cleared = await test_client.patch(url, json={"description": None})
+        unchanged = await test_client.patch(url, json={})
+        stats = await test_client.get(f"/api/v1/users/{user_fixture.id}/stats")
+        
+        assert completed.status_code == 200
+        assert (completed.json()["title"], completed.json()["description"]) == ("Partial", "Kept")
+        assert completed.json()["completed"] is True
+        assert cleared.json()["description"] is None and cleared.json()["completed"] is True
+        assert unchanged.json() == cleared.json()
+        assert (stats.json()["open"], stats.json()["completed"]) == (0, 1)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_patch_task_bad_input(self, test_client, user_fixture):
+        """Test PATCH rejects empty or null titles and null completed, and 404s"""
+        created = await test_client.post(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}", json={"title": "Strict"}
+        )
+        url = f"/api/v1/tasks/{created.json()['id']}"
+        
+        for payload in ({"title": ""}, {"title": None}, {"completed": None}):
+            assert (await test_client.patch(url, json=payload)).status_code == 422
+        missing = await test_client.patch("/api/v1/tasks/999999", json={"title": "Nope"})
+        
+        assert missing.status_code == 404
+    
     @pytest.mark.asyncio
     @pytest.mark.smoke
     async def test_list_tasks_endpoint(self, test_client, test_session, user_fixture):
@@ -89,4 +137,448 @@ class TestTaskEndpoints:
         
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 3
\ No newline at end of file
+        assert len(data) == 3
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_list_tasks_cursor_pagination(self, test_client, test_session, user_fixture):
+        """Test walking task pages with next_cursor"""
+        for i in range(5):
+            test_session.add(Task(title=f"Paged {i}", owner_id=user_fixture.id))
+        await test_session.commit()
+        
+        seen = []
+        url = f"/api/v1/tasks/?owner_id={user_fixture.id}&limit=2"
+        response = await test_client.get(url)
+        while True:
+            assert response.status_code == 200
+            seen.extend(task["title"] for task in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = await test_client.get(f"{url}&cursor={cursor}")
+        
+        assert seen == [f"Paged {i}" for i in range(5)]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_list_tasks_descending_id_cursor(self, test_client, test_session, user_fixture):
+        """Test -id pages continue downwards and reject cursors from sort=id"""
+        for i in range(5):
+            test_session.add(Task(title=f"Paged {i}", owner_id=user_fixture.id))
+        await test_session.commit()
+        base = f"/api/v1/tasks/?owner_id={user_fixture.id}&limit=2"
+        
+        first = await test_client.get(f"{base}&sort=-id")
+        cursor = first.headers["X-Next-Cursor"]
+        second = await test_client.get(f"{base}&sort=-id&cursor={cursor}")
+        ascending_cursor = (await test_client.get(base)).headers["X-Next-Cursor"]
+        
+        assert [task["title"] for task in first.json() + second.json()] == [
+            "Paged 4", "Paged 3", "Paged 2", "Paged 1"
+        ]
+        assert (await test_client.get(f"{base}&sort=id&cursor={cursor}")).status_code == 400
+        mismatched = await test_client.get(f"{base}&sort=-id&cursor={ascending_cursor}")
+        assert mismatched.status_code == 400
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_list_tasks_invalid_cursor(self, test_client, user_fixture):
+        """Test a malformed cursor returns 400"""
+        response = await test_client.get(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}&cursor=bogus"
+        )
+        
+        assert response.status_code == 400
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_list_tasks_filters_and_sorts(self, test_client, test_session, user_fixture):
+        """Test completed and timestamp range filters with a descending sort"""
+        day = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        for i in range(6):
+            test_session.add(
+                Task(
+                    title=f"Dated {i}",
+                    owner_id=user_fixture.id,
+                    completed=i % 2 == 0,
+                    created_at=day + timedelta(days=i),
+                    updated_at=day + timedelta(days=10 - i),
+                )
+            )
+        await test_session.commit()
+        
+        url = f"/api/v1/tasks/?owner_id={user_fixture.id}"
+        completed = await test_client.get(
+            url,
+            params={
+                "completed": "true",
+                "created_after": "2024-03-02T00:00:00Z",
+                "created_before": "2024-03-06T02:00:00+02:00",
+                "sort": "-created_at",
+            },
+        )
+        by_update = await test_client.get(
+            url, params={"updated_before": "2024-03-09T00:00:00Z", "sort": "updated_at"}
+        )
+        bad_sort = await test_client.get(url, params={"sort": "title"})
+        
+        assert [task["title"] for task in completed.json()] == ["Dated 4", "Dated 2"]
+        assert [task["title"] for task in by_update.json()] == [
+            "Dated 5", "Dated 4", "Dated 3"
+        ]
+        assert bad_sort.status_code == 422
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_list_tasks_sorted_cursor_pagination(
+        self, test_client, test_session, user_fixture
+    ):
+        """Test pages sorted by a timestamp continue across equal timestamps"""
+        day = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            test_session.add(
+                Task(
+                    title=f"Tied {i}",
+                    owner_id=user_fixture.id,
+                    created_at=day + timedelta(days=i // 2),
+                )
+            )
+        await test_session.commit()
+        
+        seen = []
+        url = f"/api/v1/tasks/?owner_id={user_fixture.id}&limit=2&sort=-created_at"
+        response = await test_client.get(url)
+        first_cursor = response.headers["X-Next-Cursor"]
+        while True:
+            assert response.status_code == 200
+            seen.extend(task["title"] for task in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = await test_client.get(f"{url}&cursor={cursor}")
+        mismatched = await test_client.get(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}&sort=created_at&cursor={first_cursor}"
+        )
+        
+        assert seen == ["Tied 4", "Tied 3", "Tied 2", "Tied 1", "Tied 0"]
+        assert mismatched.status_code == 400
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_create_tasks_bulk_endpoint(self, test_client, user_fixture):
+        """Test creating many tasks in one request"""
+        payload = [
+            {"title": f"Bulk {i}", "completed": i % 2 == 0}
+            for i in range(7)
+        ]
+        
+        response = await test_client.post(
+            f"/api/v1/tasks/bulk?owner_id={user_fixture.id}",
+            json=payload
+        )
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert [task["title"] for task in data] == [f"Bulk {i}" for i in range(7)]
+        assert all(task["owner_id"] == user_fixture.id for task in data)
+        assert all(task["created_at"] for task in data)
+        
+        listed = await test_client.get(f"/api/v1/tasks/?owner_id={user_fixture.id}&limit=20")
+        assert len(listed.json()) == 7
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_create_tasks_bulk_reports_invalid_items(self, test_client, user_fixture):
+        """Test bulk creation rejects the batch and reports each invalid item"""
+        payload = [{"title": "Valid"}, {"title": ""}, {"title": "Also valid"}, {}]
+        
+        response = await test_client.post(
+            f"/api/v1/tasks/bulk?owner_id={user_fixture.id}",
+            json=payload
+        )
+        
+        assert response.status_code == 422
+        assert sorted({error["loc"][1] for error in response.json()["detail"]}) == [1, 3]
+        listed = await test_client.get(f"/api/v1/tasks/?owner_id={user_fixture.id}")
+        assert listed.json() == []
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_get_task_is_cached_and_invalidated_on_update(
+        self, test_client, test_cache, user_fixture
+    ):
+        """Test repeated reads hit the cache and updates are visible immediately"""
+        create_response = await test_client.post(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}",
+            json={"title": "Cached"}
+        )
+        task_id = create_response.json()["id"]
+        
+        await test_client.get(f"/api/v1/tasks/{task_id}")
+        hits = test_cache.hits
+        await test_client.get(f"/api/v1/tasks/{task_id}")
+        assert test_cache.hits == hits + 1
+        
+        await test_client.put(f"/api/v1/tasks/{task_id}", json={"title": "Fresh"})
+        response = await test_client.get(f"/api/v1/tasks/{task_id}")
+        assert response.json()["title"] == "Fresh"
+
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_export_tasks_ndjson(self, test_client, test_session, user_fixture):
+        """Test exporting an owner's tasks as NDJSON"""
+        for i in range(3):
+            test_session.add(Task(title=f"Export {i}", owner_id=user_fixture.id))
+        await test_session.commit()
+        
+        response = await test_client.get(f"/api/v1/tasks/export?owner_id={user_fixture.id}")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == ["Export 0", "Export 1", "Export 2"]
+        assert all(row["created_at"] for row in rows)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_export_tasks_csv(self, test_client, test_session, user_fixture):
+        """Test exporting an owner's tasks as CSV with a header row"""
+        test_session.add(Task(title="Comma, quoted", owner_id=user_fixture.id))
+        await test_session.commit()
+        
+        response = await test_client.get(
+            f"/api/v1/tasks/export?owner_id={user_fixture.id}&format=csv"
+        )
+        
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["title"] == "Comma, quoted"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    @pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc for RSS")
+    async def test_export_memory_is_bounded(self, test_session, user_fixture):
+        """Test exporting 100k tasks streams within a fixed RSS budget"""
+        def rss() -> int:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        
+        rows = 100_000
+        for start in range(0, rows, 10_000):
+            await test_session.execute(
+                insert(Task),
+                [
+                    {
+                        "title": f"Scale task {i}",
+                        "description": "x" * 100,
+                        "owner_id": user_fixture.id
+                    }
+                    for i in range(start, start + 10_000)
+                ]
+            )
+        await test_session.commit()
+        
+        exported_bytes = 0
+        lines = 0
+        baseline = peak = rss()
+        async for chunk in ndjson_chunks(TaskService(test_session).stream_tasks(user_fixture.id)):
+            exported_bytes += len(chunk)
+            lines += chunk.count("\n")
+            peak = max(peak, rss())
+        
+        assert lines == rows
+        assert peak - baseline < 16 * 1024 * 1024
+        assert exported_bytes > 16 * 1024 * 1024
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_import_tasks_ndjson(self, test_client, user_fixture):
+        """Test importing tasks from an NDJSON upload"""
+        body = "\n".join([
+            json.dumps({"title": "Imported 1", "completed": True}),
+            json.dumps({"title": ""}),
+            json.dumps({"title": "Imported 2"}),
+        ])
+        
+        response = await test_client.post(
+            f"/api/v1/tasks/import?owner_id={user_fixture.id}",
+            content=body.encode()
+        )
+        
+        assert response.status_code == 200
+        report = response.json()
+        assert report["imported"] == 2
+        assert report["rejected"] == 1
+        assert report["rejections"][0]["line"] == 2
+        
+        listed = await test_client.get(f"/api/v1/tasks/?owner_id={user_fixture.id}")
+        assert [task["title"] for task in listed.json()] == ["Imported 1", "Imported 2"]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_import_tasks_csv(self, test_client, user_fixture):
+        """Test importing tasks from a CSV upload"""
+        body = "title,description,completed\nFrom CSV,Imported,true\n"
+        
+        response = await test_client.post(
+            f"/api/v1/tasks/import?owner_id={user_fixture.id}&format=csv",
+            content=body.encode()
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+        listed = await test_client.get(f"/api/v1/tasks/?owner_id={user_fixture.id}")
+        assert listed.json()[0]["completed"] is True
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_import_tasks_evicts_cached_404(self, test_client, user_fixture):
+        """Test a task id read as missing before an import is found after it"""
+        created = await test_client.post(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}", json={"title": "Before import"}
+        )
+        next_id = created.json()["id"] + 1
+        assert (await test_client.get(f"/api/v1/tasks/{next_id}")).status_code == 404
+        
+        await test_client.post(
+            f"/api/v1/tasks/import?owner_id={user_fixture.id}",
+            content=json.dumps({"title": "Imported"}).encode()
+        )
+        
+        response = await test_client.get(f"/api/v1/tasks/{next_id}")
+        assert response.status_code == 200
+        assert response.json()["title"] == "Imported"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_metrics_use_route_templates(self, test_client, user_fixture):
+        """Test /metrics labels requests by route template, not raw path"""
+        await test_client.get("/api/v1/tasks/987654")
+        await test_client.get("/no/such/path")
+        
+        response = await test_client.get("/metrics")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'route="/api/v1/tasks/{task_id}",method="GET",status="404"' in response.text
+        assert "987654" not in response.text
+        assert 'route="<unmatched>"' in response.text
+        assert "http_requests_in_progress" in response.text
+
+    
+    @pytest.mark.asyncio
+    async def test_writes_emit_task_events(self, test_client, user_fixture):
+        """Test create, bulk create and update push coalesced events to the owner"""
+        frames = []
+        
+        async def record(frame, user_id):
+            frames.append((user_id, frame))
+        
+        events = TaskEvents(record, window=60)
+        app.dependency_overrides[get_task_events] = lambda: events
+        try:
+            created = await test_client.post(
+                f"/api/v1/tasks/?owner_id={user_fixture.id}", json={"title": "Evented"}
+            )
+            await test_client.put(
+                f"/api/v1/tasks/{created.json()['id']}",
+                json={"title": "Evented", "completed": True},
+            )
+            await test_client.post(
+                f"/api/v1/tasks/bulk?owner_id={user_fixture.id}",
+                json=[{"title": "Bulk 1"}, {"title": "Bulk 2"}],
+            )
+        finally:
+            del app.dependency_overrides[get_task_events]
+        await events.close()
+        
+        assert len(frames) == 1
+        user_id, frame = frames[0]
+        assert user_id == user_fixture.id
+        assert frame["event"] == "task_batch"
+        assert [(e["event"], e["task"]["completed"]) for e in frame["events"]] == [
+            ("task_created", True),
+            ("task_created", False),
+            ("task_created", False),
+        ]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_search_tasks_ranks_title_matches_first(self, test_client, user_fixture):
+        """Test search matches stems in title and description, title hits ranked higher"""
+        url = f"/api/v1/tasks/?owner_id={user_fixture.id}"
+        await test_client.post(url, json={"title": "Call the bank", "description": "On reports"})
+        await test_client.post(url, json={"title": "Quarterly report", "description": "Draft"})
+        await test_client.post(url, json={"title": "Unrelated", "description": "Nothing here"})
+        
+        response = await test_client.get(
+            f"/api/v1/tasks/search?owner_id={user_fixture.id}&q=reporting"
+        )
+        
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()] == ["Quarterly report", "Call the bank"]
+        assert "score" not in response.json()[0]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_search_tasks_keyset_pagination(self, test_client, test_session, user_fixture):
+        """Test walking ranked search pages with the next cursor visits every match once"""
+        for i in range(7):
+            test_session.add(Task(title=f"Invoice {i}", owner_id=user_fixture.id))
+        test_session.add(Task(title="Invoice invoice invoice", owner_id=user_fixture.id))
+        await test_session.commit()
+        
+        seen = []
+        url = f"/api/v1/tasks/search?owner_id={user_fixture.id}&q=invoice&limit=3"
+        response = await test_client.get(url)
+        while True:
+            assert response.status_code == 200
+            seen.extend(task["title"] for task in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = await test_client.get(f"{url}&cursor={cursor}")
+        
+        assert seen[0] == "Invoice invoice invoice"
+        assert sorted(seen[1:]) == [f"Invoice {i}" for i in range(7)]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_search_tasks_follows_updates_and_owner(
+        self, test_client, test_session, user_fixture
+    ):
+        """Test renamed tasks leave the index and other owners' tasks never match"""
+        other = User(email=f"other{user_fixture.id}@example.com", username=f"o{user_fixture.id}")
+        test_session.add(other)
+        await test_session.commit()
+        await test_client.post(f"/api/v1/tasks/?owner_id={other.id}", json={"title": "Budget"})
+        created = await test_client.post(
+            f"/api/v1/tasks/?owner_id={user_fixture.id}", json={"title": "Budget"}
+        )
+        
+        await test_client.put(
+            f"/api/v1/tasks/{created.json()['id']}", json={"title": "Roadmap"}
+        )
+        
+        search = f"/api/v1/tasks/search?owner_id={user_fixture.id}&q="
+        assert (await test_client.get(search + "budget")).json() == []
+        assert [t["id"] for t in (await test_client.get(search + "roadmap")).json()] == [
+            created.json()["id"]
+        ]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_search_tasks_bad_input(self, test_client, user_fixture):
+        """Test FTS syntax in q is harmless, bad cursors are 400 and empty q is 422"""
+        url = f"/api/v1/tasks/search?owner_id={user_fixture.id}"
+        
+        syntax = await test_client.get(url, params={"q": '")( OR * NEAR'})
+        cursor = await test_client.get(url, params={"q": "ok", "cursor": "bogus"})
+        empty = await test_client.get(url, params={"q": ""})
+        
+        assert (syntax.status_code, syntax.json()) == (200, [])
+        assert cursor.status_code == 400
+        assert empty.status_code == 422
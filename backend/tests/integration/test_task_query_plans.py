@@ -0,0 +1,85 @@
+import pytest
+import itertools
+from datetime import datetime
+from sqlalchemy import select, text
+from app.schemas import TaskFilters
+from app.services.task_service import TASK_READ_COLUMNS, TaskService
+from tests.fixtures.database import uses_postgres
+
+DAY = datetime(2024, 1, 1)
+RANGES = {
+    None: {},
+    "created_at": {"created_after": DAY, "created_before": DAY},
+    "updated_at": {"updated_after": DAY, "updated_before": DAY},
+}
+# (completed filtered, sort column) -> the index that serves it
+INDEXES = {
+    (False, "id"): "ix_tasks_owner_id_id",
+    (True, "id"): "ix_tasks_owner_completed_id",
+    (False, "created_at"): "ix_tasks_owner_created_at",
+    (True, "created_at"): "ix_tasks_owner_completed_created_at",
+    (False, "updated_at"): "ix_tasks_owner_updated_at",
+    (True, "updated_at"): "ix_tasks_owner_completed_updated_at",
+}
+SORTS = ("id", "-id", "created_at", "-created_at", "updated_at", "-updated_at")
+
+async def query_plan(session, filters: TaskFilters, paged: bool) -> str:
+    query = TaskService(session).list_query(
+        select(*TASK_READ_COLUMNS),
+        owner_id=1,
+        limit=20,
+        after_id=100 if paged else None,
+        filters=filters,
+        after_value=DAY if paged else None,
+    )
+    sql = query.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    result = await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return " | ".join(row[3] for row in result)
+
+@pytest.mark.integration
+@pytest.mark.skipif(uses_postgres(), reason="asserts SQLite's rule-based plans")
+class TestTaskListQueryPlans:
+    """Query-plan tests for every filter and sort combination of task listings"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "completed,sort,range_column,paged",
+        list(itertools.product((None, True), SORTS, RANGES, (False, True))),
+    )
+    async def test_listing_uses_composite_index(
+        self, test_session, completed, sort, range_column, paged
+    ):
+        """Test each listing seeks an owner index and avoids sorting when it can"""
+        filters = TaskFilters(completed=completed, sort=sort, **RANGES[range_column])
+        sort_column = sort.lstrip("-")
+        
+        plan = await query_plan(test_session, filters, paged)
+        
+        assert plan.startswith("SEARCH tasks USING INDEX ix_tasks_owner_"), plan
+        if range_column in (None, sort_column) or paged:
+            # Walked in sort order: no scan of other owners, no sort step
+            index = plan.split()[4]
+            assert index in (INDEXES[False, sort_column], INDEXES[True, sort_column]), plan
+            assert "TEMP B-TREE" not in plan, plan
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort,paged", list(itertools.product(SORTS, (False, True))))
+    async def test_completed_filter_uses_its_index(self, test_session, sort, paged):
+        """Test filtering on completed seeks the index that leads with it"""
+        filters = TaskFilters(completed=False, sort=sort)
+        
+        plan = await query_plan(test_session, filters, paged)
+        
+        assert f"INDEX {INDEXES[True, sort.lstrip('-')]} (owner_id=? AND completed=?" in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort,paged", list(itertools.product(SORTS, (False, True))))
+    async def test_unfiltered_listing_uses_owner_index(self, test_session, sort, paged):
+        """Test listings without filters seek the (owner_id, sort column, id) index"""
+        filters = TaskFilters(sort=sort)
+        
+        plan = await query_plan(test_session, filters, paged)
+        
+        assert f"INDEX {INDEXES[False, sort.lstrip('-')]} (owner_id=?" in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
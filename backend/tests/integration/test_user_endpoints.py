@@ -61,6 +61,33 @@ class TestUserEndpoints:
         response = await test_client.post("/api/v1/users/", json=payload)
         
         assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_create_duplicate_username(self, test_client):
+        """Test a taken username is a 400 rather than a server error"""
+        payload = {"email": "first@example.com", "username": "takenname", "password": "pw"}
+        
+        await test_client.post("/api/v1/users/", json=payload)
+        response = await test_client.post(
+            "/api/v1/users/", json={**payload, "email": "second@example.com"}
+        )
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Username already taken"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_duplicate_email_and_username_reports_email(self, test_client):
+        """Test a sign-up repeating both email and username always blames the email"""
+        payload = {"email": "username@example.com", "username": "bothtaken", "password": "pw"}
+        
+        await test_client.post("/api/v1/users/", json=payload)
+        response = await test_client.post("/api/v1/users/", json=payload)
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
     
     @pytest.mark.asyncio
     @pytest.mark.regression
@@ -68,4 +95,149 @@ class TestUserEndpoints:
         """Test getting non-existent user returns 404"""
         response = await test_client.get("/api/v1/users/99999")
         
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_user_task_stats(self, test_client):
+        """Test task stats follow task writes and are 404 for unknown users"""
+        user = await test_client.post(
+            "/api/v1/users/",
+            json={"email": "stats@example.com", "username": "statsuser", "password": "pw"},
+        )
+        user_id = user.json()["id"]
+        tasks_url = f"/api/v1/tasks/?owner_id={user_id}"
+        
+        empty = await test_client.get(f"/api/v1/users/{user_id}/stats")
+        task = await test_client.post(tasks_url, json={"title": "Stats task"})
+        await test_client.post(
+            f"/api/v1/tasks/bulk?owner_id={user_id}",
+            json=[{"title": "Open"}, {"title": "Done", "completed": True}],
+        )
+        await test_client.put(
+            f"/api/v1/tasks/{task.json()['id']}", json={"title": "Stats task", "completed": True}
+        )
+        stats = await test_client.get(f"/api/v1/users/{user_id}/stats")
+        missing = await test_client.get("/api/v1/users/99999/stats")
+        
+        assert empty.json() == {"user_id": user_id, "open": 0, "completed": 0, "total": 0}
+        assert stats.json() == {"user_id": user_id, "open": 1, "completed": 2, "total": 3}
+        assert missing.status_code == 404
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_list_users_cursor_pagination(self, test_client):
+        """Test cursor pages cover every user exactly once"""
+        for i in range(3):
+            await test_client.post("/api/v1/users/", json={
+                "email": f"paged{i}@example.com",
+                "username": f"paged{i}",
+                "password": "password123"
+            })
+        
+        ids = []
+        response = await test_client.get("/api/v1/users/?limit=2")
+        while True:
+            assert response.status_code == 200
+            ids.extend(user["id"] for user in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = await test_client.get(f"/api/v1/users/?limit=2&cursor={cursor}")
+        
+        assert ids == sorted(set(ids))
+        offset_response = await test_client.get(f"/api/v1/users/?limit={len(ids) + 1}")
+        assert [user["id"] for user in offset_response.json()] == ids
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_cache_stats_endpoint(self, test_client):
+        """Test cache counters are exposed"""
+        response = await test_client.get("/cache/stats")
+        
+        assert response.status_code == 200
+        assert {"hits", "misses", "errors"} <= response.json().keys()
+
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_db_pool_endpoint(self, test_client):
+        """Test pool metrics are exposed and health is ok with a free pool"""
+        response = await test_client.get("/db/pool")
+        
+        assert response.status_code == 200
+        assert {"in_use", "waiting", "timeouts", "exhausted"} <= response.json().keys()
+        health = await test_client.get("/health")
+        assert health.json()["status"] == "ok"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_health_degraded_when_pool_exhausted(self, test_client, monkeypatch):
+        """Test health reports degraded while the pool is exhausted"""
+        import app.main
+        
+        monkeypatch.setattr(app.main.pool_metrics, "waiting", 1)
+        response = await test_client.get("/health")
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == "degraded"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_server_timing_reports_queries(self, test_client):
+        """Test responses carry the request's SQL count in Server-Timing"""
+        response = await test_client.post("/api/v1/users/", json={
+            "email": "timing@example.com",
+            "username": "timinguser",
+            "password": "password123"
+        })
+        
+        assert response.status_code == 201
+        timing = response.headers["server-timing"]
+        assert timing.startswith("db;dur=")
+        assert 'desc="0 queries"' not in timing
+
+    
+    @pytest.mark.asyncio
+    @pytest.mark.smoke
+    async def test_login_endpoint(self, test_client):
+        """Test logging in with the password used at signup"""
+        payload = {
+            "email": "login@example.com",
+            "username": "loginuser",
+            "password": "password123"
+        }
+        await test_client.post("/api/v1/users/", json=payload)
+        
+        ok = await test_client.post("/api/v1/users/login", json={
+            "email": "login@example.com", "password": "password123"
+        })
+        wrong = await test_client.post("/api/v1/users/login", json={
+            "email": "login@example.com", "password": "nope"
+        })
+        
+        assert ok.status_code == 200
+        assert ok.json()["username"] == "loginuser"
+        assert wrong.status_code == 401
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_login_rehashes_legacy_password(self, test_client, test_session):
+        """Test a legacy sha256 hash is upgraded on successful login"""
+        import hashlib
+        
+        user = User(
+            email="legacy@example.com",
+            username="legacyuser",
+            hashed_password=hashlib.sha256(b"pass").hexdigest()
+        )
+        test_session.add(user)
+        await test_session.commit()
+        
+        response = await test_client.post("/api/v1/users/login", json={
+            "email": "legacy@example.com", "password": "pass"
+        })
+        
+        assert response.status_code == 200
+        await test_session.refresh(user)
+        assert user.hashed_password.startswith("scrypt$")
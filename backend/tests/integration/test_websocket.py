@@ -0,0 +1,51 @@
+import msgpack
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.api.websocket.codec import MSGPACK_SUBPROTOCOL, unpack
+from app.main import app
+
+@pytest.mark.integration
+class TestTaskWebSocket:
+    """Integration tests for the task WebSocket endpoint"""
+    
+    @pytest.mark.smoke
+    def test_task_event_round_trip(self):
+        """Test a client event is delivered back through the connection's queue"""
+        client = TestClient(app)
+        with client.websocket_connect("/ws/tasks/1") as websocket:
+            websocket.send_json({"type": "task_created", "task": {"id": 5}})
+            
+            assert websocket.receive_json() == {"event": "task_created", "task": {"id": 5}}
+    
+    def test_msgpack_subprotocol_round_trip(self):
+        """Test a client negotiating msgpack sends and receives binary frames"""
+        client = TestClient(app)
+        with client.websocket_connect(
+            "/ws/tasks/2", subprotocols=[MSGPACK_SUBPROTOCOL]
+        ) as websocket:
+            assert websocket.accepted_subprotocol == MSGPACK_SUBPROTOCOL
+            websocket.send_bytes(msgpack.packb({"type": "task_updated", "task": {"id": 6}}))
+            
+            assert unpack(websocket.receive_bytes()) == [
+                {"event": "task_updated", "task": {"id": 6}}
+            ]
+    
+    @pytest.mark.regression
+    @pytest.mark.parametrize("subprotocols,send,payload,code", [
+        ([MSGPACK_SUBPROTOCOL], "send_text", '{"type": "task_created"}', 1003),
+        ([], "send_bytes", b'{"type": "task_created"}', 1003),
+        ([], "send_text", "not json", 1007),
+        ([], "send_text", "[1, 2]", 1007),
+        ([MSGPACK_SUBPROTOCOL], "send_bytes", b"\xc1", 1007),
+    ])
+    def test_unexpected_frames_close_the_socket(self, subprotocols, send, payload, code):
+        """Test a frame of the wrong type closes with 1003 and an undecodable one with 1007"""
+        client = TestClient(app)
+        with client.websocket_connect("/ws/tasks/3", subprotocols=subprotocols) as websocket:
+            getattr(websocket, send)(payload)
+            
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_text()
+        
+        assert closed.value.code == code
@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app.query_stats import QueryStats, track_queries
+from app.schemas import TaskCreate, TaskUpdate, UserCreate
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+
+def round_trips(stats: QueryStats) -> list[str]:
+    """Statements sent, as their first words, without the test's SAVEPOINT bookkeeping"""
+    return sorted(
+        " ".join(statement.split()[:3])
+        for statement, count in stats.statements.items()
+        for _ in range(count)
+        if not statement.startswith(("SAVEPOINT", "RELEASE", "ROLLBACK"))
+    )
+
+@pytest.fixture
+async def owner(test_session):
+    return await UserService(test_session).create_user(
+        UserCreate(email="trips@example.com", username="trips", password="pw")
+    )
+
+@pytest.mark.integration
+@pytest.mark.regression
+class TestWriteRoundTrips:
+    """Query-count tests for the write paths of TaskService and UserService"""
+    
+    @pytest.mark.asyncio
+    async def test_create_user_is_one_insert(self, test_session):
+        """Test create_user needs neither an email pre-check nor a refresh"""
+        service = UserService(test_session)
+        
+        with track_queries(track_statements=True) as stats:
+            user = await service.create_user(
+                UserCreate(email="one@example.com", username="one", password="pw")
+            )
+        
+        assert round_trips(stats) == ["INSERT INTO users"]
+        assert user.id and user.created_at is not None
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_user_raises_after_one_insert(self, test_session, owner):
+        """Test a taken email fails on the unique index and leaves the session usable"""
+        service = UserService(test_session)
+        owner_id = owner.id
+        
+        with track_queries(track_statements=True) as stats:
+            with pytest.raises(IntegrityError):
+                await service.create_user(
+                    UserCreate(email="trips@example.com", username="other", password="pw")
+                )
+        
+        # The failed INSERT is the only statement, and errors are not counted
+        assert round_trips(stats) == []
+        assert (await service.get_user(owner_id)).email == "trips@example.com"
+    
+    @pytest.mark.asyncio
+    async def test_create_task_skips_refresh(self, test_session, owner):
+        """Test create_task is the INSERT ... RETURNING plus the counter update"""
+        service = TaskService(test_session)
+        
+        with track_queries(track_statements=True) as stats:
+            task = await service.create_task(TaskCreate(title="Returned"), owner.id)
+        
+        assert round_trips(stats) == ["INSERT INTO task_stats", "INSERT INTO tasks"]
+        assert task.id and task.created_at is not None and task.updated_at is not None
+    
+    @pytest.mark.asyncio
+    async def test_update_task_without_load(self, test_session, owner):
+        """Test update_task is an UPDATE ... RETURNING, plus the counters on a flip"""
+        service = TaskService(test_session)
+        task = await service.create_task(TaskCreate(title="Before"), owner.id)
+        
+        with track_queries(track_statements=True) as flipped:
+            done = await service.update_task(task.id, TaskCreate(title="After", completed=True))
+            assert (done.title, done.completed) == ("After", True)
+        with track_queries(track_statements=True) as unchanged:
+            renamed = await service.update_task(
+                task.id, TaskCreate(title="Again", completed=True)
+            )
+        
+        assert round_trips(flipped) == ["INSERT INTO task_stats", "UPDATE tasks SET"]
+        # The flip-only UPDATE matches nothing, then the plain one applies
+        assert round_trips(unchanged) == ["UPDATE tasks SET", "UPDATE tasks SET"]
+        assert (renamed.title, renamed.completed) == ("Again", True)
+    
+    @pytest.mark.asyncio
+    async def test_patch_task_is_one_update(self, test_session, owner):
+        """Test a patch that leaves completed alone is a single UPDATE"""
+        service = TaskService(test_session)
+        task = await service.create_task(
+            TaskCreate(title="Patched", description="Kept"), owner.id
+        )
+        
+        with track_queries(track_statements=True) as stats:
+            patched = await service.patch_task(task.id, TaskUpdate(title="Renamed"))
+        
+        assert round_trips(stats) == ["UPDATE tasks SET"]
+        assert (patched.title, patched.description) == ("Renamed", "Kept")
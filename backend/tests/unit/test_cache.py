@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+from datetime import datetime
+from app.cache import Cache, MemoryCacheBackend
+from app.schemas import UserRead
+
+def make_user(user_id: int = 1) -> UserRead:
+    return UserRead(
+        id=user_id,
+        email="cache@example.com",
+        username="cacheuser",
+        is_active=True,
+        created_at=datetime(2025, 1, 1)
+    )
+
+class FailingBackend(MemoryCacheBackend):
+    async def get(self, key):
+        raise ConnectionError("backend down")
+
+@pytest.mark.unit
+class TestCache:
+    """Unit tests for the read-through cache"""
+    
+    @pytest.mark.asyncio
+    async def test_read_through_counts_hits_and_misses(self):
+        """Test the loader runs once and later reads are hits"""
+        cache = Cache(MemoryCacheBackend())
+        calls = 0
+        
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return make_user()
+        
+        first = await cache.get_or_load("user:1", UserRead, loader)
+        second = await cache.get_or_load("user:1", UserRead, loader)
+        
+        assert first == second == make_user()
+        assert calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    @pytest.mark.asyncio
+    async def test_missing_rows_are_cached_until_invalidated(self):
+        """Test negative caching and invalidation"""
+        cache = Cache(MemoryCacheBackend())
+        
+        async def missing():
+            return None
+        
+        async def found():
+            return make_user()
+        
+        assert await cache.get_or_load("user:1", UserRead, missing) is None
+        assert await cache.get_or_load("user:1", UserRead, found) is None
+        await cache.invalidate("user:1")
+        assert await cache.get_or_load("user:1", UserRead, found) == make_user()
+    
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        """Test expired entries are reloaded"""
+        cache = Cache(MemoryCacheBackend(), ttl=0)
+        calls = 0
+        
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return make_user()
+        
+        await cache.get_or_load("user:1", UserRead, loader)
+        await cache.get_or_load("user:1", UserRead, loader)
+        
+        assert calls == 2
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_concurrent_misses_share_one_load(self):
+        """Test stampede protection runs the loader once for concurrent misses"""
+        cache = Cache(MemoryCacheBackend())
+        calls = 0
+        
+        async def slow_loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return make_user()
+        
+        results = await asyncio.gather(
+            *(cache.get_or_load("user:1", UserRead, slow_loader) for _ in range(20))
+        )
+        
+        assert calls == 1
+        assert all(result == make_user() for result in results)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_cancelled_load_is_retried_by_waiters(self):
+        """Test cancelling the loading call does not cancel callers waiting on it"""
+        cache = Cache(MemoryCacheBackend())
+        calls = 0
+        
+        async def slow_loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return make_user()
+        
+        leader = asyncio.create_task(cache.get_or_load("user:1", UserRead, slow_loader))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(cache.get_or_load("user:1", UserRead, slow_loader))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        
+        results = await asyncio.gather(*followers)
+        
+        assert leader.cancelled()
+        assert calls == 2
+        assert all(result == make_user() for result in results)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_backend_failure_falls_back_to_loader(self):
+        """Test a broken backend degrades to a database read"""
+        cache = Cache(FailingBackend())
+        
+        async def loader():
+            return make_user()
+        
+        assert await cache.get_or_load("user:1", UserRead, loader) == make_user()
+        assert cache.errors == 1
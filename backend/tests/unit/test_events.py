@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from datetime import datetime
+from app.events import TaskEvents
+from app.schemas import TaskRead
+
+def make_task(task_id: int, owner_id: int = 1, title: str = "Task") -> TaskRead:
+    return TaskRead(
+        id=task_id,
+        title=title,
+        description=None,
+        owner_id=owner_id,
+        completed=False,
+        created_at=datetime(2024, 1, 1),
+    )
+
+class Recorder:
+    def __init__(self, fail: bool = False):
+        self.frames = []
+        self.fail = fail
+    
+    async def __call__(self, frame, user_id):
+        if self.fail:
+            raise RuntimeError("backplane down")
+        self.frames.append((user_id, frame))
+
+@pytest.mark.unit
+class TestTaskEvents:
+    """Unit tests for coalesced task events"""
+    
+    @pytest.mark.asyncio
+    async def test_single_event_sent_as_own_frame(self):
+        """Test a lone event keeps the plain task_created frame format"""
+        sent = Recorder()
+        events = TaskEvents(sent, window=0)
+        
+        events.task_created(make_task(1))
+        await asyncio.sleep(0.01)
+        
+        assert len(sent.frames) == 1
+        user_id, frame = sent.frames[0]
+        assert user_id == 1
+        assert frame["event"] == "task_created"
+        assert frame["task"]["id"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_burst_is_batched_per_user(self):
+        """Test events within one window become one frame per user"""
+        sent = Recorder()
+        events = TaskEvents(sent, window=0.01)
+        
+        for task_id in range(1, 101):
+            events.task_created(make_task(task_id, owner_id=1))
+        events.task_created(make_task(101, owner_id=2))
+        await asyncio.sleep(0.05)
+        
+        frames = dict(sent.frames)
+        assert len(sent.frames) == 2
+        assert frames[1]["event"] == "task_batch"
+        assert len(frames[1]["events"]) == 100
+        assert frames[2]["event"] == "task_created"
+        assert events.stats()["frames"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_repeated_events_for_task_collapse(self):
+        """Test a created-then-updated task is sent once as created with latest state"""
+        sent = Recorder()
+        events = TaskEvents(sent, window=0.01)
+        
+        events.task_created(make_task(1, title="first"))
+        events.task_updated(make_task(1, title="second"))
+        events.task_updated(make_task(2, title="a"))
+        events.task_updated(make_task(2, title="b"))
+        await events.close()
+        
+        _, frame = sent.frames[0]
+        assert [(e["event"], e["task"]["title"]) for e in frame["events"]] == [
+            ("task_created", "second"),
+            ("task_updated", "b"),
+        ]
+        assert events.coalesced == 2
+    
+    @pytest.mark.asyncio
+    async def test_large_batches_are_split(self):
+        """Test one user's batch is capped at max_batch events per frame"""
+        sent = Recorder()
+        events = TaskEvents(sent, window=0.01, max_batch=4)
+        
+        for task_id in range(10):
+            events.task_created(make_task(task_id))
+        await events.close()
+        
+        assert [len(frame["events"]) for _, frame in sent.frames[:2]] == [4, 4]
+        assert len(sent.frames) == 3
+    
+    @pytest.mark.asyncio
+    async def test_delivery_latency_is_observed(self):
+        """Test every sent event lands in the latency histogram"""
+        sent = Recorder()
+        events = TaskEvents(sent, window=0.01)
+        
+        events.task_created(make_task(1))
+        events.task_created(make_task(2))
+        await asyncio.sleep(0.05)
+        
+        assert events.latency.count == 2
+        assert events.latency.total >= 0.02
+        assert "ws_task_event_delivery_seconds_count 2" in events.render()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_send_failure_is_counted_not_raised(self):
+        """Test a failing sink does not break later flushes"""
+        events = TaskEvents(Recorder(fail=True), window=0)
+        
+        events.task_created(make_task(1))
+        await events.close()
+        
+        assert events.errors == 1
+        assert events.latency.count == 0
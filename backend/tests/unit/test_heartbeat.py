@@ -0,0 +1,49 @@
+import pytest
+from app.api.websocket.heartbeat import TimerWheel
+
+class Item:
+    slot = None
+
+@pytest.mark.unit
+class TestTimerWheel:
+    """Unit tests for the heartbeat timer wheel"""
+    
+    def test_item_fires_after_its_delay(self):
+        """Test an item is returned by the advance that reaches its delay"""
+        wheel = TimerWheel(tick=1.0, max_delay=5.0)
+        item = Item()
+        wheel.schedule(item, 3.0)
+        
+        fired = [wheel.advance() for _ in range(3)]
+        
+        assert fired[:2] == [set(), set()]
+        assert fired[2] == {item}
+        assert item.slot is None
+        assert len(wheel) == 0
+    
+    def test_cancel_and_reschedule(self):
+        """Test cancelled items never fire and rescheduling moves an item"""
+        wheel = TimerWheel(tick=1.0, max_delay=5.0)
+        cancelled, moved = Item(), Item()
+        wheel.schedule(cancelled, 1.0)
+        wheel.schedule(moved, 1.0)
+        wheel.cancel(cancelled)
+        wheel.schedule(moved, 2.0)
+        
+        assert wheel.advance() == set()
+        assert wheel.advance() == {moved}
+    
+    def test_delays_are_rounded_up_and_capped(self):
+        """Test sub-tick delays wait one tick and long delays are capped at max_delay"""
+        wheel = TimerWheel(tick=1.0, max_delay=2.0)
+        short, long = Item(), Item()
+        wheel.schedule(short, 0.1)
+        wheel.schedule(long, 100.0)
+        
+        assert wheel.advance() == {short}
+        assert wheel.advance() == {long}
+    
+    def test_invalid_tick_rejected(self):
+        """Test a tick larger than the wheel fails fast"""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=2.0, max_delay=1.0)
@@ -0,0 +1,28 @@
+import pytest
+from app.metrics import RequestMetrics
+
+@pytest.mark.unit
+class TestRequestMetrics:
+    """Unit tests for request metrics rendering"""
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test observations land in the right buckets and render cumulatively"""
+        metrics = RequestMetrics(buckets=(0.1, 1.0))
+        metrics.observe("/items/{item_id}", "GET", 200, 0.05)
+        metrics.observe("/items/{item_id}", "GET", 200, 0.5)
+        metrics.observe("/items/{item_id}", "GET", 200, 5.0)
+        
+        text = metrics.render()
+        labels = 'route="/items/{item_id}",method="GET",status="200"'
+        assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"http_request_duration_seconds_count{{{labels}}} 3" in text
+        assert f"http_requests_total{{{labels}}} 3" in text
+    
+    def test_boundary_value_is_inclusive(self):
+        """Test a value equal to a bucket bound counts in that bucket"""
+        metrics = RequestMetrics(buckets=(0.1,))
+        metrics.observe("/", "GET", 200, 0.1)
+        
+        assert metrics.series[("/", "GET", 200)].counts == [1, 0]
@@ -0,0 +1,81 @@
+import pytest
+from datetime import datetime
+from app.models import Task
+from app.services.pagination import (
+    decode_cursor,
+    decode_keyset_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_keyset_cursor,
+    encode_rank_cursor,
+    next_cursor,
+    next_keyset_cursor,
+)
+
+@pytest.mark.unit
+class TestCursorPagination:
+    """Unit tests for opaque cursor encoding"""
+    
+    def test_cursor_round_trip(self):
+        """Test decoding an encoded cursor returns the original id"""
+        cursor = encode_cursor(12345)
+        assert "12345" not in cursor
+        assert decode_cursor(cursor) == 12345
+    
+    @pytest.mark.regression
+    @pytest.mark.parametrize("cursor", ["", "not-base64!", encode_cursor(1)[:-1] + "*", "aWQ6YWJj"])
+    def test_decode_invalid_cursor(self, cursor):
+        """Test malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+    
+    def test_next_cursor_on_full_page(self):
+        """Test a full page yields a cursor pointing at its last row"""
+        tasks = [Task(id=3, title="a"), Task(id=7, title="b")]
+        assert decode_cursor(next_cursor(tasks, limit=2)) == 7
+    
+    def test_next_cursor_on_last_page(self):
+        """Test a short page yields no cursor"""
+        assert next_cursor([Task(id=3, title="a")], limit=2) is None
+    
+    def test_rank_cursor_round_trip(self):
+        """Test a rank cursor keeps the exact score and id"""
+        score = -0.1 / 3
+        assert decode_rank_cursor(encode_rank_cursor(score, 42)) == (score, 42)
+    
+    @pytest.mark.regression
+    @pytest.mark.parametrize("cursor", ["", encode_cursor(5), "cmFuazp4OjE", "cmFuazoxLjU6YQ"])
+    def test_decode_invalid_rank_cursor(self, cursor):
+        """Test id cursors and malformed rank cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            decode_rank_cursor(cursor)
+    
+    def test_next_keyset_cursor_keeps_timestamp(self):
+        """Test a keyset cursor carries the sort value and id of the last row"""
+        created_at = datetime(2024, 3, 1, 12, 30, 0, 250000)
+        tasks = [Task(id=3, title="a"), Task(id=9, title="b", created_at=created_at)]
+        
+        value, last_id = decode_keyset_cursor(
+            next_keyset_cursor(tasks, 2, "-created_at", "created_at"), "-created_at"
+        )
+        
+        assert (datetime.fromisoformat(value), last_id) == (created_at, 9)
+        assert next_keyset_cursor(tasks[:1], 2, "-created_at", "created_at") is None
+    
+    @pytest.mark.regression
+    def test_decode_keyset_cursor_for_other_sort(self):
+        """Test a cursor from one sort order is rejected by another"""
+        cursor = encode_keyset_cursor("created_at", "2024-03-01 00:00:00", 4)
+        with pytest.raises(ValueError):
+            decode_keyset_cursor(cursor, "-created_at")
+    
+    @pytest.mark.regression
+    def test_decode_id_cursor_for_other_direction(self):
+        """Test an id cursor is only accepted by the direction that produced it"""
+        descending = encode_cursor(4, "-id")
+        
+        assert decode_cursor(descending, "-id") == 4
+        with pytest.raises(ValueError):
+            decode_cursor(descending)
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(4), "-id")
@@ -0,0 +1,104 @@
+import asyncio
+import hashlib
+import threading
+import pytest
+from app.passwords import (
+    LegacySha256Algorithm,
+    PasswordHasher,
+    Pbkdf2Algorithm,
+    ScryptAlgorithm,
+)
+
+def make_hasher(default: str = "scrypt", max_concurrency: int = 2) -> PasswordHasher:
+    return PasswordHasher(
+        [ScryptAlgorithm(n=2**10), Pbkdf2Algorithm(iterations=1000), LegacySha256Algorithm()],
+        default=default,
+        max_concurrency=max_concurrency,
+    )
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    """Unit tests for password hashing"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", ["scrypt", "pbkdf2_sha256"])
+    async def test_hash_and_verify(self, algorithm):
+        """Test hashes are salted and verify only the right password"""
+        hasher = make_hasher(default=algorithm)
+        
+        first = await hasher.hash("secret")
+        second = await hasher.hash("secret")
+        
+        assert first.startswith(f"{algorithm}$")
+        assert first != second
+        assert await hasher.verify("secret", first)
+        assert not await hasher.verify("wrong", first)
+        assert not hasher.needs_rehash(first)
+    
+    @pytest.mark.asyncio
+    async def test_legacy_sha256_verifies_and_needs_rehash(self):
+        """Test legacy unsalted sha256 hashes still verify and are flagged for rehash"""
+        hasher = make_hasher()
+        legacy = hashlib.sha256(b"password").hexdigest()
+        
+        assert await hasher.verify("password", legacy)
+        assert hasher.needs_rehash(legacy)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_changed_parameters_need_rehash(self):
+        """Test hashes made with weaker parameters are flagged for rehash"""
+        weak = ScryptAlgorithm(n=2**8).hash("secret")
+        
+        assert make_hasher().needs_rehash(weak)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_malformed_hash_does_not_verify(self):
+        """Test unknown or broken encodings are rejected instead of raising"""
+        hasher = make_hasher()
+        
+        assert not await hasher.verify("secret", "hashed_pass")
+        assert not await hasher.verify("secret", "scrypt$broken")
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_dummy_verify_costs_one_verification(self):
+        """Test logins without a stored hash still run the default KDF once"""
+        hasher = make_hasher()
+        await hasher.verify_dummy("warm-up")
+        operations = hasher.operations
+        
+        verified = []
+        verify = hasher.default.verify
+        
+        def recording_verify(password, encoded):
+            verified.append(encoded.split("$", 1)[0])
+            return verify(password, encoded)
+        
+        hasher.default.verify = recording_verify
+        await hasher.verify_dummy("secret")
+        
+        assert verified == ["scrypt"]
+        assert hasher.operations == operations + 1
+    
+    @pytest.mark.asyncio
+    async def test_hashing_runs_off_loop_with_bounded_concurrency(self):
+        """Test hashes run in worker threads and never exceed max_concurrency"""
+        hasher = make_hasher(max_concurrency=2)
+        loop_thread = threading.get_ident()
+        threads = set()
+        peak = 0
+        
+        def slow_hash(password):
+            nonlocal peak
+            threads.add(threading.get_ident())
+            peak = max(peak, hasher.in_progress)
+            return password
+        
+        hasher.default.hash = slow_hash
+        await asyncio.gather(*(hasher.hash(str(i)) for i in range(8)))
+        
+        assert loop_thread not in threads
+        assert peak <= 2
+        assert hasher.stats()["operations"] == 8
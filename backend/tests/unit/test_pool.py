@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.config import Settings
+from app.database import pool_options
+from app.pool import InstrumentedPool, instrument_engine
+
+@pytest.fixture
+async def small_pool_engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    await engine.dispose()
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Unit tests for connection pool instrumentation"""
+    
+    def test_pool_options_from_settings(self):
+        """Test pool settings are passed to the engine for server databases"""
+        settings = Settings(DATABASE_URL="postgresql://u:p@db/app", DB_POOL_SIZE=20)
+        
+        options = pool_options(settings)
+        
+        assert options["poolclass"] is InstrumentedPool
+        assert options["pool_size"] == 20
+        assert pool_options(Settings(DATABASE_URL="sqlite+aiosqlite:///:memory:")) == {}
+    
+    @pytest.mark.asyncio
+    async def test_checkouts_and_waits_are_counted(self, small_pool_engine):
+        """Test checkout events and wait timings are recorded"""
+        metrics = instrument_engine(small_pool_engine)
+        
+        async with small_pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            snapshot = metrics.snapshot(small_pool_engine.sync_engine.pool)
+            assert snapshot["in_use"] == 1
+            assert snapshot["exhausted"] is True
+        
+        snapshot = metrics.snapshot(small_pool_engine.sync_engine.pool)
+        assert snapshot["in_use"] == 0
+        assert snapshot["exhausted"] is False
+        assert snapshot["checkouts"] == 1
+        assert snapshot["connects"] == 1
+        assert metrics.wait_count == 1
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_checkout_timeouts_are_counted(self, small_pool_engine):
+        """Test a checkout that times out on a full pool is recorded"""
+        metrics = instrument_engine(small_pool_engine)
+        
+        async with small_pool_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with small_pool_engine.connect():
+                    pass
+        
+        snapshot = metrics.snapshot(small_pool_engine.sync_engine.pool)
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_ms_max"] >= 50
+        assert snapshot["waiting"] == 0
@@ -0,0 +1,66 @@
+import logging
+import pytest
+from fastapi import FastAPI
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.query_stats import QueryStatsMiddleware, instrument_queries, track_queries
+
+@pytest.fixture
+async def counted_engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_queries(engine)
+    yield engine
+    await engine.dispose()
+
+@pytest.mark.unit
+class TestQueryStats:
+    """Unit tests for per-request SQL accounting"""
+    
+    @pytest.mark.asyncio
+    async def test_track_queries_counts_statements(self, counted_engine):
+        """Test statements inside track_queries are counted and timed"""
+        async with counted_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            with track_queries(track_statements=True) as stats:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+                await conn.execute(text("SELECT 2"))
+        
+        assert stats.count == 3
+        assert stats.seconds > 0
+        assert stats.repeated(threshold=2) == {"SELECT 2": 2}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_failed_statement_does_not_skew_timing(self, counted_engine):
+        """Test a failing statement leaves no stale start time behind"""
+        async with counted_engine.connect() as conn:
+            with track_queries() as stats:
+                with pytest.raises(Exception):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.execute(text("SELECT 1"))
+            assert conn.sync_connection.info["query_started"] == []
+        
+        assert stats.count == 1
+    
+    @pytest.mark.asyncio
+    async def test_middleware_sets_server_timing_and_flags_repeats(self, counted_engine, caplog):
+        """Test the middleware reports queries in Server-Timing and logs N+1 in debug"""
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, debug=True, repeat_threshold=3)
+        
+        @app.get("/items")
+        async def items():
+            async with counted_engine.connect() as conn:
+                for _ in range(3):
+                    await conn.execute(text("SELECT 1"))
+            return []
+        
+        with caplog.at_level(logging.INFO, logger="app.query_stats"):
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                response = await client.get("/items")
+        
+        assert 'desc="3 queries"' in response.headers["server-timing"]
+        assert [getattr(record, "db_queries", None) for record in caplog.records][0] == 3
+        assert any("Possible N+1" in record.message for record in caplog.records)
@@ -0,0 +1,83 @@
+import pytest
+from collections import Counter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.models import Task, TaskStats, User
+from app.schemas import TaskRead
+from app.seeding import TASK_COLUMNS, DatasetGenerator, SeedSpec, seed_database
+from app.services.user_service import UserService
+
+def tasks(spec: SeedSpec) -> list[dict]:
+    generator = DatasetGenerator(spec, "hash")
+    return [dict(zip(TASK_COLUMNS, row)) for batch in generator.task_batches() for row in batch]
+
+@pytest.fixture
+async def empty_engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+@pytest.mark.unit
+class TestDatasetGenerator:
+    """Unit tests for synthetic dataset generation"""
+    
+    def test_same_seed_same_rows(self):
+        """Test generation is deterministic per seed and batch size does not matter"""
+        spec = SeedSpec(users=50, tasks=1000, seed=7)
+        
+        assert tasks(spec) == tasks(SeedSpec(users=50, tasks=1000, seed=7, batch_size=64))
+        assert tasks(spec) != tasks(SeedSpec(users=50, tasks=1000, seed=8))
+    
+    def test_tasks_per_owner_are_skewed(self):
+        """Test a few owners hold most tasks while uniform skew spreads them"""
+        skewed = Counter(task["owner_id"] for task in tasks(SeedSpec(users=100, tasks=10000)))
+        even = Counter(
+            task["owner_id"] for task in tasks(SeedSpec(users=100, tasks=10000, skew=0))
+        )
+        
+        assert sum(count for _, count in skewed.most_common(10)) > 5000
+        assert max(even.values()) < 200
+    
+    def test_completed_share_and_timestamps(self):
+        """Test completed share, monotonic creation times and updates after creation"""
+        spec = SeedSpec(users=10, tasks=5000, completed_share=0.3)
+        rows = tasks(spec)
+        
+        completed = sum(task["completed"] for task in rows) / len(rows)
+        assert 0.27 < completed < 0.33
+        created = [task["created_at"] for task in rows]
+        assert created == sorted(created)
+        assert spec.start <= created[0] and created[-1] <= spec.start + spec.span
+        assert all(task["updated_at"] >= task["created_at"] for task in rows)
+
+@pytest.mark.unit
+class TestSeedDatabase:
+    """Unit tests for bulk-loading a dataset"""
+    
+    @pytest.mark.asyncio
+    async def test_seed_sqlite(self, empty_engine):
+        """Test rows load through multi-row inserts and read back through the app"""
+        spec = SeedSpec(users=20, tasks=3000, batch_size=1000)
+        
+        report = await seed_database(empty_engine, spec)
+        
+        assert (report.users, report.tasks) == (20, 3000)
+        Session = sessionmaker(empty_engine, class_=AsyncSession, expire_on_commit=False)
+        async with Session() as session:
+            assert await session.scalar(select(func.count()).select_from(Task)) == 3000
+            counted = await session.execute(
+                select(func.sum(TaskStats.open_tasks), func.sum(TaskStats.completed_tasks))
+            )
+            open_tasks, completed_tasks = counted.one()
+            assert open_tasks + completed_tasks == 3000 and 0 < completed_tasks < 3000
+            task = await session.get(Task, 3000)
+            assert TaskRead.model_validate(task).created_at.year in (2023, 2024)
+            user = await UserService(session).authenticate("user1@example.com", spec.password)
+            assert user is not None
+            session.add(User(email="new@example.com", username="new"))
+            await session.commit()
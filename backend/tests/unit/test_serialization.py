@@ -0,0 +1,52 @@
+import json
+import pytest
+from collections import namedtuple
+from datetime import datetime, timezone
+from fastapi.encoders import jsonable_encoder
+from app.main import app
+from app.models import Task
+from app.schemas import TaskRead
+from app.services import serialization
+from app.services.serialization import ListEncoder
+
+Row = namedtuple("Row", "id title description owner_id completed created_at updated_at")
+
+ROWS = [
+    Row(1, "Naive", None, 1, False, datetime(2024, 1, 1, 12, 0, 0, 123456), None),
+    Row(2, "Aware", "d", 1, True, datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 8, 30, tzinfo=timezone.utc)),
+]
+
+@pytest.mark.unit
+class TestListEncoder:
+    """Unit tests for the list response fast path"""
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_default_response_encoding(self, monkeypatch, use_orjson):
+        """Test output equals what response_model=list[TaskRead] would produce"""
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        dumped = [TaskRead.model_validate(row).model_dump(mode="json") for row in ROWS]
+        expected = json.dumps(jsonable_encoder(dumped), separators=(",", ":")).encode()
+        
+        assert ListEncoder(TaskRead).encode(ROWS) == expected
+    
+    def test_orm_objects_encode_like_rows(self):
+        """Test ORM objects go through the attribute path with the same output"""
+        tasks = [Task(**row._asdict()) for row in ROWS]
+        
+        assert ListEncoder(TaskRead).encode(tasks) == ListEncoder(TaskRead).encode(ROWS)
+    
+    def test_invalid_rows_are_rejected(self):
+        """Test rows missing schema fields fail validation"""
+        with pytest.raises(ValueError):
+            ListEncoder(TaskRead).encode([Row(1, None, None, 1, False, None, None)])
+    
+    @pytest.mark.regression
+    def test_list_endpoints_keep_response_schema(self):
+        """Test the list endpoints still document arrays of the read schemas"""
+        paths = app.openapi()["paths"]
+        
+        for path, schema in [("/api/v1/tasks/", "TaskRead"), ("/api/v1/users/", "UserRead")]:
+            content = paths[path]["get"]["responses"]["200"]["content"]["application/json"]
+            assert content["schema"]["items"]["$ref"] == f"#/components/schemas/{schema}"
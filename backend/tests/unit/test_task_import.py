@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import AsyncMock
+from app.services.task_import import csv_records, import_tasks, iter_lines, ndjson_records
+
+async def chunked(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+@pytest.mark.unit
+class TestTaskImportParsing:
+    """Unit tests for incremental import parsing"""
+    
+    @pytest.mark.asyncio
+    async def test_iter_lines_across_chunk_boundaries(self):
+        """Test lines split across chunks and multi-byte characters are rejoined"""
+        data = "first\r\nсекунда\nlast".encode()
+        
+        lines = await collect(iter_lines(chunked(data, size=3)))
+        
+        assert lines == [(1, "first"), (2, "секунда"), (3, "last")]
+    
+    @pytest.mark.asyncio
+    async def test_ndjson_records_report_bad_lines(self):
+        """Test NDJSON parsing skips blanks and reports malformed lines"""
+        data = b'{"title": "a"}\n\nnot json\n[1]\n{"title": "b"}\n'
+        
+        records = await collect(ndjson_records(iter_lines(chunked(data))))
+        
+        assert records == [
+            (1, {"title": "a"}),
+            (3, "Invalid JSON"),
+            (4, "Expected a JSON object"),
+            (5, {"title": "b"}),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_csv_records_with_multiline_field(self):
+        """Test CSV parsing maps headers and keeps quoted newlines"""
+        data = b'title,description,completed\nA,"two\nlines",true\nB,,false\nC,extra,true,x\n'
+        
+        records = await collect(csv_records(iter_lines(chunked(data))))
+        
+        assert records == [
+            (2, {"title": "A", "description": "two\nlines", "completed": "true"}),
+            (4, {"title": "B", "completed": "false"}),
+            (5, "Expected 3 columns, got 4"),
+        ]
+
+@pytest.mark.unit
+class TestImportTasks:
+    """Unit tests for batched task import"""
+    
+    @pytest.mark.asyncio
+    async def test_import_batches_and_rejections(self):
+        """Test valid rows are written in batches and invalid rows are reported"""
+        service = AsyncMock()
+        
+        async def records():
+            yield 1, {"title": "one"}
+            yield 2, {"title": ""}
+            yield 3, {"title": "three"}
+            yield 4, "Invalid JSON"
+            yield 5, {"title": "five"}
+        
+        progress = []
+        report = await import_tasks(
+            service, owner_id=1, records=records(), batch_size=2,
+            on_progress=lambda r: progress.append(r.imported)
+        )
+        
+        batches = [len(call.args[0]) for call in service.create_tasks.call_args_list]
+        assert batches == [2, 1]
+        assert (report.imported, report.rejected, report.batches) == (3, 2, 2)
+        assert [rejection.line for rejection in report.rejections] == [2, 4]
+        assert "Title cannot be empty" in report.rejections[0].error
+        assert progress == [2, 3]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_import_caps_reported_rejections(self):
+        """Test every rejection is counted but only the first few are listed"""
+        async def records():
+            for line in range(1, 11):
+                yield line, "Invalid JSON"
+        
+        report = await import_tasks(
+            AsyncMock(), owner_id=1, records=records(), max_reported_rejections=3
+        )
+        
+        assert report.rejected == 10
+        assert [rejection.line for rejection in report.rejections] == [1, 2, 3]
@@ -20,17 +20,56 @@ class TestTaskService:
             completed=False
         )
         
-        async def mock_refresh(obj):
-            obj.id = 1
-        
-        db_mock.refresh = mock_refresh
-        db_mock.add = MagicMock()
+        db_mock.scalar.return_value = Task(
+            id=1, title="Test Task", owner_id=1, completed=False
+        )
         db_mock.commit = AsyncMock()
+        db_mock.get_bind = MagicMock()
         
         result = await service.create_task(task_data, owner_id=1)
         
-        db_mock.add.assert_called_once()
+        assert result.id == 1
+        db_mock.scalar.assert_called_once()
+        db_mock.commit.assert_called_once()
+        db_mock.refresh.assert_not_called()
+        stats_update = db_mock.execute.call_args.args[0]
+        assert stats_update.table.name == "task_stats"
+    
+    @pytest.mark.asyncio
+    async def test_create_tasks_chunks_inserts(self):
+        """Test bulk creation issues one INSERT per chunk and commits once"""
+        db_mock = AsyncMock()
+        service = TaskService(db_mock)
+        
+        tasks_data = [TaskCreate(title=f"Task {i}") for i in range(5)]
+        
+        result_mock = MagicMock()
+        result_mock.all.return_value = []
+        db_mock.scalars.return_value = result_mock
+        db_mock.commit = AsyncMock()
+        db_mock.get_bind = MagicMock()
+        
+        await service.create_tasks(tasks_data, owner_id=1, chunk_size=2)
+        
+        chunk_sizes = [len(call.args[1]) for call in db_mock.scalars.call_args_list]
+        assert chunk_sizes == [2, 2, 1]
         db_mock.commit.assert_called_once()
+        # One counter update for the whole batch
+        db_mock.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    async def test_create_tasks_rejects_empty_chunks(self, chunk_size):
+        """Test a chunk size below one fails instead of inserting nothing"""
+        db_mock = AsyncMock()
+        service = TaskService(db_mock)
+        
+        with pytest.raises(ValueError):
+            await service.create_tasks(
+                [TaskCreate(title="Task")], owner_id=1, chunk_size=chunk_size
+            )
+        
+        db_mock.scalars.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_list_tasks_by_owner(self):
@@ -63,24 +102,23 @@ class TestTaskServiceUpdate:
         db_mock = AsyncMock()
         service = TaskService(db_mock)
         
-        original_task = Task(
+        updated_task = Task(
             id=1,
-            title="Original",
+            title="Updated",
             owner_id=1,
-            completed=False
+            completed=True
         )
         
-        result_mock = MagicMock()
-        result_mock.scalars().first.return_value = original_task
-        db_mock.execute.return_value = result_mock
-        
-        async def mock_refresh(obj):
-            pass
-        
-        db_mock.refresh = mock_refresh
+        db_mock.scalar.return_value = updated_task
         db_mock.commit = AsyncMock()
+        db_mock.get_bind = MagicMock()
         
         update_data = TaskCreate(title="Updated", description="New desc", completed=True)
         result = await service.update_task(1, update_data)
         
-        db_mock.commit.assert_called_once()
\ No newline at end of file
+        assert result is updated_task
+        db_mock.commit.assert_called_once()
+        db_mock.refresh.assert_not_called()
+        # The UPDATE flipped completed, so the counters move once
+        db_mock.scalar.assert_called_once()
+        db_mock.execute.assert_called_once()
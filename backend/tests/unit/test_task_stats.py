@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy import update
+from app.models import Task, TaskStats, User
+from app.schemas import TaskCreate
+from app.services.task_service import TaskService
+from app.services.task_stats import TaskStatsService, reconcile_task_stats
+
+async def add_users(session, *names: str) -> list[User]:
+    users = [User(email=f"{name}@example.com", username=name) for name in names]
+    session.add_all(users)
+    await session.commit()
+    return users
+
+async def counters(session, user_id: int) -> tuple[int, int]:
+    stats = await TaskStatsService(session).get_stats(user_id)
+    return stats.open, stats.completed
+
+@pytest.mark.unit
+class TestTaskStats:
+    """Unit tests for per-owner task counters"""
+    
+    @pytest.mark.asyncio
+    async def test_writes_keep_counters(self, test_session):
+        """Test creates, bulk creates and completed flips adjust the owner's counters"""
+        [user] = await add_users(test_session, "counted")
+        service = TaskService(test_session)
+        
+        assert await counters(test_session, user.id) == (0, 0)
+        first = await service.create_task(TaskCreate(title="One"), user.id)
+        await service.create_task(TaskCreate(title="Two", completed=True), user.id)
+        await service.create_tasks(
+            [TaskCreate(title=f"Bulk {i}", completed=i == 0) for i in range(3)], user.id
+        )
+        assert await counters(test_session, user.id) == (3, 2)
+        
+        await service.update_task(first.id, TaskCreate(title="One", completed=True))
+        await service.update_task(first.id, TaskCreate(title="One again", completed=True))
+        assert await counters(test_session, user.id) == (2, 3)
+        
+        await service.update_task(first.id, TaskCreate(title="One", completed=False))
+        assert await counters(test_session, user.id) == (3, 2)
+    
+    @pytest.mark.asyncio
+    async def test_get_stats_unknown_user(self, test_session):
+        """Test stats of a missing user are None rather than zeros"""
+        assert await TaskStatsService(test_session).get_stats(999_999) is None
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_reconcile_repairs_drift(self, test_session, test_session_factory):
+        """Test reconciliation fixes bypassed writes and tampered counters, in batches"""
+        kept, bypassed, tampered, idle = await add_users(
+            test_session, "kept", "bypassed", "tampered", "idle"
+        )
+        service = TaskService(test_session)
+        await service.create_task(TaskCreate(title="Kept"), kept.id)
+        await service.create_task(TaskCreate(title="Tampered", completed=True), tampered.id)
+        test_session.add_all(
+            [
+                Task(title="Direct", owner_id=bypassed.id, completed=False),
+                Task(title="Direct done", owner_id=bypassed.id, completed=True),
+            ]
+        )
+        await test_session.execute(
+            update(TaskStats).where(TaskStats.owner_id == tampered.id).values(open_tasks=7)
+        )
+        await test_session.commit()
+        
+        report = await reconcile_task_stats(test_session_factory, batch_size=3)
+        again = await reconcile_task_stats(test_session_factory, batch_size=3)
+        
+        assert (report.owners, report.batches, report.repaired) == (4, 2, 2)
+        assert again.repaired == 0
+        assert await counters(test_session, kept.id) == (1, 0)
+        assert await counters(test_session, bypassed.id) == (1, 1)
+        assert await counters(test_session, tampered.id) == (0, 1)
+        assert await counters(test_session, idle.id) == (0, 0)
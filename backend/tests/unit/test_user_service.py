@@ -27,17 +27,15 @@ class TestUserService:
             hashed_password="hashed_pass"
         )
         
-        async def mock_refresh(obj):
-            obj.id = 1
-        
-        db_mock.refresh = mock_refresh
-        db_mock.add = MagicMock()
+        db_mock.scalar.return_value = new_user
         db_mock.commit = AsyncMock()
         
         result = await service.create_user(user_data)
         
-        db_mock.add.assert_called_once()
+        assert result is new_user
+        db_mock.scalar.assert_called_once()
         db_mock.commit.assert_called_once()
+        db_mock.refresh.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_user_by_email(self):
@@ -78,4 +76,19 @@ class TestUserServiceEdgeCases:
         
         result = await service.get_user(999)
         
-        assert result is None
\ No newline at end of file
+        assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_authenticate_unknown_email_still_verifies(self):
+        """Test an unknown email spends a password check, like a wrong password"""
+        db_mock = AsyncMock()
+        hasher = MagicMock()
+        hasher.verify_dummy = AsyncMock()
+        service = UserService(db_mock, hasher=hasher)
+        
+        result_mock = MagicMock()
+        result_mock.scalars().first.return_value = None
+        db_mock.execute.return_value = result_mock
+        
+        assert await service.authenticate("nobody@example.com", "secret") is None
+        hasher.verify_dummy.assert_awaited_once_with("secret")
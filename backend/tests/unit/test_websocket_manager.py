@@ -0,0 +1,356 @@
+import asyncio
+import json
+import time
+import pytest
+from app.api.websocket.codec import (
+    MSGPACK_SUBPROTOCOL, pack, pack_frame, select_subprotocol, unpack
+)
+from app.api.websocket.pubsub import (
+    BROADCAST_CHANNEL, InMemoryBroker, InMemoryPubSub, user_channel
+)
+from app.api.websocket.tasks import ConnectionManager
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.closed_with = None
+    
+    async def accept(self, subprotocol=None):
+        await asyncio.sleep(0)
+    
+    async def send_text(self, message):
+        if self.fail:
+            raise RuntimeError("connection lost")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(message)
+    
+    async def send_bytes(self, data):
+        await self.send_text(data)
+    
+    async def close(self, code=1000):
+        self.closed_with = code
+
+class FlakyPubSub(InMemoryPubSub):
+    """Fails its first subscribe, like a backplane that is briefly unreachable"""
+    
+    def __init__(self, broker=None):
+        super().__init__(broker)
+        self.failures = 1
+    
+    async def subscribe(self, channel):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("backplane down")
+        await super().subscribe(channel)
+
+async def drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+@pytest.fixture
+async def managers():
+    created = []
+    
+    def make(**kwargs) -> ConnectionManager:
+        created.append(ConnectionManager(**kwargs))
+        return created[-1]
+    
+    yield make
+    for manager in created:
+        await manager.close()
+
+@pytest.mark.unit
+class TestConnectionManager:
+    """Unit tests for WebSocket fan-out"""
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_every_connection(self, managers):
+        """Test broadcast is delivered to all users and connections"""
+        manager = managers()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        await manager.connect(sockets[0], 1)
+        await manager.connect(sockets[1], 1)
+        await manager.connect(sockets[2], 2)
+        
+        assert await manager.broadcast_event({"event": "ping"}) == 3
+        await drain()
+        
+        assert all(ws.sent == ['{"event": "ping"}'] for ws in sockets)
+    
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self, managers):
+        """Test fan-out returns immediately while a slow client is still sending"""
+        manager = managers()
+        slow, fast = FakeWebSocket(delay=10), FakeWebSocket()
+        await manager.connect(slow, 1)
+        await manager.connect(fast, 2)
+        
+        await asyncio.wait_for(manager.broadcast("hello"), timeout=0.1)
+        await drain()
+        
+        assert fast.sent == ["hello"]
+        assert slow.sent == []
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_failing_client_is_removed(self, managers):
+        """Test a send error drops that connection without affecting delivery to others"""
+        manager = managers()
+        dead, alive = FakeWebSocket(fail=True), FakeWebSocket()
+        await manager.connect(dead, 1)
+        await manager.connect(alive, 1)
+        
+        await manager.send_personal_message("one", 1)
+        await drain()
+        await manager.send_personal_message("two", 1)
+        await drain()
+        
+        assert alive.sent == ["one", "two"]
+        assert [c.websocket for c in manager.active_connections[1]] == [alive]
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_prunes_empty_entries(self, managers):
+        """Test the last disconnect for a user removes the user's entry"""
+        manager = managers()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for ws in sockets:
+            await manager.connect(ws, 7)
+        
+        manager.disconnect(sockets[1], 7)
+        assert len(manager.active_connections[7]) == 2
+        manager.disconnect(sockets[0], 7)
+        manager.disconnect(sockets[2], 7)
+        manager.disconnect(sockets[2], 7)
+        
+        assert manager.active_connections == {}
+        assert manager.connection_count() == 0
+        assert len(manager.wheel) == 0
+    
+    @pytest.mark.asyncio
+    async def test_connections_per_user_are_capped(self, managers):
+        """Test handshakes beyond the per-user limit are rejected"""
+        manager = managers(max_connections_per_user=2)
+        sockets = [FakeWebSocket() for _ in range(3)]
+        
+        results = [await manager.connect(ws, 1) for ws in sockets]
+        
+        assert results[2] is None
+        assert sockets[2].closed_with == 1008
+        assert manager.rejected_connections == 1
+        assert await manager.connect(FakeWebSocket(), 2) is not None
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_concurrent_handshakes_respect_cap(self, managers):
+        """Test handshakes accepted at the same time cannot exceed the per-user limit"""
+        manager = managers(max_connections_per_user=2)
+        sockets = [FakeWebSocket() for _ in range(4)]
+        
+        results = await asyncio.gather(*(manager.connect(ws, 1) for ws in sockets))
+        
+        assert sum(result is not None for result in results) == 2
+        assert len(manager.active_connections[1]) == 2
+        assert manager.rejected_connections == 2
+        assert sorted(ws.closed_with or 0 for ws in sockets) == [0, 0, 1008, 1008]
+    
+    @pytest.mark.asyncio
+    async def test_heartbeat_pings_then_evicts_idle(self, managers):
+        """Test live connections are pinged and silent ones closed after the idle timeout"""
+        manager = managers(heartbeat_interval=1.0, idle_timeout=3.0, heartbeat_tick=1.0)
+        silent, chatty = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(silent, 1)
+        chatty_connection = await manager.connect(chatty, 2)
+        start = time.monotonic()
+        
+        for second in range(1, 5):
+            chatty_connection.last_seen = start + second
+            manager.beat(start + second)
+            await drain()
+        
+        assert chatty.sent == ['{"event": "ping"}'] * 4
+        assert silent.sent == ['{"event": "ping"}'] * 2
+        assert silent.closed_with == 1001
+        assert manager.idle_evictions == 1
+        assert 1 not in manager.active_connections
+        assert 2 in manager.active_connections
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy,expected_sent,connected", [
+        ("drop_newest", ["m0", "m1"], True),
+        ("drop_oldest", ["m3", "m4"], True),
+        ("disconnect", [], False),
+    ])
+    async def test_slow_consumer_policies(self, managers, policy, expected_sent, connected):
+        """Test each policy when a client's queue overflows"""
+        manager = managers(max_queue=2, slow_consumer_policy=policy)
+        ws = FakeWebSocket()
+        connection = await manager.connect(ws, 1)
+        connection.writer.cancel()
+        
+        for i in range(5):
+            await manager.send_personal_message(f"m{i}", 1)
+        await drain()
+        
+        queued = []
+        while not connection.queue.empty():
+            queued.append(connection.queue.get_nowait())
+        assert manager.dropped_messages > 0
+        assert (connection in manager.active_connections.get(1, [])) is connected
+        if connected:
+            assert queued == expected_sent
+        else:
+            assert ws.closed_with == 1013
+    
+    @pytest.mark.asyncio
+    async def test_binary_clients_get_batched_msgpack_frames(self, managers):
+        """Test queued events leave as one msgpack array while JSON clients get one frame each"""
+        manager = managers()
+        binary, text = FakeWebSocket(), FakeWebSocket()
+        binary_connection = await manager.connect(binary, 1, MSGPACK_SUBPROTOCOL)
+        await manager.connect(text, 1)
+        
+        for i in range(3):
+            await manager.send_event({"event": "task_updated", "task": {"id": i}}, 1)
+        await drain()
+        
+        assert binary_connection.binary
+        assert [unpack(frame) for frame in binary.sent] == [[
+            {"event": "task_updated", "task": {"id": i}} for i in range(3)
+        ]]
+        assert len(text.sent) == 3
+    
+    @pytest.mark.asyncio
+    async def test_plain_text_reaches_binary_and_text_clients(self, managers):
+        """Test a non-JSON message is sent as a msgpack str without failing the fan-out"""
+        manager = managers()
+        binary, text = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(binary, 1, MSGPACK_SUBPROTOCOL)
+        await manager.connect(text, 2)
+        
+        assert await manager.send_personal_message("hello", 1) == 1
+        assert await manager.broadcast("hello") == 2
+        await drain()
+        
+        assert [unpack(frame) for frame in binary.sent] == [["hello", "hello"]]
+        assert text.sent == ["hello"]
+    
+    def test_unknown_policy_rejected(self):
+        """Test an invalid policy name fails fast"""
+        with pytest.raises(ValueError):
+            ConnectionManager(slow_consumer_policy="ignore")
+
+
+@pytest.mark.unit
+class TestConnectionManagerPubSub:
+    """Unit tests for cross-worker delivery over the pub/sub backplane"""
+    
+    @pytest.mark.asyncio
+    async def test_message_reaches_user_on_another_worker(self, managers):
+        """Test a send on one worker is delivered by the worker holding the connection"""
+        broker = InMemoryBroker()
+        worker_a = managers(pubsub=InMemoryPubSub(broker))
+        worker_b = managers(pubsub=InMemoryPubSub(broker))
+        ws = FakeWebSocket()
+        await worker_b.connect(ws, 1)
+        
+        assert await worker_a.send_personal_message("hello", 1) == 1
+        await drain()
+        
+        assert ws.sent == ["hello"]
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_every_worker(self, managers):
+        """Test broadcast is delivered once to connections on all workers"""
+        broker = InMemoryBroker()
+        workers = [managers(pubsub=InMemoryPubSub(broker)) for _ in range(2)]
+        sockets = [FakeWebSocket(), FakeWebSocket()]
+        await workers[0].connect(sockets[0], 1)
+        await workers[1].connect(sockets[1], 2)
+        
+        await workers[0].broadcast("all")
+        await drain()
+        
+        assert [ws.sent for ws in sockets] == [["all"], ["all"]]
+    
+    @pytest.mark.asyncio
+    async def test_worker_subscribes_only_for_local_users(self, managers):
+        """Test a user's channel is subscribed while connected and dropped after"""
+        broker = InMemoryBroker()
+        worker = managers(pubsub=InMemoryPubSub(broker))
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await worker.connect(first, 1)
+        await worker.connect(second, 1)
+        
+        assert user_channel(2) not in broker.subscribers
+        worker.disconnect(first, 1)
+        await drain()
+        assert user_channel(1) in broker.subscribers
+        
+        worker.disconnect(second, 1)
+        await drain()
+        assert user_channel(1) not in broker.subscribers
+        assert 1 not in worker.active_connections
+        assert await worker.send_personal_message("nobody", 1) == 0
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_reconnect_before_unsubscribe_keeps_channel(self, managers):
+        """Test a quick reconnect is not left without a subscription"""
+        broker = InMemoryBroker()
+        worker = managers(pubsub=InMemoryPubSub(broker))
+        old, new = FakeWebSocket(), FakeWebSocket()
+        await worker.connect(old, 1)
+        
+        worker.disconnect(old, 1)
+        await worker.connect(new, 1)
+        await drain()
+        await worker.send_personal_message("still here", 1)
+        await drain()
+        
+        assert new.sent == ["still here"]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.regression
+    async def test_failed_subscribe_rolls_back_connect(self, managers):
+        """Test a connect whose subscribe fails is unregistered and the next one subscribes"""
+        pubsub = FlakyPubSub()
+        worker = managers(pubsub=pubsub)
+        failed, retried = FakeWebSocket(), FakeWebSocket()
+        
+        with pytest.raises(ConnectionError):
+            await worker.connect(failed, 1)
+        
+        assert failed.closed_with == 1011
+        assert worker.connection_count() == 0
+        assert 1 not in worker.active_connections
+        assert len(worker.wheel) == 0
+        
+        await worker.connect(retried, 1)
+        await worker.broadcast("everyone")
+        await worker.send_personal_message("you", 1)
+        await drain()
+        
+        assert pubsub.channels == {BROADCAST_CHANNEL, user_channel(1)}
+        assert retried.sent == ["everyone", "you"]
+
+@pytest.mark.unit
+class TestCodec:
+    """Unit tests for the binary WebSocket encoding"""
+    
+    @pytest.mark.parametrize("count", [0, 1, 15, 16, 300])
+    def test_pack_frame_is_a_msgpack_array(self, count):
+        """Test frames of every array header size decode to the original events"""
+        events = [{"event": "ping", "n": i} for i in range(count)]
+        
+        frame = pack_frame([pack(json.dumps(event)) for event in events])
+        
+        assert unpack(frame) == events
+    
+    def test_subprotocol_negotiation(self):
+        """Test the msgpack subprotocol is chosen only when offered"""
+        assert select_subprotocol(["chat", MSGPACK_SUBPROTOCOL]) == MSGPACK_SUBPROTOCOL
+        assert select_subprotocol(["chat"]) is None
+        assert select_subprotocol([]) is None